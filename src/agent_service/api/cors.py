@@ -0,0 +1,133 @@
+"""
+Agent Service CORS Middleware
+
+ASGI middleware for the service's allow-everything CORS policy.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Methods accepted in preflight requests (same set Starlette uses for allow_methods=["*"])
+_ALLOWED_METHODS = frozenset(("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT", "QUERY"))
+
+_PREFLIGHT_VARY = (
+    b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+    b"Access-Control-Request-Private-Network"
+)
+
+
+class PermissiveCORSMiddleware:
+    """
+    CORS middleware allowing any origin, method and header, with credentials.
+
+    Equivalent to Starlette's CORSMiddleware configured with
+    allow_origins=["*"], allow_methods=["*"], allow_headers=["*"] and
+    allow_credentials=True: because credentials are allowed, the request
+    Origin is echoed back rather than "*". The request headers are scanned
+    once per request, and only the response start message is rewritten.
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int = 600):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: ASGI application to wrap
+            max_age: Seconds browsers may cache a preflight result
+        """
+        self.app = app
+        # Preflight response headers that do not depend on the request
+        self.preflight_headers = [
+            (b"vary", _PREFLIGHT_VARY),
+            (b"access-control-allow-methods", ", ".join(sorted(_ALLOWED_METHODS)).encode()),
+            (b"access-control-max-age", str(max_age).encode()),
+            (b"access-control-allow-credentials", b"true"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Apply CORS headers to the response, answering preflight requests directly.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = private_network = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                if origin is None:
+                    origin = value
+            elif key == b"access-control-request-method":
+                if request_method is None:
+                    request_method = value
+            elif key == b"access-control-request-headers":
+                if request_headers is None:
+                    request_headers = value
+            elif key == b"access-control-request-private-network":
+                private_network = value
+
+        if origin is not None and request_method is not None and scope["method"] == "OPTIONS":
+            await self.preflight(origin, request_method, request_headers, private_network, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = message.setdefault("headers", [])
+                if not isinstance(headers, list):
+                    headers = message["headers"] = list(headers)
+                add_cors_headers(headers, origin)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def preflight(
+        self, origin: bytes, request_method: bytes, request_headers, private_network, send: Send
+    ) -> None:
+        """Answer a CORS preflight request without calling the application."""
+        headers = [*self.preflight_headers, (b"access-control-allow-origin", origin)]
+        if request_headers is not None:
+            # All headers are allowed, so the requested list is mirrored back
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        failures = []
+        if request_method.decode("latin-1") not in _ALLOWED_METHODS:
+            failures.append("method")
+        if private_network is not None:
+            failures.append("private-network")
+
+        if failures:
+            status, body = 400, ("Disallowed CORS " + ", ".join(failures)).encode()
+        else:
+            status, body = 200, b"OK"
+        headers.append((b"content-length", str(len(body)).encode()))
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def add_cors_headers(headers: list, origin) -> None:
+    """
+    Add the CORS response headers for a non-preflight request.
+
+    Args:
+        headers: Raw ASGI response header list, modified in place
+        origin: Request Origin header value, or None if absent
+    """
+    if origin is not None:
+        headers.append((b"access-control-allow-origin", origin))
+        headers.append((b"access-control-allow-credentials", b"true"))
+    _append_vary_origin(headers)
+
+
+def _append_vary_origin(headers: list) -> None:
+    """Add Origin to the response's Vary header, merging with any existing value."""
+    for i, (key, value) in enumerate(headers):
+        if key.lower() == b"vary":
+            headers[i] = (b"vary", value + b", Origin")
+            return
+    headers.append((b"vary", b"Origin"))
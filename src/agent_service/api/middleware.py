@@ -0,0 +1,76 @@
+"""
+Agent Service HTTP Middleware
+
+Single ASGI layer combining request logging context and CORS handling.
+"""
+
+from functools import partial
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from agent_service.api.cors import PermissiveCORSMiddleware, add_cors_headers
+from agent_service.infrastructure.logging import LoggingMiddleware
+from agent_service.infrastructure.logging.middleware import CONTEXT_HEADERS
+
+
+class CombinedHttpMiddleware(LoggingMiddleware):
+    """
+    LoggingMiddleware and PermissiveCORSMiddleware fused into one layer.
+
+    Behaves like PermissiveCORSMiddleware wrapped around LoggingMiddleware:
+    preflight requests are answered directly (without a logging context),
+    and other requests run in a logging context whose response gets the
+    correlation ID and CORS headers in one header-list update. The request
+    headers are scanned once for both.
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int = 600):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: ASGI application to wrap
+            max_age: Seconds browsers may cache a preflight result
+        """
+        super().__init__(app)
+        self.cors = PermissiveCORSMiddleware(app, max_age=max_age)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Answer preflights or process the request with logging and CORS headers.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        found = {}
+        origin = request_method = request_headers = private_network = None
+        for key, value in scope["headers"]:
+            name = CONTEXT_HEADERS.get(key)
+            if name is not None:
+                if name not in found:
+                    found[name] = value.decode("latin-1")
+            elif key == b"origin":
+                if origin is None:
+                    origin = value
+            elif key == b"access-control-request-method":
+                if request_method is None:
+                    request_method = value
+            elif key == b"access-control-request-headers":
+                if request_headers is None:
+                    request_headers = value
+            elif key == b"access-control-request-private-network":
+                private_network = value
+
+        if origin is not None and request_method is not None and scope["method"] == "OPTIONS":
+            await self.cors.preflight(origin, request_method, request_headers, private_network, send)
+            return
+
+        await self.handle(
+            scope, receive, send, found, decorate_headers=partial(add_cors_headers, origin=origin)
+        )
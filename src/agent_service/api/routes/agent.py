@@ -5,8 +5,12 @@ Provides chat endpoint for AI troubleshooting agent.
 
 import logging
 import os
+from functools import cache
 from typing import Optional, List, Dict, Any
+
+import orjson
 from fastapi import APIRouter, HTTPException, Depends, Header, status
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from fm_core_lib.models import Case
@@ -17,6 +21,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/agent", tags=["agent"])
 
+# Static health body, serialized once at import
+_AGENT_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "agent",
+    "version": "2.0",
+    "engine": "milestone-based"
+})
+
 
 # ============================================================================
 # Request/Response Models
@@ -58,17 +70,25 @@ async def get_case_service_client() -> CaseServiceClient:
     return CaseServiceClient(base_url=case_service_url)
 
 
-async def get_milestone_engine(
-    case_client: CaseServiceClient = Depends(get_case_service_client),
-) -> MilestoneEngine:
-    """Get MilestoneEngine instance with dependencies."""
+@cache
+def get_llm_provider():
+    """Get the process-wide LLM provider.
+
+    Shared across requests so provider HTTP sessions keep their pooled
+    keep-alive connections between chat turns.
+    """
     # Phase 6.2: Multi-provider with automatic fallback
     # Tries: OpenAI → Anthropic → Fireworks (based on available API keys)
     from agent_service.infrastructure.llm.multi_provider import MultiProviderLLM
-    llm_provider = MultiProviderLLM()
+    return MultiProviderLLM()
+
 
+async def get_milestone_engine(
+    case_client: CaseServiceClient = Depends(get_case_service_client),
+) -> MilestoneEngine:
+    """Get MilestoneEngine instance with dependencies."""
     return MilestoneEngine(
-        llm_provider=llm_provider,
+        llm_provider=get_llm_provider(),
         case_service_client=case_client,
         trace_enabled=True
     )
@@ -174,12 +194,7 @@ async def agent_chat(
         )
 
 
-@router.get("/health")
+@router.get("/health", response_class=Response)
 async def agent_health():
     """Agent service health check."""
-    return {
-        "status": "healthy",
-        "service": "agent",
-        "version": "2.0",
-        "engine": "milestone-based"
-    }
+    return Response(content=_AGENT_HEALTH_BODY, media_type="application/json")
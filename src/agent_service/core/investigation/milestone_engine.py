@@ -80,6 +80,23 @@ class ILLMProvider(Protocol):
 logger = logging.getLogger(__name__)
 
 
+# Milestone progress block for INVESTIGATING prompts (filled via str.format)
+_MILESTONES_STATUS_TEMPLATE = """
+Milestones Completed:
+- Symptom Verified: {symptom_verified}
+- Scope Assessed: {scope_assessed}
+- Timeline Established: {timeline_established}
+- Changes Identified: {changes_identified}
+- Root Cause Identified: {root_cause_identified} (confidence: {root_cause_confidence:.2f})
+- Solution Proposed: {solution_proposed}
+- Solution Applied: {solution_applied}
+- Solution Verified: {solution_verified}
+
+Current Stage: {current_stage}
+Progress: {completed_count}/8 milestones complete
+"""
+
+
 # =============================================================================
 # Milestone Engine - Main Implementation
 # =============================================================================
@@ -335,36 +352,43 @@ If the user confirms it and wants to investigate, let them know you're ready to
 
         # Build milestone status
         progress = case.progress
-        milestones_status = f"""
-Milestones Completed:
-- Symptom Verified: {progress.symptom_verified}
-- Scope Assessed: {progress.scope_assessed}
-- Timeline Established: {progress.timeline_established}
-- Changes Identified: {progress.changes_identified}
-- Root Cause Identified: {progress.root_cause_identified} (confidence: {progress.root_cause_confidence:.2f})
-- Solution Proposed: {progress.solution_proposed}
-- Solution Applied: {progress.solution_applied}
-- Solution Verified: {progress.solution_verified}
-
-Current Stage: {progress.current_stage}
-Progress: {len(progress.completed_milestones)}/8 milestones complete
-"""
+        milestones_status = _MILESTONES_STATUS_TEMPLATE.format(
+            symptom_verified=progress.symptom_verified,
+            scope_assessed=progress.scope_assessed,
+            timeline_established=progress.timeline_established,
+            changes_identified=progress.changes_identified,
+            root_cause_identified=progress.root_cause_identified,
+            root_cause_confidence=progress.root_cause_confidence,
+            solution_proposed=progress.solution_proposed,
+            solution_applied=progress.solution_applied,
+            solution_verified=progress.solution_verified,
+            current_stage=progress.current_stage,
+            completed_count=len(progress.completed_milestones),
+        )
 
         # Build evidence summary
         evidence_summary = ""
         if case.evidence:
-            evidence_summary = f"\nEvidence Collected ({len(case.evidence)} items):\n"
-            for ev in case.evidence[-5:]:  # Last 5 evidence items
-                evidence_summary += f"- [{ev.category.value}] {ev.summary}\n"
+            evidence_lines = [f"\nEvidence Collected ({len(case.evidence)} items):"]
+            evidence_lines.extend(
+                f"- [{ev.category.value}] {ev.summary}"
+                for ev in case.evidence[-5:]  # Last 5 evidence items
+            )
+            evidence_lines.append("")
+            evidence_summary = "\n".join(evidence_lines)
 
         # Build hypothesis summary
         hypothesis_summary = ""
         if case.hypotheses:
             active = [h for h in case.hypotheses.values() if h.status == HypothesisStatus.ACTIVE]
             if active:
-                hypothesis_summary = f"\nActive Hypotheses ({len(active)}):\n"
-                for h in active[:3]:  # Top 3 hypotheses
-                    hypothesis_summary += f"- {h.statement} (likelihood: {h.likelihood:.2f})\n"
+                hypothesis_lines = [f"\nActive Hypotheses ({len(active)}):"]
+                hypothesis_lines.extend(
+                    f"- {h.statement} (likelihood: {h.likelihood:.2f})"
+                    for h in active[:3]  # Top 3 hypotheses
+                )
+                hypothesis_lines.append("")
+                hypothesis_summary = "\n".join(hypothesis_lines)
 
         # Build attachments note
         attachments_note = ""
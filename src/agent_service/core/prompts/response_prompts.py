@@ -7,12 +7,18 @@ These prompts work alongside the base system prompts to provide specific guidanc
 for different response scenarios.
 """
 
-from typing import Dict, Any, Optional
+import logging
+from typing import Dict, Any, Optional, Set
 from agent_service.models_compat import ResponseType
 
 # Temporary: get_settings not available in microservices, use env vars directly
 import os
 
+logger = logging.getLogger(__name__)
+
+# Identities of base prompts already reported as oversized (warn once per prompt)
+_WARNED_PROMPTS: Set[int] = set()
+
 
 # Response-type-specific prompt templates
 RESPONSE_TYPE_PROMPTS = {
@@ -36,6 +42,16 @@ RESPONSE_TYPE_PROMPTS = {
 }
 
 
+# Intent-specific overrides for ANSWER responses (non-troubleshooting intents)
+_INTENT_SPECIFIC_PROMPTS: Dict[str, str] = {
+    "GREETING": "Respond warmly to the greeting. Briefly introduce yourself as FaultMaven, an AI troubleshooting assistant. Keep it friendly and concise (2-3 sentences maximum). DO NOT ask technical questions or launch into methodology yet - just acknowledge the greeting warmly.",
+    "GRATITUDE": "Acknowledge thanks warmly. Offer continued support. Ask if anything else is needed. Keep it brief and friendly.",
+    "OFF_TOPIC": "Politely redirect to technical troubleshooting. Mention your capabilities: troubleshooting, root cause analysis, config issues, performance problems, and incident response. Ask what technical issue you can help with.",
+    "META_FAULTMAVEN": "Explain you're an AI troubleshooting assistant using 5-phase SRE methodology. You can analyze logs, perform RCA, and propose solutions, but cannot access systems directly or make changes. Ask what they need help with.",
+    "CONVERSATION_CONTROL": "Acknowledge the conversation control request appropriately. For 'reset': ask what to help with. For 'go back': recap previous topic. For 'skip': ask what's next.",
+}
+
+
 # Note: Boundary response prompts removed - all special case handling now unified
 # under ResponseType.ANSWER with context-aware behavior based on query intent
 
@@ -95,16 +111,16 @@ def assemble_intelligent_prompt(
     if not isinstance(response_type, ResponseType):
         raise ValueError(f"response_type must be ResponseType enum, got {type(response_type)}")
 
-    # Validation: Warn if prompt is very long (may exceed context limits)
-    import logging
-    logger = logging.getLogger(__name__)
-
-    base_length = len(base_system_prompt)
-    if base_length > 2000:  # Characters, roughly 500 tokens
+    # Validation: Warn once per distinct prompt if very long (may exceed context limits)
+    prompt_id = id(base_system_prompt)
+    if prompt_id not in _WARNED_PROMPTS and len(base_system_prompt) > 2000:
+        # Characters, roughly 500 tokens
+        base_length = len(base_system_prompt)
         logger.warning(
             f"Base system prompt is very long ({base_length} chars, ~{base_length//4} tokens). "
             "Consider using a tiered prompt."
         )
+        _WARNED_PROMPTS.add(prompt_id)
 
     prompt_parts = []
 
@@ -115,17 +131,11 @@ def assemble_intelligent_prompt(
     # For ANSWER responses with special intents, override with intent-specific prompt
     if response_type == ResponseType.ANSWER and query_classification:
         intent = query_classification.get("intent", "").upper()
-        intent_specific_prompts = {
-            "GREETING": "Respond warmly to the greeting. Briefly introduce yourself as FaultMaven, an AI troubleshooting assistant. Keep it friendly and concise (2-3 sentences maximum). DO NOT ask technical questions or launch into methodology yet - just acknowledge the greeting warmly.",
-            "GRATITUDE": "Acknowledge thanks warmly. Offer continued support. Ask if anything else is needed. Keep it brief and friendly.",
-            "OFF_TOPIC": "Politely redirect to technical troubleshooting. Mention your capabilities: troubleshooting, root cause analysis, config issues, performance problems, and incident response. Ask what technical issue you can help with.",
-            "META_FAULTMAVEN": "Explain you're an AI troubleshooting assistant using 5-phase SRE methodology. You can analyze logs, perform RCA, and propose solutions, but cannot access systems directly or make changes. Ask what they need help with.",
-            "CONVERSATION_CONTROL": "Acknowledge the conversation control request appropriately. For 'reset': ask what to help with. For 'go back': recap previous topic. For 'skip': ask what's next."
-        }
-
-        if intent in intent_specific_prompts:
+        intent_prompt = _INTENT_SPECIFIC_PROMPTS.get(intent)
+
+        if intent_prompt is not None:
             # Use intent-specific prompt instead of generic ANSWER prompt
-            prompt_parts.append(intent_specific_prompts[intent])
+            prompt_parts.append(intent_prompt)
         else:
             # Use standard ANSWER prompt for other intents
             response_prompt = get_response_type_prompt(response_type)
@@ -5,7 +5,10 @@ This module contains comprehensive system prompts that define FaultMaven's ident
 methodology, and troubleshooting approach following the five-phase SRE doctrine.
 """
 
-from typing import Dict
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
 # Neutral Identity (for non-troubleshooting interactions - 10 tokens)
 NEUTRAL_IDENTITY = """You are FaultMaven, an AI assistant."""
@@ -27,21 +30,21 @@ DETAILED_METHODOLOGY = """For complex troubleshooting, follow 5 phases:
 # Tiered System Prompts - Conditional Loading
 
 # Tier 0: Minimal (for ANSWER responses - 30 tokens)
-MINIMAL_PROMPT = CORE_IDENTITY
+MINIMAL_PROMPT = sys.intern(CORE_IDENTITY)
 
 # Tier 1: Brief (for simple troubleshooting - 90 tokens)
-BRIEF_PROMPT = CORE_IDENTITY + "\n\n" + BRIEF_METHODOLOGY
+BRIEF_PROMPT = sys.intern(CORE_IDENTITY + "\n\n" + BRIEF_METHODOLOGY)
 
 # Tier 2: Standard (for moderate troubleshooting - 210 tokens)
-STANDARD_PROMPT = CORE_IDENTITY + "\n\n" + DETAILED_METHODOLOGY
+STANDARD_PROMPT = sys.intern(CORE_IDENTITY + "\n\n" + DETAILED_METHODOLOGY)
 
 # PRIMARY_SYSTEM_PROMPT - default (Tier 2 for backward compatibility)
 PRIMARY_SYSTEM_PROMPT = STANDARD_PROMPT
 CONCISE_SYSTEM_PROMPT = BRIEF_PROMPT  # Tier 1
 
 
-# Prompt variants registry
-SYSTEM_PROMPT_VARIANTS: Dict[str, str] = {
+# Prompt variants registry (read-only; values are the interned tier strings)
+SYSTEM_PROMPT_VARIANTS: Mapping[str, str] = MappingProxyType({
     "default": PRIMARY_SYSTEM_PROMPT,
     "primary": PRIMARY_SYSTEM_PROMPT,
     "concise": CONCISE_SYSTEM_PROMPT,
@@ -50,9 +53,24 @@ SYSTEM_PROMPT_VARIANTS: Dict[str, str] = {
     "minimal": MINIMAL_PROMPT,
     "brief": BRIEF_PROMPT,
     "standard": STANDARD_PROMPT,
-}
+})
 
+# Variant auto-selected for each user expertise level when variant == "default"
+_EXPERTISE_VARIANTS: Mapping[str, str] = MappingProxyType({
+    "beginner": "detailed",
+    "intermediate": "primary",
+    "advanced": "concise",
+})
 
+
+# Intents that get the neutral identity instead of an SRE troubleshooting prompt
+_NON_TROUBLESHOOTING_INTENTS = frozenset({
+    "GREETING", "GRATITUDE", "OFF_TOPIC",
+    "META_FAULTMAVEN", "CONVERSATION_CONTROL",
+})
+
+
+@lru_cache(maxsize=64)
 def get_system_prompt(variant: str = "default", user_expertise: str = "intermediate") -> str:
     """Get system prompt based on variant and user expertise level
 
@@ -79,12 +97,7 @@ def get_system_prompt(variant: str = "default", user_expertise: str = "intermedi
     """
     # Auto-select variant based on expertise if using default
     if variant == "default":
-        if user_expertise == "beginner":
-            variant = "detailed"
-        elif user_expertise == "advanced":
-            variant = "concise"
-        else:  # intermediate
-            variant = "primary"
+        variant = _EXPERTISE_VARIANTS.get(user_expertise, "primary")
 
     return SYSTEM_PROMPT_VARIANTS.get(variant, PRIMARY_SYSTEM_PROMPT)
 
@@ -113,6 +126,7 @@ def get_system_prompt_with_context(
     return base_prompt
 
 
+@lru_cache(maxsize=128)
 def get_tiered_prompt(
     response_type: str = "ANSWER",
     complexity: str = "simple",
@@ -143,16 +157,11 @@ def get_tiered_prompt(
         'You are FaultMaven...For troubleshooting...'  # BRIEF_PROMPT (90 tokens)
     """
     # Neutral identity for non-troubleshooting intents
-    NON_TROUBLESHOOTING_INTENTS = [
-        "GREETING", "GRATITUDE", "OFF_TOPIC",
-        "META_FAULTMAVEN", "CONVERSATION_CONTROL"
-    ]
-
-    if intent and intent.upper() in NON_TROUBLESHOOTING_INTENTS:
+    if intent and intent.upper() in _NON_TROUBLESHOOTING_INTENTS:
         return NEUTRAL_IDENTITY
 
     # Minimal prompt for information/explanation requests
-    if response_type in ["ANSWER", "INFO", "EXPLANATION"]:
+    if response_type in ("ANSWER", "INFO", "EXPLANATION"):
         return MINIMAL_PROMPT
 
     # Brief prompt for simple troubleshooting
@@ -4,18 +4,48 @@ Copied from monolith: faultmaven/infrastructure/llm/providers/anthropic.py
 Implements Claude API integration for high-quality reasoning tasks.
 """
 
-import json
+import re
 import time
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-import aiohttp
+import orjson
 
 from .base import BaseLLMProvider, LLMResponse, ProviderConfig
 
+# Refusal / inability-to-answer indicators, scanned in a single case-insensitive pass
+_REFUSAL_RE = re.compile(
+    "|".join(map(re.escape, (
+        "i cannot", "i can't", "i'm not able", "i don't have",
+        "i'm sorry", "i apologize",
+    ))),
+    re.IGNORECASE,
+)
+
+# Anthropic models have different confidence characteristics (first match wins)
+_ANTHROPIC_MODEL_SCORES = (
+    ("claude-3-5-sonnet", 0.95),
+    ("claude-3-opus", 0.95),
+    ("claude-3-sonnet", 0.90),
+    ("claude-3-haiku", 0.85),
+)
+
+# Refusals appear at the start of a completion; scanning past this is wasted work
+_SCAN_HEAD_CHARS = 2048
+
 
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude LLM provider implementation"""
 
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self._url = f"{self._base_url}/messages"
+        # Request headers are identical for every call
+        self._headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.config.api_key,
+            "anthropic-version": "2023-06-01"
+        }
+
     @property
     def provider_name(self) -> str:
         return "anthropic"
@@ -48,13 +78,6 @@ class AnthropicProvider(BaseLLMProvider):
         if not selected_model:
             selected_model = "claude-3-5-sonnet-20241022"
 
-        # Prepare headers for Anthropic API
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self.config.api_key,
-            "anthropic-version": "2023-06-01"
-        }
-
         # Prepare request body for Anthropic API format
         request_body = {
             "model": selected_model,
@@ -70,41 +93,45 @@ class AnthropicProvider(BaseLLMProvider):
 
         # Add any additional parameters
         if "system" in kwargs:
-            request_body["system"] = kwargs["system"]
+            if self.config.enable_prompt_cache:
+                request_body["system"] = self._system_cache_block(kwargs["system"])
+            else:
+                request_body["system"] = kwargs["system"]
 
         if "stop_sequences" in kwargs:
             request_body["stop_sequences"] = kwargs["stop_sequences"]
 
         # Make API request
-        url = f"{self.config.base_url.rstrip('/')}/messages"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                headers=headers,
-                json=request_body,
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-            ) as response:
-
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"Anthropic API request failed: {response.status} - {error_text}"
-                    )
-
-                response_data = await response.json()
+        session = await self._get_session()
+        async with session.post(
+            self._url,
+            headers=self._headers,
+            data=orjson.dumps(request_body),
+            timeout=self._timeout
+        ) as response:
+
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(
+                    f"Anthropic API request failed: {response.status} - {error_text}"
+                )
+
+            response_data = orjson.loads(await response.read())
 
         # Extract content from Anthropic response format
-        content = ""
-        if "content" in response_data and response_data["content"]:
-            # Anthropic returns content as a list of blocks
-            for block in response_data["content"]:
-                if block.get("type") == "text":
-                    content += block.get("text", "")
+        # Anthropic returns content as a list of blocks
+        content = "".join(
+            block.get("text", "")
+            for block in response_data.get("content") or ()
+            if block.get("type") == "text"
+        )
 
         # Calculate metrics
         response_time_ms = int((time.time() - start_time) * 1000)
-        tokens_used = response_data.get("usage", {}).get("output_tokens", 0)
+        usage = response_data.get("usage", {})
+        tokens_used = usage.get("output_tokens", 0)
+        cache_read_tokens = usage.get("cache_read_input_tokens", 0) or 0
+        cache_creation_tokens = usage.get("cache_creation_input_tokens", 0) or 0
 
         # Calculate confidence based on model and response quality
         confidence = self._calculate_confidence(selected_model, content, response_data)
@@ -116,27 +143,98 @@ class AnthropicProvider(BaseLLMProvider):
             model=selected_model,
             tokens_used=tokens_used,
             response_time_ms=response_time_ms,
-            cached=False
+            cached=False,
+            cache_read_tokens=cache_read_tokens,
+            cache_creation_tokens=cache_creation_tokens,
         )
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream text deltas from the Anthropic API as they arrive
+
+        Yields each ``text_delta`` from the server-sent event stream so the
+        caller can start rendering while the model is still decoding.
+        """
+        selected_model = model or self.config.default_model or "claude-3-5-sonnet-20241022"
+
+        request_body = {
+            "model": selected_model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+
+        if "system" in kwargs:
+            if self.config.enable_prompt_cache:
+                request_body["system"] = self._system_cache_block(kwargs["system"])
+            else:
+                request_body["system"] = kwargs["system"]
+
+        if "stop_sequences" in kwargs:
+            request_body["stop_sequences"] = kwargs["stop_sequences"]
+
+        session = await self._get_session()
+        async with session.post(
+            self._url,
+            headers=self._headers,
+            data=orjson.dumps(request_body),
+            timeout=self._timeout
+        ) as response:
+
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(
+                    f"Anthropic API request failed: {response.status} - {error_text}"
+                )
+
+            async for line in response.content:
+                if not line.startswith(b"data:"):
+                    continue
+                event = orjson.loads(line[5:])
+                if event.get("type") == "content_block_delta":
+                    delta = event.get("delta", {})
+                    if delta.get("type") == "text_delta":
+                        yield delta.get("text", "")
+                elif event.get("type") == "error":
+                    raise Exception(f"Anthropic stream error: {event.get('error')}")
+
+    @staticmethod
+    def _system_cache_block(system: str) -> list:
+        """Wrap the system prompt as a text block with an ephemeral cache breakpoint
+
+        The static system prompt is identical across turns, so marking it
+        cacheable lets Anthropic bill repeat reads at the cached-input rate.
+        """
+        return [
+            {
+                "type": "text",
+                "text": system,
+                "cache_control": {"type": "ephemeral"}
+            }
+        ]
+
     def _calculate_confidence(self, model: str, content: str, response_data: dict) -> float:
         """Calculate confidence score for Anthropic response"""
         base_confidence = self.config.confidence_score
 
-        # Anthropic models have different confidence characteristics
-        model_confidence_map = {
-            "claude-3-5-sonnet": 0.95,
-            "claude-3-opus": 0.95,
-            "claude-3-sonnet": 0.90,
-            "claude-3-haiku": 0.85,
-        }
-
         # Find matching model confidence
-        model_confidence = base_confidence
-        for model_name, confidence in model_confidence_map.items():
-            if model_name in model.lower():
-                model_confidence = confidence
-                break
+        model_lower = model.lower()
+        model_confidence = next(
+            (score for name, score in _ANTHROPIC_MODEL_SCORES if name in model_lower),
+            base_confidence,
+        )
 
         # Adjust based on content quality
         content_length = len(content.strip())
@@ -148,17 +246,10 @@ class AnthropicProvider(BaseLLMProvider):
         elif content_length > 500:
             model_confidence *= 1.05
 
-        # Check for refusal or inability to answer
-        refusal_indicators = [
-            "i cannot", "i can't", "i'm not able", "i don't have",
-            "i'm sorry", "i apologize", "i cannot provide"
-        ]
-
-        content_lower = content.lower()
-        for indicator in refusal_indicators:
-            if indicator in content_lower:
-                model_confidence *= 0.6
-                break
+        # Check for refusal or inability to answer (refusals lead the response,
+        # so only a bounded head is scanned)
+        if _REFUSAL_RE.search(content[:_SCAN_HEAD_CHARS].casefold()):
+            model_confidence *= 0.6
 
         # Ensure confidence is within valid range
         return min(1.0, max(0.0, model_confidence))
@@ -3,11 +3,17 @@
 Copied from monolith: faultmaven/infrastructure/llm/providers/base.py
 """
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+import aiohttp
+
+# Rough characters-per-token ratio used for token estimates
+CHARS_PER_TOKEN = 4
+
 
 @dataclass
 class ToolCall:
@@ -17,9 +23,9 @@ class ToolCall:
     function: Dict[str, Any]  # {"name": "...", "arguments": "..."}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMResponse:
-    """Response from LLM provider"""
+    """Response from LLM provider (immutable; derive variants with dataclasses.replace)"""
     content: str
     confidence: float
     provider: str
@@ -28,6 +34,44 @@ class LLMResponse:
     response_time_ms: int
     cached: bool = False
     tool_calls: Optional[List[ToolCall]] = None
+    cache_read_tokens: int = 0  # Input tokens served from provider prompt cache
+    cache_creation_tokens: int = 0  # Input tokens written to provider prompt cache
+
+
+class SharedHTTPSession:
+    """Lazily created aiohttp session that several providers can share
+
+    One pooled session keeps connections alive between calls so requests
+    skip DNS, TCP and TLS setup after the first one. Sharing it across
+    providers puts every outbound LLM call behind a single connection limit.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 32):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Return the session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            async with self._lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            limit=self.limit,
+                            limit_per_host=self.limit_per_host,
+                            ttl_dns_cache=300,
+                            keepalive_timeout=60,
+                        )
+                    )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the session (call on shutdown)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
 
 @dataclass
@@ -41,6 +85,9 @@ class ProviderConfig:
     timeout: int = 30
     default_model: Optional[str] = None
     confidence_score: float = 0.8
+    enable_prompt_cache: bool = True
+    max_input_tokens: Optional[int] = None  # Trim prompts above this estimated size
+    http_session: Optional[SharedHTTPSession] = None  # Shared pool; provider owns one if unset
 
     def __post_init__(self):
         if self.models is None:
@@ -55,6 +102,15 @@ class BaseLLMProvider(ABC):
     def __init__(self, config: ProviderConfig):
         self.config = config
         self.start_time = None
+        self._base_url = (config.base_url or "").rstrip("/")
+        # config.timeout is fixed for the provider's lifetime, so build the timeout once
+        self._timeout = aiohttp.ClientTimeout(
+            total=config.timeout,
+            connect=5,
+            sock_read=config.timeout,
+        )
+        self._owns_http_session = config.http_session is None
+        self._http = config.http_session or SharedHTTPSession()
 
     @property
     @abstractmethod
@@ -86,6 +142,62 @@ class BaseLLMProvider(ABC):
         """Get list of models supported by this provider"""
         pass
 
+    async def generate_trimmed(self, prompt: str, **kwargs) -> LLMResponse:
+        """Generate a response after fitting the prompt into max_input_tokens
+
+        Args:
+            prompt: Input text prompt
+            **kwargs: Arguments forwarded to generate() (model, max_tokens, ...)
+
+        Returns:
+            LLMResponse from generate()
+        """
+        if self.config.max_input_tokens:
+            prompt = self._trim_prompt(prompt, self.config.max_input_tokens)
+        return await self.generate(prompt=prompt, **kwargs)
+
+    @staticmethod
+    def _trim_prompt(prompt: str, budget: int) -> str:
+        """Fit a prompt into an input token budget, dropping the oldest context first
+
+        Sections are separated by blank lines; whole leading sections are
+        dropped until the rest fits, so the most recent context survives.
+        Uses the same ~4 chars/token estimate as the providers.
+
+        Args:
+            prompt: Input text prompt
+            budget: Maximum input tokens
+
+        Returns:
+            The prompt, trimmed to roughly ``budget`` tokens
+        """
+        max_chars = budget * CHARS_PER_TOKEN
+        if len(prompt) <= max_chars:
+            return prompt
+
+        sections = prompt.split("\n\n")
+        kept = []
+        used = 0
+        for section in reversed(sections):
+            cost = len(section) + 2
+            if kept and used + cost > max_chars:
+                break
+            kept.append(section)
+            used += cost
+
+        trimmed = "\n\n".join(reversed(kept))
+        # A single oversized section is cut to its most recent tail
+        return trimmed[-max_chars:]
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session, creating it on first use"""
+        return await self._http.get()
+
+    async def aclose(self) -> None:
+        """Close the HTTP session if this provider owns it (call on shutdown)"""
+        if self._owns_http_session:
+            await self._http.aclose()
+
     def _start_timing(self):
         """Start timing for response measurement"""
         self.start_time = time.time()
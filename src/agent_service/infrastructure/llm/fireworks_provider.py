@@ -4,10 +4,10 @@ Copied from monolith: faultmaven/infrastructure/llm/providers/fireworks_provider
 Implements Fireworks AI for high-performance inference with open-source models.
 """
 
-import aiohttp
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from .base import BaseLLMProvider, LLMResponse, ProviderConfig, ToolCall
+from .openai_compat import stream_chat_completions
 
 
 class FireworksProvider(BaseLLMProvider):
@@ -69,54 +69,67 @@ class FireworksProvider(BaseLLMProvider):
         payload.update(kwargs)
 
         # Make request
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.config.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-            ) as response:
-
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"Fireworks API error {response.status}: {error_text}"
-                    )
-
-                data = await response.json()
-
-                # Extract response content
-                if not data.get("choices") or len(data["choices"]) == 0:
-                    raise Exception("Fireworks API returned no choices")
-
-                message = data["choices"][0]["message"]
-                content = message.get("content") or ""
-                content = self._validate_response_content(content) if content else ""
-
-                # Extract tool calls if present
-                tool_calls = None
-                if message.get("tool_calls"):
-                    tool_calls = [
-                        ToolCall(
-                            id=tc["id"],
-                            type=tc["type"],
-                            function=tc["function"]
-                        )
-                        for tc in message["tool_calls"]
-                    ]
-
-                # Extract token usage
-                usage = data.get("usage", {})
-                tokens_used = usage.get("total_tokens", 0)
-
-                response_time = self._get_response_time_ms()
-
-                return LLMResponse(
-                    content=content,
-                    confidence=self.config.confidence_score,
-                    provider=self.provider_name,
-                    model=effective_model,
-                    tokens_used=tokens_used,
-                    response_time_ms=response_time,
-                    tool_calls=tool_calls
+        session = await self._get_session()
+        async with session.post(
+            f"{self.config.base_url}/chat/completions",
+            headers=headers,
+            json=payload,
+            timeout=self._timeout,
+        ) as response:
+
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(
+                    f"Fireworks API error {response.status}: {error_text}"
                 )
+
+            data = await response.json()
+
+            # Extract response content
+            if not data.get("choices") or len(data["choices"]) == 0:
+                raise Exception("Fireworks API returned no choices")
+
+            message = data["choices"][0]["message"]
+            content = message.get("content") or ""
+            content = self._validate_response_content(content) if content else ""
+
+            # Extract tool calls if present
+            tool_calls = None
+            if message.get("tool_calls"):
+                tool_calls = [
+                    ToolCall(
+                        id=tc["id"],
+                        type=tc["type"],
+                        function=tc["function"]
+                    )
+                    for tc in message["tool_calls"]
+                ]
+
+            # Extract token usage
+            usage = data.get("usage", {})
+            tokens_used = usage.get("total_tokens", 0)
+
+            response_time = self._get_response_time_ms()
+
+            return LLMResponse(
+                content=content,
+                confidence=self.config.confidence_score,
+                provider=self.provider_name,
+                model=effective_model,
+                tokens_used=tokens_used,
+                response_time_ms=response_time,
+                tool_calls=tool_calls
+            )
+
+    def generate_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream content deltas from the Fireworks chat completions endpoint"""
+        return stream_chat_completions(
+            self, "Fireworks", prompt, model, max_tokens, temperature, **kwargs
+        )
@@ -3,15 +3,30 @@
 Google Gemini API with multi-modal capabilities.
 """
 
-import aiohttp
-from typing import List, Optional, Dict, Any
+import orjson
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 
 from .base import BaseLLMProvider, LLMResponse, ProviderConfig
 
+# Gemini authenticates via the key query parameter, so headers never vary
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Safety settings for troubleshooting use case (identical for every request)
+_GEMINI_SAFETY_SETTINGS = (
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+)
+
 
 class GeminiProvider(BaseLLMProvider):
     """Google Gemini LLM provider implementation"""
 
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self._urls: Dict[Tuple[str, str], str] = {}
+
     @property
     def provider_name(self) -> str:
         return "gemini"
@@ -28,6 +43,13 @@ class GeminiProvider(BaseLLMProvider):
         """Get list of supported models"""
         return self.config.models.copy()
 
+    def _url_for(self, model: str, method: str) -> str:
+        """Endpoint URL for a model method, memoized per (model, method)"""
+        url = self._urls.get((model, method))
+        if url is None:
+            url = self._urls[(model, method)] = f"{self._base_url}/models/{model}:{method}"
+        return url
+
     async def generate(
         self,
         prompt: str,
@@ -68,73 +90,125 @@ class GeminiProvider(BaseLLMProvider):
                 }
             ],
             "generationConfig": generation_config,
-            # Safety settings for troubleshooting use case
-            "safetySettings": [
-                {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"}
-            ]
+            "safetySettings": _GEMINI_SAFETY_SETTINGS,
         }
 
         # Gemini API uses query parameter for API key
-        url = f"{self.config.base_url.rstrip('/')}/models/{effective_model}:generateContent"
+        url = self._url_for(effective_model, "generateContent")
         params = {"key": self.config.api_key}
-        headers = {"Content-Type": "application/json"}
 
         # Make request
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                params=params,
-                headers=headers,
-                json=request_body,
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-            ) as response:
-
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"Gemini API error {response.status}: {error_text}"
+        session = await self._get_session()
+        async with session.post(
+            url,
+            params=params,
+            headers=_JSON_HEADERS,
+            data=orjson.dumps(request_body),
+            timeout=self._timeout,
+        ) as response:
+
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(
+                    f"Gemini API error {response.status}: {error_text}"
+                )
+
+            data = orjson.loads(await response.read())
+
+            # Extract response content from Gemini format
+            content = ""
+            tokens_used = 0
+
+            if "candidates" in data and data["candidates"]:
+                candidate = data["candidates"][0]
+
+                if "content" in candidate and "parts" in candidate["content"]:
+                    content = "".join(
+                        part["text"] for part in candidate["content"]["parts"] if "text" in part
                     )
 
-                data = await response.json()
-
-                # Extract response content from Gemini format
-                content = ""
-                tokens_used = 0
-
-                if "candidates" in data and data["candidates"]:
-                    candidate = data["candidates"][0]
-
-                    if "content" in candidate and "parts" in candidate["content"]:
-                        for part in candidate["content"]["parts"]:
-                            if "text" in part:
-                                content += part["text"]
-
-                    # Extract token usage
-                    if "usageMetadata" in data:
-                        tokens_used = data["usageMetadata"].get("totalTokenCount", 0)
-
-                # Handle safety blocks
-                if not content and "candidates" in data:
-                    candidate = data["candidates"][0]
-                    if "finishReason" in candidate:
-                        finish_reason = candidate["finishReason"]
-                        if finish_reason in ["SAFETY", "BLOCKED_REASON_UNSPECIFIED"]:
-                            raise Exception("Content blocked by Gemini safety filters")
-
-                if content:
-                    content = self._validate_response_content(content)
-
-                response_time = self._get_response_time_ms()
-
-                return LLMResponse(
-                    content=content,
-                    confidence=self.config.confidence_score,
-                    provider=self.provider_name,
-                    model=effective_model,
-                    tokens_used=tokens_used,
-                    response_time_ms=response_time,
-                    tool_calls=None,  # Gemini function calling uses different format
+                # Extract token usage
+                if "usageMetadata" in data:
+                    tokens_used = data["usageMetadata"].get("totalTokenCount", 0)
+
+            # Handle safety blocks
+            if not content and "candidates" in data:
+                candidate = data["candidates"][0]
+                if "finishReason" in candidate:
+                    finish_reason = candidate["finishReason"]
+                    if finish_reason in ["SAFETY", "BLOCKED_REASON_UNSPECIFIED"]:
+                        raise Exception("Content blocked by Gemini safety filters")
+
+            if content:
+                content = self._validate_response_content(content)
+
+            response_time = self._get_response_time_ms()
+
+            return LLMResponse(
+                content=content,
+                confidence=self.config.confidence_score,
+                provider=self.provider_name,
+                model=effective_model,
+                tokens_used=tokens_used,
+                response_time_ms=response_time,
+                tool_calls=None,  # Gemini function calling uses different format
+            )
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream text chunks from Gemini's streamGenerateContent endpoint
+
+        Uses ``alt=sse`` so each candidate chunk arrives as a ``data:`` line and
+        can be yielded to the caller before the full response is decoded.
+        """
+        effective_model = self.get_effective_model(model)
+
+        generation_config = {
+            "temperature": temperature,
+            "maxOutputTokens": max_tokens,
+        }
+        if "top_p" in kwargs:
+            generation_config["topP"] = kwargs["top_p"]
+        if "top_k" in kwargs:
+            generation_config["topK"] = kwargs["top_k"]
+
+        request_body = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": generation_config,
+            "safetySettings": _GEMINI_SAFETY_SETTINGS,
+        }
+
+        url = self._url_for(effective_model, "streamGenerateContent")
+        params = {"key": self.config.api_key, "alt": "sse"}
+
+        session = await self._get_session()
+        async with session.post(
+            url,
+            params=params,
+            headers=_JSON_HEADERS,
+            data=orjson.dumps(request_body),
+            timeout=self._timeout,
+        ) as response:
+
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(
+                    f"Gemini API error {response.status}: {error_text}"
                 )
+
+            async for line in response.content:
+                if not line.startswith(b"data:"):
+                    continue
+                chunk = orjson.loads(line[5:])
+                for candidate in chunk.get("candidates") or ():
+                    if candidate.get("finishReason") in ("SAFETY", "BLOCKED_REASON_UNSPECIFIED"):
+                        raise Exception("Content blocked by Gemini safety filters")
+                    for part in candidate.get("content", {}).get("parts", ()):
+                        if "text" in part:
+                            yield part["text"]
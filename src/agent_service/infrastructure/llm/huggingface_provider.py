@@ -9,15 +9,60 @@ For production use, consider dedicated HuggingFace Inference Endpoints.
 
 import aiohttp
 import asyncio
-import json
+import orjson
+import random
+import re
 from typing import List, Optional, Dict, Any
 
 from .base import BaseLLMProvider, LLMResponse, ProviderConfig, ToolCall
 
+# Common generation issues (leaked special tokens, refusals), scanned in one pass
+_PROBLEMATIC_RE = re.compile(
+    "|".join(map(re.escape, (
+        "<unk>", "<pad>", "<eos>", "[UNK]", "[PAD]", "[EOS]",
+        "sorry, i", "i cannot", "i can't", "not able to",
+    ))),
+    re.IGNORECASE,
+)
+
+# Model-specific confidence adjustments (lowercase, first match wins)
+# Larger, newer models generally produce better results
+_HF_MODEL_SCORES = (
+    # High-quality instruction models
+    ("meta-llama/llama-3", 0.85),
+    ("meta-llama/llama-2", 0.80),
+    ("mistralai/mistral", 0.82),
+    ("mistralai/mixtral", 0.85),
+    ("tiiuae/falcon", 0.78),
+    # Smaller/older models
+    ("gpt2", 0.60),
+    ("distilgpt2", 0.55),
+    ("microsoft/dialogpt", 0.65),
+)
+
+# Issues surface early in a degenerate completion; scanning past this is wasted work
+_SCAN_HEAD_CHARS = 2048
+
+# Number of leading words sampled for the repetition ratio
+_REPETITION_WINDOW = 512
+
+# Cold-start polling: attempts and the cap on a single backoff delay (seconds)
+_LOAD_RETRY_ATTEMPTS = 5
+_LOAD_RETRY_MAX_DELAY = 30
+
 
 class HuggingFaceProvider(BaseLLMProvider):
     """HuggingFace Inference API provider implementation"""
 
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self._urls: Dict[str, str] = {}
+        # Request headers are identical for every call
+        self._headers = {
+            "Authorization": f"Bearer {self.config.api_key}",
+            "Content-Type": "application/json"
+        }
+
     @property
     def provider_name(self) -> str:
         return "huggingface"
@@ -34,6 +79,13 @@ class HuggingFaceProvider(BaseLLMProvider):
         """Get list of supported models"""
         return self.config.models.copy()
 
+    def _url_for(self, model: str) -> str:
+        """Inference API URL for a model, memoized per model"""
+        url = self._urls.get(model)
+        if url is None:
+            url = self._urls[model] = f"{self._base_url}/{model}"
+        return url
+
     async def generate(
         self,
         prompt: str,
@@ -68,72 +120,43 @@ class HuggingFaceProvider(BaseLLMProvider):
         # Get effective model
         effective_model = self.get_effective_model(model)
 
-        # Prepare headers for HuggingFace API
-        headers = {
-            "Authorization": f"Bearer {self.config.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        # Prepare request body for HuggingFace API format
-        # Note: HuggingFace uses "inputs" instead of "messages"
-        request_body = {
-            "inputs": prompt,
-            "parameters": {
-                "max_new_tokens": max_tokens,
-                "temperature": temperature,
-                "return_full_text": False,
-                "do_sample": True
-            }
-        }
-
-        # Add optional parameters
-        if "top_p" in kwargs:
-            request_body["parameters"]["top_p"] = kwargs["top_p"]
-        if "top_k" in kwargs:
-            request_body["parameters"]["top_k"] = kwargs["top_k"]
-        if "repetition_penalty" in kwargs:
-            request_body["parameters"]["repetition_penalty"] = kwargs["repetition_penalty"]
-        if "stop_sequences" in kwargs:
-            request_body["parameters"]["stop"] = kwargs["stop_sequences"]
-
-        # Add wait_for_model parameter to handle cold starts
-        request_body["options"] = {"wait_for_model": True}
+        request_body = self._build_request_body(prompt, max_tokens, temperature, kwargs)
 
         # Construct URL
-        url = f"{self.config.base_url.rstrip('/')}/{effective_model}"
+        url = self._url_for(effective_model)
 
         # Make API request with retry logic for cold starts
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    url,
-                    headers=headers,
-                    json=request_body,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                ) as response:
-
-                    # Handle 503 (model loading)
-                    if response.status == 503:
-                        # Model is loading - wait and retry
-                        await asyncio.sleep(10)
-                        return await self._retry_request(
-                            session, url, headers, request_body, effective_model
-                        )
-
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(
-                            f"HuggingFace API error {response.status}: {error_text}"
-                        )
-
-                    response_data = await response.json()
-
-            except asyncio.TimeoutError:
-                raise Exception(
-                    f"HuggingFace API timeout. Model '{effective_model}' may be cold "
-                    f"starting (can take 30-60s on free tier). Consider using a "
-                    f"dedicated endpoint for production."
-                )
+        session = await self._get_session()
+        try:
+            async with session.post(
+                url,
+                headers=self._headers,
+                data=orjson.dumps(request_body),
+                timeout=self._timeout
+            ) as response:
+
+                # Handle 503 (model loading)
+                if response.status == 503:
+                    # Model is loading - poll with backoff, guided by HF's estimate
+                    estimated_time = self._parse_estimated_time(await response.read())
+                    return await self._retry_request(
+                        session, url, request_body, effective_model, estimated_time
+                    )
+
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(
+                        f"HuggingFace API error {response.status}: {error_text}"
+                    )
+
+                response_data = orjson.loads(await response.read())
+
+        except asyncio.TimeoutError:
+            raise Exception(
+                f"HuggingFace API timeout. Model '{effective_model}' may be cold "
+                f"starting (can take 30-60s on free tier). Consider using a "
+                f"dedicated endpoint for production."
+            )
 
         # Extract content from HuggingFace response
         content = self._extract_content(response_data)
@@ -160,29 +183,85 @@ class HuggingFaceProvider(BaseLLMProvider):
             tool_calls=None,  # Most HF models don't support function calling
         )
 
+    def _build_request_body(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build an Inference API request body"""
+        # Note: HuggingFace uses "inputs" instead of "messages"
+        request_body = {
+            "inputs": prompt,
+            "parameters": {
+                "max_new_tokens": max_tokens,
+                "temperature": temperature,
+                "return_full_text": False,
+                "do_sample": True
+            }
+        }
+
+        # Add optional parameters
+        if "top_p" in kwargs:
+            request_body["parameters"]["top_p"] = kwargs["top_p"]
+        if "top_k" in kwargs:
+            request_body["parameters"]["top_k"] = kwargs["top_k"]
+        if "repetition_penalty" in kwargs:
+            request_body["parameters"]["repetition_penalty"] = kwargs["repetition_penalty"]
+        if "stop_sequences" in kwargs:
+            request_body["parameters"]["stop"] = kwargs["stop_sequences"]
+
+        # Add wait_for_model parameter to handle cold starts. use_cache is left
+        # at the server default: requests are sampled (do_sample=True), and a
+        # server-side cache hit would return an identical completion for them
+        request_body["options"] = {"wait_for_model": True}
+
+        return request_body
+
     async def _retry_request(
         self,
         session: aiohttp.ClientSession,
         url: str,
-        headers: dict,
         request_body: dict,
-        model: str
+        model: str,
+        estimated_time: Optional[float] = None
     ) -> LLMResponse:
-        """Retry request after model loading"""
-        async with session.post(
-            url,
-            headers=headers,
-            json=request_body,
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-        ) as response:
-
-            if response.status != 200:
-                error_text = await response.text()
-                raise Exception(
-                    f"HuggingFace API error on retry {response.status}: {error_text}"
-                )
-
-            response_data = await response.json()
+        """Retry request after model loading, with exponential backoff and jitter
+
+        Each wait is capped by HuggingFace's ``estimated_time`` hint from the
+        latest 503, so a model that comes up quickly is picked up quickly.
+        """
+        for attempt in range(_LOAD_RETRY_ATTEMPTS):
+            delay = min(_LOAD_RETRY_MAX_DELAY, 2 ** attempt) + random.uniform(0, 0.5)
+            if estimated_time is not None:
+                delay = min(delay, estimated_time)
+            await asyncio.sleep(delay)
+
+            async with session.post(
+                url,
+                headers=self._headers,
+                data=orjson.dumps(request_body),
+                timeout=self._timeout
+            ) as response:
+
+                if response.status == 503:
+                    estimated_time = self._parse_estimated_time(await response.read())
+                    continue
+
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(
+                        f"HuggingFace API error on retry {response.status}: {error_text}"
+                    )
+
+                response_data = orjson.loads(await response.read())
+                break
+        else:
+            raise Exception(
+                f"HuggingFace model '{model}' still loading after "
+                f"{_LOAD_RETRY_ATTEMPTS} retries"
+            )
 
         content = self._extract_content(response_data)
         content = self._validate_response_content(content)
@@ -200,6 +279,15 @@ class HuggingFaceProvider(BaseLLMProvider):
             tool_calls=None,
         )
 
+    @staticmethod
+    def _parse_estimated_time(body: bytes) -> Optional[float]:
+        """Read the ``estimated_time`` hint (seconds) from a 503 model-loading body"""
+        try:
+            estimated_time = orjson.loads(body).get("estimated_time")
+        except (orjson.JSONDecodeError, AttributeError):
+            return None
+        return float(estimated_time) if isinstance(estimated_time, (int, float)) else None
+
     def _extract_content(self, response_data: Any) -> str:
         """Extract text content from HuggingFace API response
 
@@ -208,25 +296,14 @@ class HuggingFaceProvider(BaseLLMProvider):
         - Some models: [{"text": "..."}]
         - Others: {"generated_text": "..."}
         """
-        content = ""
-
-        if isinstance(response_data, list) and len(response_data) > 0:
-            # Standard array response
-            first_result = response_data[0]
-            if isinstance(first_result, dict):
-                content = (
-                    first_result.get("generated_text") or
-                    first_result.get("text") or
-                    ""
-                )
-        elif isinstance(response_data, dict):
-            # Direct dict response
-            content = (
-                response_data.get("generated_text") or
-                response_data.get("text") or
-                ""
-            )
+        if isinstance(response_data, list) and response_data:
+            # Standard array response - use the first result
+            response_data = response_data[0]
+
+        if not isinstance(response_data, dict):
+            return ""
 
+        content = response_data.get("generated_text") or response_data.get("text") or ""
         return str(content).strip()
 
     def _estimate_tokens(self, content: str) -> int:
@@ -238,28 +315,12 @@ class HuggingFaceProvider(BaseLLMProvider):
 
         base_confidence = self.config.confidence_score
 
-        # Model-specific confidence adjustments
-        # Larger, newer models generally produce better results
-        model_confidence_map = {
-            # High-quality instruction models
-            "meta-llama/llama-3": 0.85,
-            "meta-llama/llama-2": 0.80,
-            "mistralai/mistral": 0.82,
-            "mistralai/mixtral": 0.85,
-            "tiiuae/falcon": 0.78,
-            # Smaller/older models
-            "gpt2": 0.60,
-            "distilgpt2": 0.55,
-            "microsoft/dialogpt": 0.65,
-        }
-
         # Find matching model confidence
-        model_confidence = base_confidence
         model_lower = model.lower()
-        for model_name, confidence in model_confidence_map.items():
-            if model_name.lower() in model_lower:
-                model_confidence = confidence
-                break
+        model_confidence = next(
+            (score for name, score in _HF_MODEL_SCORES if name in model_lower),
+            base_confidence,
+        )
 
         # Adjust based on content quality
         content_length = len(content.strip())
@@ -273,23 +334,15 @@ class HuggingFaceProvider(BaseLLMProvider):
             # Longer responses from smaller models might be less coherent
             model_confidence *= 0.95
 
-        # Check for common generation issues
-        problematic_patterns = [
-            "<unk>", "<pad>", "<eos>", "[UNK]", "[PAD]", "[EOS]",
-            "sorry, i", "i cannot", "i can't", "not able to"
-        ]
-
-        content_lower = content.lower()
-        for pattern in problematic_patterns:
-            if pattern in content_lower:
-                model_confidence *= 0.6
-                break
+        # Check for common generation issues within a bounded head of the response
+        if _PROBLEMATIC_RE.search(content[:_SCAN_HEAD_CHARS].casefold()):
+            model_confidence *= 0.6
 
-        # Check for repetitive content (common with smaller models)
-        words = content.split()
+        # Check for repetitive content (common with smaller models); a bounded
+        # window of leading words is enough to detect degenerate loops
+        words = content.split(None, _REPETITION_WINDOW)[:_REPETITION_WINDOW]
         if len(words) > 10:
-            unique_words = set(words)
-            repetition_ratio = len(unique_words) / len(words)
+            repetition_ratio = len(set(words)) / len(words)
             if repetition_ratio < 0.7:  # High repetition
                 model_confidence *= 0.8
 
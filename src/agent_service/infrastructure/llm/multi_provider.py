@@ -25,26 +25,264 @@ Environment variables:
 - MULTIMODAL_PROVIDER, MULTIMODAL_MODEL - Visual evidence processing
 - SYNTHESIS_PROVIDER, SYNTHESIS_MODEL - Knowledge base RAG queries
 - STRICT_PROVIDER_MODE - Disable fallback (fail if specified provider unavailable)
+- LLM_ROUTING_STRATEGY - "ordered" (default), "latency" (fastest first) or
+  "adaptive" (weighted uptime/throughput/latency score)
+
+Response Cache (Optional, temperature 0 requests only):
+- LLM_CACHE_SIZE - In-process LRU entries (default 4096; 0 turns the in-process
+  cache off, and with no Redis or semantic cache disables response caching)
+- LLM_CACHE_REDIS_URL - Also cache in Redis (shared across replicas)
+- LLM_CACHE_TTL - Redis entry TTL in seconds (default 3600)
+- LLM_SEMANTIC_CACHE=1 - Also match rephrased prompts by embedding similarity
+  (needs faiss + sentence-transformers; LLM_SEMANTIC_CACHE_MODEL,
+  LLM_SEMANTIC_CACHE_THRESHOLD default 0.92)
+
+Batch Generation (Optional):
+- LLM_MAX_CONCURRENCY - In-flight requests for generate_many() (default 10)
+
+Client-side Rate Limits (Optional):
+- <PREFIX>_RPM - Requests per minute for a provider (e.g. OPENAI_RPM, LOCAL_LLM_RPM)
+- <PREFIX>_TPM - Tokens per minute (prompt estimate + max_tokens) for a provider
+  Calls wait for the provider's token bucket instead of tripping its 429s.
+
+Input Token Budget (Optional):
+- <PREFIX>_MAX_INPUT_TOKENS - Estimated prompt size above which the oldest
+  blank-line-separated sections are dropped before calling the provider
+
+Connection Pool (Optional):
+- LLM_POOL_MAX - Total pooled connections shared by all providers (default 100)
+- LLM_POOL_PER_HOST - Pooled connections per provider host (default 32)
 """
 
+import asyncio
+import hashlib
 import logging
 import os
-from typing import Optional, List, Type
+import time
+from collections import OrderedDict, deque
+from dataclasses import replace
+from typing import AsyncIterator, Callable, Optional, List, Sequence, Type
 
-from .base import ProviderConfig
+import aiohttp
+import orjson
+
+from .base import CHARS_PER_TOKEN, LLMResponse, ProviderConfig, SharedHTTPSession
 from .openai_provider import OpenAIProvider
 from .anthropic_provider import AnthropicProvider
 from .fireworks_provider import FireworksProvider
 from .groq_provider import GroqProvider
 from .gemini_provider import GeminiProvider
 from .huggingface_provider import HuggingFaceProvider
+from .semantic_cache import SemanticCache
 
 # Import observability components
-from agent_service.infrastructure.logging import get_logger
+from agent_service.infrastructure.logging import LoggingConfig, get_logger
 from agent_service.infrastructure.observability import get_tracer
 
 logger = get_logger(__name__)
 
+# Redis namespace for cached LLM responses
+CACHE_KEY_PREFIX = "llm:resp:"
+
+# Weight of the newest sample in the per-provider routing EWMAs
+EWMA_ALPHA = 0.2
+
+# Adaptive routing defaults for providers without samples, and the uptime (%)
+# below which a provider's score is penalised
+DEFAULT_LATENCY_MS = 1000.0
+DEFAULT_TOKENS_PER_SEC = 50.0
+UPTIME_PENALTY_THRESHOLD = 95.0
+
+# Dynamic routing rotates the head of the chain when it falls behind the best
+# provider by this factor, and fully re-sorts every ORDER_RESORT_INTERVAL calls
+ORDER_ROTATE_FACTOR = 2.0
+ORDER_RESORT_INTERVAL = 64
+
+# Provider catalogue, tried in this order; each entry is enabled by its API key
+_PROVIDER_SPECS = (
+    dict(
+        name="openai",
+        provider_class=OpenAIProvider,
+        env_prefix="OPENAI",
+        default_base_url="https://api.openai.com/v1",
+        default_model="gpt-4o-mini",
+        models=("gpt-4o-mini", "gpt-4o", "gpt-4-turbo", "gpt-3.5-turbo"),
+        confidence=0.9
+    ),
+    dict(
+        name="anthropic",
+        provider_class=AnthropicProvider,
+        env_prefix="ANTHROPIC",
+        default_base_url="https://api.anthropic.com/v1",
+        default_model="claude-3-5-sonnet-20241022",
+        models=(
+            "claude-3-5-sonnet-20241022",
+            "claude-3-opus-20240229",
+            "claude-3-sonnet-20240229",
+            "claude-3-haiku-20240307"
+        ),
+        confidence=0.95
+    ),
+    dict(
+        name="fireworks",
+        provider_class=FireworksProvider,
+        env_prefix="FIREWORKS",
+        default_base_url="https://api.fireworks.ai/inference/v1",
+        default_model="accounts/fireworks/models/llama-v3p1-70b-instruct",
+        models=(
+            "accounts/fireworks/models/llama-v3p1-70b-instruct",
+            "accounts/fireworks/models/llama-v3p1-405b-instruct",
+            "accounts/fireworks/models/mixtral-8x22b-instruct"
+        ),
+        confidence=0.85
+    ),
+    dict(
+        name="groq",
+        provider_class=GroqProvider,
+        env_prefix="GROQ",
+        default_base_url="https://api.groq.com/openai/v1",
+        default_model="llama-3.3-70b-versatile",
+        models=(
+            "llama-3.3-70b-versatile",
+            "llama-3.1-70b-versatile",
+            "llama-3.1-8b-instant",
+            "mixtral-8x7b-32768"
+        ),
+        confidence=0.88
+    ),
+    dict(
+        name="gemini",
+        provider_class=GeminiProvider,
+        env_prefix="GEMINI",
+        default_base_url="https://generativelanguage.googleapis.com/v1beta",
+        default_model="gemini-1.5-pro",
+        models=("gemini-1.5-pro", "gemini-1.5-flash", "gemini-1.0-pro"),
+        confidence=0.82
+    ),
+    dict(
+        name="huggingface",
+        provider_class=HuggingFaceProvider,
+        env_prefix="HUGGINGFACE",
+        default_base_url="https://api-inference.huggingface.co/models",
+        default_model="meta-llama/Llama-3.2-3B-Instruct",
+        models=(
+            "meta-llama/Llama-3.2-3B-Instruct",
+            "meta-llama/Llama-3.2-1B-Instruct",
+            "mistralai/Mistral-7B-Instruct-v0.3",
+            "microsoft/Phi-3-mini-4k-instruct",
+            "google/flan-t5-large",
+        ),
+        confidence=0.70  # Lower confidence due to smaller open-source models
+    ),
+    dict(
+        name="openrouter",
+        provider_class=OpenAIProvider,  # OpenRouter uses OpenAI-compatible API
+        env_prefix="OPENROUTER",
+        default_base_url="https://openrouter.ai/api/v1",
+        default_model="anthropic/claude-3.5-sonnet",
+        models=(
+            "anthropic/claude-3.5-sonnet",
+            "openai/gpt-4-turbo",
+            "google/gemini-pro"
+        ),
+        confidence=0.85
+    ),
+    dict(
+        name="local",
+        provider_class=OpenAIProvider,  # Local LLMs use OpenAI-compatible API
+        env_prefix="LOCAL_LLM",
+        default_base_url="http://localhost:11434/v1",
+        default_model="llama2",
+        models=(
+            "llama2",
+            "llama3",
+            "llama3.1",
+            "mistral",
+            "mixtral",
+            "codellama",
+            "phi",
+            "gemma"
+        ),
+        confidence=0.75
+    ),
+)
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker (CLOSED → OPEN → HALF_OPEN → CLOSED).
+
+    After ``failure_threshold`` consecutive failures the circuit opens and the
+    provider is skipped for ``recovery_timeout`` seconds. The first request
+    after that is let through as a probe; its outcome closes or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, recovery_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent to the provider now."""
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at >= self.recovery_timeout:
+            # Let a single probe through (re-armed if a probe never reports back)
+            self.state = self.HALF_OPEN
+            self.opened_at = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or on a failed probe."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class TokenBucket:
+    """Client-side token bucket used to stay under a provider's rate limit.
+
+    Holds up to ``capacity`` tokens and refills at ``rate`` tokens per second.
+    ``acquire`` waits until enough tokens are available; waiters are served
+    in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Take ``amount`` tokens, sleeping until the bucket has refilled enough."""
+        # A request larger than the bucket can never fit; let it drain the bucket
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            if self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
 
 class MultiProviderLLM:
     """Multi-provider LLM with automatic fallback chain.
@@ -53,11 +291,97 @@ class MultiProviderLLM:
     Providers are initialized based on available API keys.
     """
 
+    __slots__ = (
+        "providers",
+        "provider_names",
+        "provider_map",
+        "_provider_to_name",
+        "_breakers",
+        "_rpm_buckets",
+        "_tpm_buckets",
+        "_tracer",
+        "_http",
+        "routing_strategy",
+        "_latency_ewma",
+        "_uptime_ewma",
+        "_throughput_ewma",
+        "max_concurrency",
+        "default_hedge",
+        "_cache",
+        "_cache_size",
+        "_cache_ttl",
+        "_cache_stats",
+        "_cache_enabled",
+        "_redis",
+        "_semantic_cache",
+        "strict_mode",
+        "task_config",
+        "_resolved_tasks",
+        "_order",
+        "_chain",
+        "_order_updates",
+        "_status_static",
+    )
+
     def __init__(self):
         """Initialize all available providers based on environment."""
         self.providers = []
         self.provider_names = []
         self.provider_map = {}  # Map provider name to provider instance
+        self._provider_to_name: dict[int, str] = {}  # Reverse of provider_map, keyed by id()
+        self._breakers: dict[str, CircuitBreaker] = {}  # Per-provider circuit breakers
+        self._rpm_buckets: dict[str, TokenBucket] = {}  # Optional <PREFIX>_RPM limits
+        self._tpm_buckets: dict[str, TokenBucket] = {}  # Optional <PREFIX>_TPM limits
+
+        self._tracer = get_tracer()
+
+        # One connection pool shared by every provider
+        self._http = SharedHTTPSession(
+            limit=int(os.getenv("LLM_POOL_MAX", "100")),
+            limit_per_host=int(os.getenv("LLM_POOL_PER_HOST", "32")),
+        )
+
+        # Fallback ordering: "ordered" (configuration order) or "latency" (EWMA)
+        self.routing_strategy = os.getenv("LLM_ROUTING_STRATEGY", "ordered").lower()
+        self._latency_ewma: dict[str, float] = {}
+        self._uptime_ewma: dict[str, float] = {}  # Success rate, 0-1
+        self._throughput_ewma: dict[str, float] = {}  # Output tokens per second
+
+        # Concurrency limit for generate_many()
+        self.max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "10"))
+
+        # Providers raced at the head of the chain when generate() gets no hedge
+        self.default_hedge = max(1, int(os.getenv("LLM_HEDGE", "1")))
+
+        # Response cache for deterministic (temperature 0) requests
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_size = int(os.getenv("LLM_CACHE_SIZE", "4096"))
+        self._cache_ttl = int(os.getenv("LLM_CACHE_TTL", "3600"))
+        self._cache_stats = {"hits": 0, "misses": 0, "semantic_hits": 0}
+        self._redis = None
+        redis_url = os.getenv("LLM_CACHE_REDIS_URL")
+        if redis_url:
+            import redis.asyncio as aioredis
+            self._redis = aioredis.from_url(redis_url)
+
+        # Optional embedding-similarity cache for rephrased deterministic prompts
+        self._semantic_cache = None
+        if os.getenv("LLM_SEMANTIC_CACHE", "0") == "1":
+            semantic_cache = SemanticCache(
+                model_name=os.getenv("LLM_SEMANTIC_CACHE_MODEL", "BAAI/bge-small-en-v1.5"),
+                threshold=float(os.getenv("LLM_SEMANTIC_CACHE_THRESHOLD", "0.92")),
+                ttl_seconds=self._cache_ttl,
+            )
+            if semantic_cache.available:
+                self._semantic_cache = semantic_cache
+            else:
+                logger.warning(
+                    "⚠️ LLM_SEMANTIC_CACHE=1 but faiss/sentence-transformers are not installed"
+                )
+
+        self._cache_enabled = bool(
+            self._cache_size > 0 or self._redis is not None or self._semantic_cache is not None
+        )
 
         # Task-specific routing configuration
         self.strict_mode = os.getenv("STRICT_PROVIDER_MODE", "false").lower() == "true"
@@ -76,119 +400,24 @@ class MultiProviderLLM:
             }
         }
 
-        # Initialize providers using helper
-        self._try_init_provider(
-            name="openai",
-            provider_class=OpenAIProvider,
-            env_prefix="OPENAI",
-            default_base_url="https://api.openai.com/v1",
-            default_model="gpt-4o-mini",
-            models=["gpt-4o-mini", "gpt-4o", "gpt-4-turbo", "gpt-3.5-turbo"],
-            confidence=0.9
-        )
-
-        self._try_init_provider(
-            name="anthropic",
-            provider_class=AnthropicProvider,
-            env_prefix="ANTHROPIC",
-            default_base_url="https://api.anthropic.com/v1",
-            default_model="claude-3-5-sonnet-20241022",
-            models=[
-                "claude-3-5-sonnet-20241022",
-                "claude-3-opus-20240229",
-                "claude-3-sonnet-20240229",
-                "claude-3-haiku-20240307"
-            ],
-            confidence=0.95
-        )
-
-        self._try_init_provider(
-            name="fireworks",
-            provider_class=FireworksProvider,
-            env_prefix="FIREWORKS",
-            default_base_url="https://api.fireworks.ai/inference/v1",
-            default_model="accounts/fireworks/models/llama-v3p1-70b-instruct",
-            models=[
-                "accounts/fireworks/models/llama-v3p1-70b-instruct",
-                "accounts/fireworks/models/llama-v3p1-405b-instruct",
-                "accounts/fireworks/models/mixtral-8x22b-instruct"
-            ],
-            confidence=0.85
-        )
-
-        self._try_init_provider(
-            name="groq",
-            provider_class=GroqProvider,
-            env_prefix="GROQ",
-            default_base_url="https://api.groq.com/openai/v1",
-            default_model="llama-3.3-70b-versatile",
-            models=[
-                "llama-3.3-70b-versatile",
-                "llama-3.1-70b-versatile",
-                "llama-3.1-8b-instant",
-                "mixtral-8x7b-32768"
-            ],
-            confidence=0.88
-        )
-
-        self._try_init_provider(
-            name="gemini",
-            provider_class=GeminiProvider,
-            env_prefix="GEMINI",
-            default_base_url="https://generativelanguage.googleapis.com/v1beta",
-            default_model="gemini-1.5-pro",
-            models=["gemini-1.5-pro", "gemini-1.5-flash", "gemini-1.0-pro"],
-            confidence=0.82
-        )
+        # Initialize providers from the module-level catalogue
+        for spec in _PROVIDER_SPECS:
+            self._try_init_provider(**spec)
 
-        self._try_init_provider(
-            name="huggingface",
-            provider_class=HuggingFaceProvider,
-            env_prefix="HUGGINGFACE",
-            default_base_url="https://api-inference.huggingface.co/models",
-            default_model="meta-llama/Llama-3.2-3B-Instruct",
-            models=[
-                "meta-llama/Llama-3.2-3B-Instruct",
-                "meta-llama/Llama-3.2-1B-Instruct",
-                "mistralai/Mistral-7B-Instruct-v0.3",
-                "microsoft/Phi-3-mini-4k-instruct",
-                "google/flan-t5-large",
-            ],
-            confidence=0.70  # Lower confidence due to smaller open-source models
-        )
+        # Task routing never changes after init; resolve it once (strict-mode
+        # misconfigurations fail here rather than on the first request)
+        self._resolved_tasks: dict[str, tuple[Optional[object], Optional[str]]] = {
+            task_type: self._build_task_route(task_type) for task_type in self.task_config
+        }
 
-        self._try_init_provider(
-            name="openrouter",
-            provider_class=OpenAIProvider,  # OpenRouter uses OpenAI-compatible API
-            env_prefix="OPENROUTER",
-            default_base_url="https://openrouter.ai/api/v1",
-            default_model="anthropic/claude-3.5-sonnet",
-            models=[
-                "anthropic/claude-3.5-sonnet",
-                "openai/gpt-4-turbo",
-                "google/gemini-pro"
-            ],
-            confidence=0.85
-        )
+        # Fallback chain: a deque that dynamic strategies rotate in place, plus
+        # an immutable snapshot that generate() iterates
+        self._order = deque(zip(self.provider_names, self.providers))
+        self._chain = tuple(self._order)
+        self._order_updates = 0
 
-        self._try_init_provider(
-            name="local",
-            provider_class=OpenAIProvider,  # Local LLMs use OpenAI-compatible API
-            env_prefix="LOCAL_LLM",
-            default_base_url="http://localhost:11434/v1",
-            default_model="llama2",
-            models=[
-                "llama2",
-                "llama3",
-                "llama3.1",
-                "mistral",
-                "mixtral",
-                "codellama",
-                "phi",
-                "gemma"
-            ],
-            confidence=0.75
-        )
+        # Configuration half of get_status(), built on first call
+        self._status_static: Optional[tuple] = None
 
         if not self.providers:
             logger.warning(
@@ -198,24 +427,25 @@ class MultiProviderLLM:
             )
         else:
             logger.info(
-                f"🎯 MultiProviderLLM initialized with {len(self.providers)} provider(s): "
-                f"{', '.join(self.provider_names)}"
+                "🎯 MultiProviderLLM initialized with %d provider(s): %s",
+                len(self.providers), ", ".join(self.provider_names),
             )
 
-            # Log task-specific routing configuration
-            task_routing_active = any(
-                cfg["provider"] != "auto" for cfg in self.task_config.values()
-            )
-            if task_routing_active:
-                logger.info("📍 Task-specific provider routing enabled:")
-                for task_type, cfg in self.task_config.items():
-                    if cfg["provider"] != "auto":
-                        model_info = f" (model: {cfg['model']})" if cfg['model'] else ""
-                        logger.info(f"  • {task_type}: {cfg['provider']}{model_info}")
-                if self.strict_mode:
-                    logger.info("  ⚠️  STRICT MODE: Fallback disabled")
-            else:
-                logger.info("🔄 Using automatic fallback chain for all tasks")
+            # Log task-specific routing configuration (skip the walk when INFO is off)
+            if LoggingConfig.get_log_level() <= logging.INFO:
+                task_routing_active = any(
+                    cfg["provider"] != "auto" for cfg in self.task_config.values()
+                )
+                if task_routing_active:
+                    logger.info("📍 Task-specific provider routing enabled:")
+                    for task_type, cfg in self.task_config.items():
+                        if cfg["provider"] != "auto":
+                            model_info = f" (model: {cfg['model']})" if cfg['model'] else ""
+                            logger.info("  • %s: %s%s", task_type, cfg["provider"], model_info)
+                    if self.strict_mode:
+                        logger.info("  ⚠️  STRICT MODE: Fallback disabled")
+                else:
+                    logger.info("🔄 Using automatic fallback chain for all tasks")
 
     def _try_init_provider(
         self,
@@ -224,7 +454,7 @@ class MultiProviderLLM:
         env_prefix: str,
         default_base_url: str,
         default_model: str,
-        models: List[str],
+        models: Sequence[str],
         confidence: float
     ):
         """Helper to reduce provider initialization boilerplate."""
@@ -237,15 +467,19 @@ class MultiProviderLLM:
             env_model = os.getenv(f"{env_prefix}_MODEL")
             if env_model:
                 default_model = env_model
-                
+
+            max_input_tokens = os.getenv(f"{env_prefix}_MAX_INPUT_TOKENS")
+
             config = ProviderConfig(
                 name=name,
                 api_key=api_key,
                 base_url=os.getenv(f"{env_prefix}_BASE_URL", default_base_url),
-                models=models,
+                models=list(models),
                 default_model=default_model,
                 timeout=60,
                 confidence_score=confidence,
+                max_input_tokens=int(max_input_tokens) if max_input_tokens else None,
+                http_session=self._http,
             )
 
             provider = provider_class(config)
@@ -253,10 +487,21 @@ class MultiProviderLLM:
                 self.providers.append(provider)
                 self.provider_names.append(name)
                 self.provider_map[name] = provider
-                logger.info(f"✅ {name.capitalize()} provider initialized (model: {default_model})")
+                self._provider_to_name[id(provider)] = name
+                self._breakers[name] = CircuitBreaker(
+                    failure_threshold=int(os.getenv("LLM_BREAKER_FAILURES", "3")),
+                    recovery_timeout=float(os.getenv("LLM_BREAKER_RECOVERY_S", "60")),
+                )
+                rpm = os.getenv(f"{env_prefix}_RPM")
+                if rpm:
+                    self._rpm_buckets[name] = TokenBucket(float(rpm) / 60, float(rpm))
+                tpm = os.getenv(f"{env_prefix}_TPM")
+                if tpm:
+                    self._tpm_buckets[name] = TokenBucket(float(tpm) / 60, float(tpm))
+                logger.info("✅ %s provider initialized (model: %s)", name.capitalize(), default_model)
         
         except Exception as e:
-            logger.warning(f"Failed to initialize {name} provider: {e}")
+            logger.warning("Failed to initialize %s provider: %s", name, e)
 
     def _resolve_task_provider(self, task_type: str) -> tuple[Optional[object], Optional[str]]:
         """Resolve which provider and model to use for a specific task type.
@@ -267,9 +512,16 @@ class MultiProviderLLM:
         Returns:
             Tuple of (provider_instance, model_override) or (None, None) for auto fallback
         """
-        if task_type not in self.task_config:
-            return None, None
+        return self._resolved_tasks.get(task_type, (None, None))
+
+    def _build_task_route(self, task_type: str) -> tuple[Optional[object], Optional[str]]:
+        """Compute the (provider, model) route for a configured task type.
 
+        Called once per task type from ``__init__``.
+
+        Raises:
+            RuntimeError: In strict mode, if the configured provider is not available
+        """
         cfg = self.task_config[task_type]
         provider_name = cfg["provider"]
         model_override = cfg["model"]
@@ -289,8 +541,9 @@ class MultiProviderLLM:
                 )
             else:
                 logger.warning(
-                    f"⚠️  {task_type} task configured for '{provider_name}' but provider "
-                    f"not available. Falling back to auto."
+                    "⚠️  %s task configured for '%s' but provider not available. "
+                    "Falling back to auto.",
+                    task_type, provider_name,
                 )
                 return None, model_override
 
@@ -303,6 +556,7 @@ class MultiProviderLLM:
         max_tokens: int = 4000,
         model: Optional[str] = None,
         task_type: str = "chat",
+        hedge: Optional[int] = None,
         **kwargs
     ) -> str:
         """Generate text using task-specific routing or fallback chain.
@@ -316,6 +570,9 @@ class MultiProviderLLM:
             max_tokens: Maximum tokens to generate
             model: Optional model override
             task_type: Type of task ("chat", "multimodal", "synthesis")
+            hedge: Number of providers to race concurrently at the head of the
+                fallback chain (1 = sequential). Trades tokens for tail latency.
+                Defaults to LLM_HEDGE (1 when unset).
             **kwargs: Additional provider-specific parameters
 
         Returns:
@@ -330,6 +587,22 @@ class MultiProviderLLM:
                 "by setting OPENAI_API_KEY, ANTHROPIC_API_KEY, or FIREWORKS_API_KEY"
             )
 
+        # Deterministic requests can be answered from the response cache
+        cache_key = None
+        semantic_context = None
+        if temperature == 0 and self._cache_enabled:
+            cache_key = self._cache_key(prompt, model, max_tokens, task_type, kwargs)
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            if self._semantic_cache is not None:
+                # Same request minus the prompt: a semantic hit must match this scope
+                semantic_context = self._cache_key("", model, max_tokens, task_type, kwargs)
+                cached = await self._semantic_get(prompt, semantic_context)
+                if cached is not None:
+                    return cached
+
         # Check for task-specific provider configuration
         task_provider, task_model = self._resolve_task_provider(task_type)
 
@@ -339,19 +612,27 @@ class MultiProviderLLM:
 
         # If task-specific provider is set, try it first
         if task_provider:
-            provider_name = next(
-                name for name, p in self.provider_map.items() if p == task_provider
-            )
+            provider_name = self._provider_to_name[id(task_provider)]
+            if not self.strict_mode and not self._breakers[provider_name].allow_request():
+                logger.warning(
+                    "⚡ Circuit open for task-specific provider '%s', "
+                    "using automatic provider chain",
+                    provider_name,
+                )
+                task_provider = None
+
+        if task_provider:
             logger.info(
-                f"🎯 Using task-specific provider for '{task_type}': {provider_name}"
-                + (f" (model: {model})" if model else "")
+                "🎯 Using task-specific provider for '%s': %s%s",
+                task_type, provider_name, f" (model: {model})" if model else "",
             )
 
             try:
                 # Add tracing for LLM generation
-                tracer = get_tracer()
-                with tracer.trace("llm_generate", provider=provider_name, model=model, task=task_type) as span:
-                    response = await task_provider.generate(
+                with self._tracer.trace("llm_generate", provider=provider_name, model=model, task=task_type) as span:
+                    response = await self._call_provider(
+                        provider_name,
+                        task_provider,
                         prompt=prompt,
                         model=model,
                         max_tokens=max_tokens,
@@ -367,14 +648,17 @@ class MultiProviderLLM:
                         })
 
                 logger.info(
-                    f"✅ Success with {provider_name}: {response.model}, "
-                    f"{response.tokens_used} tokens, {response.response_time_ms}ms, "
-                    f"confidence={response.confidence:.2f}"
+                    "✅ Success with %s: %s, %d tokens, %dms, confidence=%.2f",
+                    provider_name, response.model, response.tokens_used,
+                    response.response_time_ms, response.confidence,
                 )
+                self._record_success(provider_name, response)
 
+                await self._cache_put(cache_key, response.content, prompt, semantic_context)
                 return response.content
 
             except Exception as e:
+                self._record_failure(provider_name)
                 if self.strict_mode:
                     # In strict mode, fail immediately without fallback
                     raise RuntimeError(
@@ -384,24 +668,61 @@ class MultiProviderLLM:
                 else:
                     # In non-strict mode, log warning and fall back to auto chain
                     logger.warning(
-                        f"❌ Task-specific provider '{provider_name}' failed: "
-                        f"{type(e).__name__}: {str(e)}"
+                        "❌ Task-specific provider '%s' failed: %s: %s",
+                        provider_name, type(e).__name__, e,
                     )
                     logger.info("⏭️  Falling back to automatic provider chain...")
 
         # Use automatic fallback chain
         last_error = None
+        order = self._fallback_order()
+
+        # Optionally race the first providers of the chain against each other
+        if hedge is None:
+            hedge = self.default_hedge
+        if hedge > 1:
+            order = list(order)
+            hedged = []
+            while order and len(hedged) < hedge:
+                name, candidate = order.pop(0)
+                if self._breakers[name].allow_request():
+                    hedged.append((name, candidate))
+
+            if hedged:
+                try:
+                    provider_name, response = await self._generate_hedged(
+                        hedged,
+                        task_type=task_type,
+                        prompt=prompt,
+                        model=model,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **kwargs
+                    )
+                    await self._cache_put(cache_key, response.content, prompt, semantic_context)
+                    return response.content
+                except Exception as e:
+                    last_error = e
+                    logger.info("⏭️  All hedged providers failed, continuing fallback chain...")
 
-        for i, provider in enumerate(self.providers):
-            provider_name = self.provider_names[i]
+        # Hedged providers were taken off the head of the chain; keep counting
+        # positions in the full chain so the last provider is recognised
+        for i, (provider_name, provider) in enumerate(order, len(self.providers) - len(order)):
+            if not self._breakers[provider_name].allow_request():
+                logger.info("⚡ Skipping %s: circuit open", provider_name)
+                continue
 
             try:
-                logger.info(f"🔄 Trying provider {i + 1}/{len(self.providers)}: {provider_name}")
+                logger.info("🔄 Trying provider %d/%d: %s", i + 1, len(self.providers), provider_name)
 
                 # Add tracing for LLM generation (fallback chain)
-                tracer = get_tracer()
-                with tracer.trace("llm_generate", provider=provider_name, model=model, task=task_type, fallback_attempt=i+1) as span:
-                    response = await provider.generate(
+                with self._tracer.trace(
+                    "llm_generate", provider=provider_name, model=model, task=task_type,
+                    fallback_attempt=i+1, routing_score=round(self._score(provider_name), 3)
+                ) as span:
+                    response = await self._call_provider(
+                        provider_name,
+                        provider,
                         prompt=prompt,
                         model=model,
                         max_tokens=max_tokens,
@@ -417,54 +738,569 @@ class MultiProviderLLM:
                         })
 
                 logger.info(
-                    f"✅ Success with {provider_name}: {response.model}, "
-                    f"{response.tokens_used} tokens, {response.response_time_ms}ms, "
-                    f"confidence={response.confidence:.2f}"
+                    "✅ Success with %s: %s, %d tokens, %dms, confidence=%.2f",
+                    provider_name, response.model, response.tokens_used,
+                    response.response_time_ms, response.confidence,
                 )
+                self._record_success(provider_name, response)
 
+                await self._cache_put(cache_key, response.content, prompt, semantic_context)
                 return response.content
 
             except Exception as e:
                 last_error = e
-                logger.warning(
-                    f"❌ {provider_name} failed: {type(e).__name__}: {str(e)}"
-                )
+                self._record_failure(provider_name)
+                logger.warning("❌ %s failed: %s: %s", provider_name, type(e).__name__, e)
 
                 # If this isn't the last provider, try the next one
                 if i < len(self.providers) - 1:
-                    logger.info(f"⏭️  Falling back to next provider...")
+                    logger.info("⏭️  Falling back to next provider...")
                     continue
                 else:
                     # This was the last provider
-                    logger.error(f"💥 All {len(self.providers)} provider(s) failed")
+                    logger.error("💥 All %d provider(s) failed", len(self.providers))
+
+        if last_error is None:
+            raise RuntimeError(
+                "All LLM providers are unavailable: circuit breakers open for "
+                f"{', '.join(self.provider_names)}"
+            )
 
         # All providers failed
         raise RuntimeError(
             f"All LLM providers failed. Last error: {type(last_error).__name__}: {str(last_error)}"
         )
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        model: Optional[str] = None,
+        task_type: str = "chat",
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream generated text chunks as the provider produces them.
+
+        Uses the same task-specific routing and fallback chain as generate().
+        A provider that fails before yielding anything is skipped for the next
+        one; once output has been yielded a failure is raised, since the caller
+        has already seen partial text. Providers without a streaming API yield
+        their full response as a single chunk. Streamed responses are not cached.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            model: Optional model override
+            task_type: Type of task ("chat", "multimodal", "synthesis")
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Text chunks in generation order
+
+        Raises:
+            RuntimeError: If all providers fail, none configured, or strict mode violation
+        """
+        if not self.providers:
+            raise RuntimeError(
+                "No LLM providers available. Configure at least one provider "
+                "by setting OPENAI_API_KEY, ANTHROPIC_API_KEY, or FIREWORKS_API_KEY"
+            )
+
+        task_provider, task_model = self._resolve_task_provider(task_type)
+        if task_model and not model:
+            model = task_model
+
+        candidates = list(self._fallback_order())
+        if task_provider:
+            task_name = self._provider_to_name[id(task_provider)]
+            if self.strict_mode:
+                candidates = [(task_name, task_provider)]
+            else:
+                candidates.remove((task_name, task_provider))
+                candidates.insert(0, (task_name, task_provider))
+
+        # Strict mode pins the task provider and ignores its breaker, as generate() does
+        pinned = self.strict_mode and task_provider is not None
+        last_error = None
+        for provider_name, provider in candidates:
+            if not pinned and not self._breakers[provider_name].allow_request():
+                logger.info("⚡ Skipping %s: circuit open", provider_name)
+                continue
+
+            started = False
+            try:
+                logger.info("🌊 Streaming from %s", provider_name)
+                await self._acquire_rate_limit(provider_name, prompt, max_tokens)
+                with self._tracer.trace(
+                    "llm_generate", provider=provider_name, model=model, task=task_type,
+                    stream=True
+                ):
+                    if hasattr(provider, "generate_stream"):
+                        # generate_trimmed() applies the input budget on the other path
+                        stream_prompt = prompt
+                        if provider.config.max_input_tokens:
+                            stream_prompt = provider._trim_prompt(
+                                prompt, provider.config.max_input_tokens
+                            )
+                        async for chunk in provider.generate_stream(
+                            prompt=stream_prompt,
+                            model=model,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            **kwargs
+                        ):
+                            started = True
+                            yield chunk
+                        self._record_success(provider_name, None)
+                    else:
+                        response = await self._timed_generate(
+                            provider,
+                            prompt=prompt,
+                            model=model,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            **kwargs
+                        )
+                        self._record_success(provider_name, response)
+                        started = True
+                        yield response.content
+                return
+
+            except Exception as e:
+                last_error = e
+                self._record_failure(provider_name)
+                if started:
+                    raise
+                if pinned:
+                    raise RuntimeError(
+                        f"STRICT MODE: {task_type} task failed with provider '{provider_name}': "
+                        f"{type(e).__name__}: {str(e)}"
+                    )
+                logger.warning("❌ %s failed: %s: %s", provider_name, type(e).__name__, e)
+
+        if last_error is None:
+            raise RuntimeError(
+                "All LLM providers are unavailable: circuit breakers open for "
+                f"{', '.join(self.provider_names)}"
+            )
+        raise RuntimeError(
+            f"All LLM providers failed. Last error: {type(last_error).__name__}: {str(last_error)}"
+        )
+
+    async def generate_many(
+        self,
+        prompts: List[str],
+        max_concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[int, str], None]] = None,
+        **kwargs
+    ) -> List[str]:
+        """Generate responses for many prompts with bounded concurrency.
+
+        Each prompt goes through generate() (routing, fallback, caching), with
+        at most ``max_concurrency`` requests in flight at once.
+
+        Args:
+            prompts: Prompts to send to the LLM
+            max_concurrency: In-flight request limit (default LLM_MAX_CONCURRENCY)
+            on_progress: Called as on_progress(index, content) as each prompt completes
+            **kwargs: Arguments forwarded to generate()
+
+        Returns:
+            Generated text for each prompt, in input order
+
+        Raises:
+            RuntimeError: If any prompt fails on every provider
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def _one(index: int, prompt: str) -> str:
+            async with semaphore:
+                content = await self.generate(prompt, **kwargs)
+            if on_progress:
+                on_progress(index, content)
+            return content
+
+        return list(await asyncio.gather(*(_one(i, p) for i, p in enumerate(prompts))))
+
+    async def _call_provider(self, provider_name: str, provider, **gen_kwargs) -> LLMResponse:
+        """Call a provider once its client-side rate limits allow it.
+
+        Args:
+            provider_name: Provider name (selects the rate-limit buckets)
+            provider: Provider instance
+            **gen_kwargs: Arguments for provider.generate_trimmed
+
+        Returns:
+            LLMResponse from the provider
+        """
+        await self._acquire_rate_limit(
+            provider_name, gen_kwargs.get("prompt", ""), gen_kwargs.get("max_tokens", 0)
+        )
+        return await self._timed_generate(provider, **gen_kwargs)
+
+    @staticmethod
+    async def _timed_generate(provider, **gen_kwargs) -> LLMResponse:
+        """Call provider.generate_trimmed, timing the call locally.
+
+        Providers time requests from a single start_time attribute that
+        concurrent and hedged calls overwrite, so the response's
+        response_time_ms is replaced with this call's own wall time before it
+        feeds the routing averages.
+        """
+        started = time.monotonic_ns()
+        response = await provider.generate_trimmed(**gen_kwargs)
+        return replace(response, response_time_ms=(time.monotonic_ns() - started) // 1_000_000)
+
+    async def _acquire_rate_limit(self, provider_name: str, prompt: str, max_tokens: int) -> None:
+        """Wait until the provider's RPM/TPM buckets (if configured) admit a request."""
+        rpm_bucket = self._rpm_buckets.get(provider_name)
+        if rpm_bucket is not None:
+            await rpm_bucket.acquire()
+        tpm_bucket = self._tpm_buckets.get(provider_name)
+        if tpm_bucket is not None:
+            await tpm_bucket.acquire(len(prompt) // CHARS_PER_TOKEN + max_tokens)
+
+    async def _generate_hedged(
+        self,
+        candidates: List[tuple],
+        task_type: str,
+        **gen_kwargs
+    ) -> tuple:
+        """Race several providers and return the first successful response.
+
+        Slower providers are cancelled as soon as one succeeds; failures keep
+        the race going until every candidate has failed.
+
+        Args:
+            candidates: (name, provider) pairs to run concurrently
+            task_type: Task type, for tracing
+            **gen_kwargs: Arguments for _call_provider
+
+        Returns:
+            Tuple of (winning provider name, LLMResponse)
+
+        Raises:
+            Exception: The last provider error if every candidate failed
+        """
+        names = [name for name, _ in candidates]
+        logger.info("🏁 Hedging across %d providers: %s", len(candidates), ", ".join(names))
+
+        tasks = {
+            asyncio.create_task(self._call_provider(name, provider, **gen_kwargs)): name
+            for name, provider in candidates
+        }
+        pending = set(tasks)
+        last_error = None
+
+        with self._tracer.trace(
+            "llm_generate", provider=",".join(names), model=gen_kwargs.get("model"),
+            task=task_type, hedged=True
+        ) as span:
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        name = tasks[task]
+                        error = task.exception()
+                        if error is not None:
+                            last_error = error
+                            self._record_failure(name)
+                            logger.warning("❌ %s failed: %s: %s", name, type(error).__name__, error)
+                            continue
+
+                        response = task.result()
+                        self._record_success(name, response)
+                        if span:
+                            span.log({
+                                "winner": name,
+                                "cancelled": [tasks[t] for t in pending],
+                                "tokens": response.tokens_used,
+                                "latency_ms": response.response_time_ms,
+                                "confidence": response.confidence
+                            })
+                        logger.info(
+                            "✅ Hedge won by %s: %s, %d tokens, %dms",
+                            name, response.model, response.tokens_used,
+                            response.response_time_ms,
+                        )
+                        return name, response
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+
+        raise last_error
+
+    def _fallback_order(self) -> Sequence[tuple]:
+        """Return (name, provider) pairs in the order the fallback chain tries them.
+
+        With LLM_ROUTING_STRATEGY=latency or adaptive the order is maintained
+        incrementally by _update_order; otherwise the configured order is used.
+        """
+        return self._chain
+
+    def _update_order(self) -> None:
+        """Keep the dynamic fallback order roughly best-first after a call.
+
+        Rotates the head to the back when it lags the best provider by
+        ORDER_ROTATE_FACTOR, and re-sorts the whole chain every
+        ORDER_RESORT_INTERVAL updates. With LLM_ROUTING_STRATEGY=latency the
+        sort key is the latency EWMA (providers without samples first so they
+        get measured); with adaptive it is _score (best first).
+        """
+        if self.routing_strategy not in ("latency", "adaptive") or len(self._order) < 2:
+            return
+
+        self._order_updates += 1
+        if self._order_updates % ORDER_RESORT_INTERVAL == 0:
+            if self.routing_strategy == "latency":
+                ordered = sorted(self._order, key=lambda pair: self._latency_ewma.get(pair[0], 0.0))
+            else:
+                ordered = sorted(self._order, key=lambda pair: self._score(pair[0]), reverse=True)
+            self._order = deque(ordered)
+        else:
+            head = self._order[0][0]
+            if self.routing_strategy == "latency":
+                if head not in self._latency_ewma:
+                    return
+                lagging = self._latency_ewma[head] > ORDER_ROTATE_FACTOR * min(
+                    self._latency_ewma.values()
+                )
+            else:
+                best = max(self._score(name) for name, _ in self._order)
+                lagging = self._score(head) * ORDER_ROTATE_FACTOR < best
+            if not lagging:
+                return
+            self._order.rotate(-1)
+
+        self._chain = tuple(self._order)
+
+    def _score(self, provider_name: str) -> float:
+        """Weighted health score for adaptive routing (higher is better).
+
+        Combines uptime (0.625), throughput (0.25) and latency (0.125), each
+        normalised to 0-1, so the score itself stays in 0-1. Uptime below UPTIME_PENALTY_THRESHOLD is penalised
+        further so a flapping provider drops behind healthy ones quickly.
+        Providers without samples score with the defaults.
+        """
+        uptime = self._uptime_ewma.get(provider_name, 1.0) * 100
+        latency = self._latency_ewma.get(provider_name, DEFAULT_LATENCY_MS)
+        throughput = self._throughput_ewma.get(provider_name, DEFAULT_TOKENS_PER_SEC)
+
+        uptime_score = uptime / 100
+        if uptime < UPTIME_PENALTY_THRESHOLD:
+            uptime_score *= uptime / UPTIME_PENALTY_THRESHOLD
+        latency_score = DEFAULT_LATENCY_MS / (DEFAULT_LATENCY_MS + latency)
+        throughput_score = throughput / (throughput + DEFAULT_TOKENS_PER_SEC)
+
+        return 0.625 * uptime_score + 0.25 * throughput_score + 0.125 * latency_score
+
+    def _record_success(self, provider_name: str, response: Optional[LLMResponse]) -> None:
+        """Update breaker and routing metrics after a successful call.
+
+        Streamed calls (``response=None``) only count towards uptime.
+        """
+        self._breakers[provider_name].record_success()
+        self._uptime_ewma[provider_name] = self._ewma(self._uptime_ewma, provider_name, 1.0)
+        if response is None:
+            self._update_order()
+            return
+
+        sample = float(response.response_time_ms)
+        self._latency_ewma[provider_name] = self._ewma(self._latency_ewma, provider_name, sample)
+        if response.response_time_ms > 0:
+            tokens_per_sec = response.tokens_used * 1000 / response.response_time_ms
+            self._throughput_ewma[provider_name] = self._ewma(
+                self._throughput_ewma, provider_name, tokens_per_sec
+            )
+        self._update_order()
+
+    def _record_failure(self, provider_name: str) -> None:
+        """Update breaker and uptime metrics after a failed call."""
+        self._breakers[provider_name].record_failure()
+        self._uptime_ewma[provider_name] = self._ewma(self._uptime_ewma, provider_name, 0.0)
+        self._update_order()
+
+    @staticmethod
+    def _ewma(averages: dict, provider_name: str, sample: float) -> float:
+        """Blend a new sample into a provider's running average (first sample seeds it)."""
+        previous = averages.get(provider_name, sample)
+        return EWMA_ALPHA * sample + (1 - EWMA_ALPHA) * previous
+
+    @staticmethod
+    def _cache_key(
+        prompt: str,
+        model: Optional[str],
+        max_tokens: int,
+        task_type: str,
+        extra: dict
+    ) -> str:
+        """Build the response cache key for a deterministic request."""
+        payload = orjson.dumps(
+            {
+                "model": model,
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+                "task_type": task_type,
+                "extra": extra,
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    async def _cache_get(self, key: str) -> Optional[str]:
+        """Look up a cached response, checking memory first and then Redis."""
+        content = self._cache.get(key)
+        if content is not None:
+            self._cache.move_to_end(key)
+            self._cache_stats["hits"] += 1
+            return content
+
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(f"{CACHE_KEY_PREFIX}{key}")
+            except Exception as e:
+                logger.warning("LLM cache read from Redis failed: %s", e)
+                raw = None
+            if raw is not None:
+                content = raw.decode() if isinstance(raw, bytes) else raw
+                self._cache_local(key, content)
+                self._cache_stats["hits"] += 1
+                return content
+
+        self._cache_stats["misses"] += 1
+        return None
+
+    async def _cache_put(
+        self,
+        key: Optional[str],
+        content: str,
+        prompt: str,
+        semantic_context: Optional[str] = None
+    ) -> None:
+        """Store a response for a cacheable request (no-op when key is None)."""
+        if key is None:
+            return
+        self._cache_local(key, content)
+        if self._redis is not None:
+            try:
+                await self._redis.set(f"{CACHE_KEY_PREFIX}{key}", content, ex=self._cache_ttl)
+            except Exception as e:
+                logger.warning("LLM cache write to Redis failed: %s", e)
+        if semantic_context is not None:
+            try:
+                await self._semantic_cache.put(prompt, semantic_context, content)
+            except Exception as e:
+                logger.warning("Semantic LLM cache write failed: %s", e)
+
+    async def _semantic_get(self, prompt: str, semantic_context: str) -> Optional[str]:
+        """Look up a response cached for a semantically equivalent prompt."""
+        try:
+            content = await self._semantic_cache.get(prompt, semantic_context)
+        except Exception as e:
+            logger.warning("Semantic LLM cache read failed: %s", e)
+            return None
+        if content is not None:
+            self._cache_stats["semantic_hits"] += 1
+        return content
+
+    def _cache_local(self, key: str, content: str) -> None:
+        """Insert into the in-process LRU, evicting the oldest entry when full."""
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = content
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    async def warm_up(self, timeout: float = 2.0) -> None:
+        """Open keep-alive connections to every configured provider.
+
+        Issues a cheap HEAD request to each provider's base URL so DNS, TCP
+        and TLS setup happen before the first user request. Failures are
+        ignored; a cold connection is simply opened on first use instead.
+
+        Args:
+            timeout: Per-provider timeout in seconds
+        """
+        if not self.providers:
+            return
+
+        session = await self._http.get()
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        async def _warm(name: str, base_url: str) -> None:
+            try:
+                async with session.head(base_url, timeout=client_timeout):
+                    pass
+            except Exception as e:
+                logger.debug("Connection warm-up for %s failed: %s", name, type(e).__name__)
+
+        await asyncio.gather(*(
+            _warm(name, provider.config.base_url)
+            for name, provider in zip(self.provider_names, self.providers)
+        ))
+        logger.info("🔥 Warmed connections to %d provider(s)", len(self.providers))
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool (call on shutdown)."""
+        await self._http.aclose()
+
     def get_status(self) -> dict:
         """Get status of all configured providers and task-specific routing.
 
         Returns:
             Dictionary with provider availability and configuration
         """
+        if self._status_static is None:
+            self._status_static = self._build_static_status()
+        provider_entries, config_fields, task_routing = self._status_static
+
         status = {
             "providers_configured": len(self.providers),
             "providers": [
                 {
-                    "name": name,
-                    "available": True,
-                    "models": provider.get_supported_models(),
-                    "default_model": provider.config.default_model
+                    **entry,
+                    "available": self._breakers[entry["name"]].state != CircuitBreaker.OPEN,
+                    "circuit": self._breakers[entry["name"]].state,
                 }
-                for name, provider in zip(self.provider_names, self.providers)
+                for entry in provider_entries
             ],
-            "fallback_chain": " → ".join(self.provider_names) if self.provider_names else "None",
-            "strict_mode": self.strict_mode
+            **config_fields,
+            "latency_ewma_ms": {name: round(ms, 1) for name, ms in self._latency_ewma.items()},
+            "routing_scores": {name: round(self._score(name), 3) for name in self.provider_names},
+            "cache": {
+                **self._cache_stats,
+                "size": len(self._cache),
+                "backend": "redis" if self._redis is not None else "memory",
+            },
         }
 
-        # Add task-specific routing info
+        if task_routing:
+            status["task_routing"] = task_routing
+
+        return status
+
+    def _build_static_status(self) -> tuple:
+        """Build the parts of get_status() fixed at init: provider models and routing config.
+
+        Providers and task routing are only set up in __init__, so this runs
+        once; circuit state, EWMAs and cache stats are read fresh per call.
+        """
+        provider_entries = tuple(
+            {
+                "name": name,
+                "models": provider.get_supported_models(),
+                "default_model": provider.config.default_model
+            }
+            for name, provider in zip(self.provider_names, self.providers)
+        )
+
+        # Task-specific routing info
         task_routing = {}
         for task_type, cfg in self.task_config.items():
             if cfg["provider"] != "auto":
@@ -474,7 +1310,9 @@ class MultiProviderLLM:
                     "available": cfg["provider"] in self.provider_map
                 }
 
-        if task_routing:
-            status["task_routing"] = task_routing
-
-        return status
+        config_fields = {
+            "fallback_chain": " → ".join(self.provider_names) if self.provider_names else "None",
+            "strict_mode": self.strict_mode,
+            "routing_strategy": self.routing_strategy,
+        }
+        return provider_entries, config_fields, task_routing
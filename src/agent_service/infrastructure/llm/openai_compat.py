@@ -0,0 +1,81 @@
+"""Shared helpers for OpenAI-compatible chat completions APIs.
+
+OpenAI, Groq and Fireworks (and OpenRouter/local servers through the OpenAI
+provider) expose the same ``/chat/completions`` endpoint and server-sent
+event stream format.
+"""
+
+from typing import AsyncIterator, Optional
+
+import orjson
+
+from .base import BaseLLMProvider
+
+
+async def stream_chat_completions(
+    provider: BaseLLMProvider,
+    api_name: str,
+    prompt: str,
+    model: Optional[str] = None,
+    max_tokens: int = 1000,
+    temperature: float = 0.7,
+    **kwargs
+) -> AsyncIterator[str]:
+    """Stream content deltas from an OpenAI-compatible chat completions endpoint
+
+    Sends ``stream: true`` and yields each ``choices[0].delta.content`` from
+    the server-sent event stream as soon as it arrives.
+
+    Args:
+        provider: Provider whose config, session and timeout are used
+        api_name: API name for error messages (e.g. "OpenAI")
+        prompt: Input text prompt
+        model: Model override
+        max_tokens: Maximum tokens to generate
+        temperature: Sampling temperature
+        **kwargs: Extra request body fields
+
+    Yields:
+        Text chunks in generation order
+    """
+    effective_model = provider.get_effective_model(model)
+
+    headers = {
+        "Authorization": f"Bearer {provider.config.api_key}",
+        "Content-Type": "application/json",
+    }
+
+    payload = {
+        "model": effective_model,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "stream": True,
+    }
+    payload.update(kwargs)
+
+    session = await provider._get_session()
+    async with session.post(
+        f"{provider.config.base_url}/chat/completions",
+        headers=headers,
+        data=orjson.dumps(payload),
+        timeout=provider._timeout,
+    ) as response:
+
+        if response.status != 200:
+            error_text = await response.text()
+            raise Exception(
+                f"{api_name} API error {response.status}: {error_text}"
+            )
+
+        async for line in response.content:
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            chunk = orjson.loads(data)
+            for choice in chunk.get("choices") or ():
+                content = (choice.get("delta") or {}).get("content")
+                if content:
+                    yield content
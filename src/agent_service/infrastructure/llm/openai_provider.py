@@ -3,11 +3,10 @@
 Copied from monolith: faultmaven/infrastructure/llm/providers/openai_provider.py
 """
 
-import aiohttp
-import json
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 
 from .base import BaseLLMProvider, LLMResponse, ProviderConfig, ToolCall
+from .openai_compat import stream_chat_completions
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -73,64 +72,77 @@ class OpenAIProvider(BaseLLMProvider):
         payload.update(kwargs)
 
         # Make request
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.config.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-            ) as response:
-
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"OpenAI API error {response.status}: {error_text}"
-                    )
-
-                data = await response.json()
-
-                # Extract response content
-                if not data.get("choices") or len(data["choices"]) == 0:
-                    raise Exception("OpenAI API returned no choices")
-
-                message = data["choices"][0]["message"]
-
-                # Extract content (may be None if tool_calls present)
-                content = message.get("content", "")
-                if content:
-                    content = self._validate_response_content(content)
-
-                # Extract tool calls if present
-                tool_calls = None
-                if "tool_calls" in message and message["tool_calls"]:
-                    tool_calls = [
-                        ToolCall(
-                            id=tc["id"],
-                            type=tc["type"],
-                            function=tc["function"]
-                        )
-                        for tc in message["tool_calls"]
-                    ]
-
-                    # If tool_calls present but no content, parse function arguments as content
-                    if not content and tool_calls:
-                        try:
-                            content = tool_calls[0].function.get("arguments", "{}")
-                        except Exception:
-                            content = "{}"
-
-                # Extract token usage
-                usage = data.get("usage", {})
-                tokens_used = usage.get("total_tokens", 0)
-
-                response_time = self._get_response_time_ms()
-
-                return LLMResponse(
-                    content=content,
-                    confidence=self.config.confidence_score,
-                    provider=self.provider_name,
-                    model=effective_model,
-                    tokens_used=tokens_used,
-                    response_time_ms=response_time,
-                    tool_calls=tool_calls,
+        session = await self._get_session()
+        async with session.post(
+            f"{self.config.base_url}/chat/completions",
+            headers=headers,
+            json=payload,
+            timeout=self._timeout,
+        ) as response:
+
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(
+                    f"OpenAI API error {response.status}: {error_text}"
                 )
+
+            data = await response.json()
+
+            # Extract response content
+            if not data.get("choices") or len(data["choices"]) == 0:
+                raise Exception("OpenAI API returned no choices")
+
+            message = data["choices"][0]["message"]
+
+            # Extract content (may be None if tool_calls present)
+            content = message.get("content", "")
+            if content:
+                content = self._validate_response_content(content)
+
+            # Extract tool calls if present
+            tool_calls = None
+            if "tool_calls" in message and message["tool_calls"]:
+                tool_calls = [
+                    ToolCall(
+                        id=tc["id"],
+                        type=tc["type"],
+                        function=tc["function"]
+                    )
+                    for tc in message["tool_calls"]
+                ]
+
+                # If tool_calls present but no content, parse function arguments as content
+                if not content and tool_calls:
+                    try:
+                        content = tool_calls[0].function.get("arguments", "{}")
+                    except Exception:
+                        content = "{}"
+
+            # Extract token usage
+            usage = data.get("usage", {})
+            tokens_used = usage.get("total_tokens", 0)
+
+            response_time = self._get_response_time_ms()
+
+            return LLMResponse(
+                content=content,
+                confidence=self.config.confidence_score,
+                provider=self.provider_name,
+                model=effective_model,
+                tokens_used=tokens_used,
+                response_time_ms=response_time,
+                tool_calls=tool_calls,
+            )
+
+    def generate_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream content deltas from the OpenAI chat completions endpoint"""
+        return stream_chat_completions(
+            self, "OpenAI", prompt, model, max_tokens, temperature, **kwargs
+        )
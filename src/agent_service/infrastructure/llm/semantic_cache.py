@@ -0,0 +1,135 @@
+"""Semantic response cache for LLM calls.
+
+Answers prompts that are rephrasings of earlier ones ("capital of France" vs
+"France's capital") by embedding each prompt and returning the cached response
+of the nearest stored prompt when cosine similarity clears a threshold.
+
+Optional dependencies: faiss (vector index) and sentence-transformers
+(local embedding model). Without them the cache disables itself.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from agent_service.infrastructure.logging import get_logger
+
+# Try to import the vector search / embedding stack
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+    logging.info("faiss/sentence-transformers not available - semantic LLM cache disabled")
+
+logger = get_logger(__name__)
+
+
+class SemanticCache:
+    """Embedding-similarity cache over previous LLM responses
+
+    Entries are scoped by a context string (model, task type, system prompt,
+    ...) so a hit is only returned for an equivalent request. Each entry
+    expires ``ttl_seconds`` after insertion; expired entries are evicted
+    lazily from a min-heap ordered by expiry time.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "BAAI/bge-small-en-v1.5",
+        threshold: float = 0.92,
+        ttl_seconds: float = 3600,
+        max_entries: int = 10000,
+    ):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.available = SEMANTIC_CACHE_AVAILABLE
+
+        self._model = None
+        self._index = None
+        self._entries: Dict[int, Tuple[str, str]] = {}  # id -> (context, content)
+        self._expiry_heap: List[Tuple[float, int]] = []
+        self._next_id = 0
+        self._lock = asyncio.Lock()
+
+    async def get(self, prompt: str, context: str) -> Optional[str]:
+        """Return a cached response for a semantically equivalent prompt, if any
+
+        Args:
+            prompt: The prompt being sent
+            context: Scope the cached response must match
+
+        Returns:
+            Cached response content, or None on a miss
+        """
+        if not self.available or not self._entries:
+            return None
+
+        embedding = await self._embed(prompt)
+        async with self._lock:
+            self._evict_expired()
+            if not self._entries:
+                return None
+            scores, ids = self._index.search(embedding, min(4, len(self._entries)))
+
+        for score, entry_id in zip(scores[0], ids[0]):
+            if score < self.threshold:
+                break
+            entry = self._entries.get(int(entry_id))
+            if entry is not None and entry[0] == context:
+                return entry[1]
+        return None
+
+    async def put(self, prompt: str, context: str, content: str) -> None:
+        """Store a response under the prompt's embedding
+
+        Args:
+            prompt: The prompt that produced the response
+            context: Scope of the response
+            content: Response content
+        """
+        if not self.available:
+            return
+
+        embedding = await self._embed(prompt)
+        async with self._lock:
+            self._evict_expired()
+            if self._index is None:
+                self._index = faiss.IndexIDMap(faiss.IndexFlatIP(embedding.shape[1]))
+            if len(self._entries) >= self.max_entries:
+                # Drop the entry closest to expiry to make room
+                _, oldest = heapq.heappop(self._expiry_heap)
+                self._remove(oldest)
+
+            entry_id = self._next_id
+            self._next_id += 1
+            self._index.add_with_ids(embedding, np.array([entry_id], dtype="int64"))
+            self._entries[entry_id] = (context, content)
+            heapq.heappush(self._expiry_heap, (time.monotonic() + self.ttl_seconds, entry_id))
+
+    async def _embed(self, prompt: str):
+        """Embed a prompt as a normalised float32 row vector (cosine = inner product)"""
+        if self._model is None:
+            self._model = await asyncio.to_thread(SentenceTransformer, self.model_name)
+        embedding = await asyncio.to_thread(
+            self._model.encode, [prompt], normalize_embeddings=True
+        )
+        return np.asarray(embedding, dtype="float32")
+
+    def _evict_expired(self) -> None:
+        """Remove entries whose TTL has elapsed"""
+        now = time.monotonic()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, entry_id = heapq.heappop(self._expiry_heap)
+            self._remove(entry_id)
+
+    def _remove(self, entry_id: int) -> None:
+        """Remove one entry from the index and the entry table"""
+        if self._entries.pop(entry_id, None) is not None:
+            self._index.remove_ids(np.array([entry_id], dtype="int64"))
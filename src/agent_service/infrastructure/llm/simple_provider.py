@@ -29,6 +29,8 @@ class SimpleLLMProvider:
     - OPENAI_MODEL: Model to use (default: gpt-4o-mini)
     """
 
+    __slots__ = ("provider", "default_model")
+
     def __init__(self):
         """Initialize provider with environment configuration."""
         api_key = os.getenv("OPENAI_API_KEY")
@@ -8,6 +8,22 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_STUB_RESPONSE = """I understand you're troubleshooting an issue.
+
+To help you effectively, I need to gather more information:
+
+1. What specific problem are you experiencing?
+2. When did this issue first occur?
+3. Have there been any recent changes to the system?
+
+Please provide these details so I can begin investigating.
+
+[Note: This is a stub response from StubLLMProvider. Real LLM integration is TODO for Phase 6.]
+"""
+
+# The stub warning is identical on every call, so it is only logged once per process
+_warned = False
+
 
 class StubLLMProvider:
     """Stub LLM provider that returns placeholder responses.
@@ -18,14 +34,14 @@ class StubLLMProvider:
     TODO Phase 6: Implement real LLM provider with OpenAI/Anthropic/Fireworks routing.
     """
 
-    async def generate(
+    def generate_sync(
         self,
         prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 4000,
         **kwargs
     ) -> str:
-        """Generate a stub response.
+        """Generate a stub response without going through the event loop.
 
         Args:
             prompt: The prompt to send to the LLM
@@ -36,17 +52,32 @@ class StubLLMProvider:
         Returns:
             A placeholder response string
         """
-        logger.warning("Using StubLLMProvider - responses are placeholders only")
+        global _warned
+        if not _warned:
+            logger.warning("Using StubLLMProvider - responses are placeholders only")
+            _warned = True
 
-        return """I understand you're troubleshooting an issue.
+        return _STUB_RESPONSE
 
-To help you effectively, I need to gather more information:
+    async def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        **kwargs
+    ) -> str:
+        """Generate a stub response.
 
-1. What specific problem are you experiencing?
-2. When did this issue first occur?
-3. Have there been any recent changes to the system?
+        Awaits nothing; delegates to generate_sync(), which sync callers can
+        use directly.
 
-Please provide these details so I can begin investigating.
+        Args:
+            prompt: The prompt to send to the LLM
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
 
-[Note: This is a stub response from StubLLMProvider. Real LLM integration is TODO for Phase 6.]
-"""
+        Returns:
+            A placeholder response string
+        """
+        return self.generate_sync(prompt, temperature, max_tokens, **kwargs)
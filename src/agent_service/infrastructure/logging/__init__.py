@@ -6,7 +6,7 @@ and performance monitoring for the Agent Service.
 """
 
 from .context import RequestContext, request_context, PerformanceTracker, LoggingCoordinator
-from .config import LoggingConfig, get_logger
+from .config import LoggingConfig, get_logger, start_log_listener, stop_log_listener
 from .unified import UnifiedLogger, get_unified_logger
 from .middleware import LoggingMiddleware
 
@@ -17,6 +17,8 @@ __all__ = [
     'LoggingCoordinator',
     'LoggingConfig',
     'get_logger',
+    'start_log_listener',
+    'stop_log_listener',
     'UnifiedLogger',
     'get_unified_logger',
     'LoggingMiddleware',
@@ -6,10 +6,27 @@ and request context injection.
 """
 
 import logging
+import logging.handlers
 import os
-from typing import Dict, Any, Optional
+import queue
+import sys
+from functools import cache, lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+import orjson
 import structlog
 
+from .context import request_context
+
+
+# Log level names accepted in LOG_LEVEL
+_LEVELS: Dict[str, int] = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
 
 class LoggingConfig:
     """
@@ -23,7 +40,10 @@ class LoggingConfig:
     # Read environment variables at import time
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO').upper()
     LOG_FORMAT: str = os.getenv('LOG_FORMAT', 'json').lower()
-    LOG_DEDUPE: bool = os.getenv('LOG_DEDUPE', 'true').lower() == 'true'
+    LOG_FAST_PATH: bool = os.getenv('LOG_FAST_PATH', '0').lower() in ('1', 'true')
+    LOG_CAPTURE_STACK: bool = os.getenv('LOG_CAPTURE_STACK', 'false').lower() == 'true'
+    LOG_BATCH_THRESHOLD_MS: float = float(os.getenv('LOG_BATCH_THRESHOLD_MS', '10'))
+    _LEVEL: int = _LEVELS.get(LOG_LEVEL, logging.INFO)
 
     @classmethod
     def get_log_level(cls) -> int:
@@ -33,22 +53,38 @@ class LoggingConfig:
         Returns:
             Logging level constant (logging.DEBUG, logging.INFO, etc.)
         """
-        levels = {
-            'DEBUG': logging.DEBUG,
-            'INFO': logging.INFO,
-            'WARNING': logging.WARNING,
-            'ERROR': logging.ERROR,
-            'CRITICAL': logging.CRITICAL
-        }
-        return levels.get(cls.LOG_LEVEL, logging.INFO)
+        return cls._LEVEL
+
+
+def render_orjson_bytes(logger, method_name: str, event_dict: Dict[str, Any]) -> bytes:
+    """
+    Render the event dict as a JSON line using orjson, as bytes.
+
+    Used with structlog's BytesLogger so output is written without a decode.
+    Values orjson cannot serialize natively fall back to their repr().
+    """
+    return orjson.dumps(
+        event_dict,
+        default=repr,
+        option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def render_orjson(logger, method_name: str, event_dict: Dict[str, Any]) -> str:
+    """
+    Render the event dict as a JSON line using orjson.
+
+    Drop-in replacement for structlog's JSONRenderer with C-level encoding.
+    """
+    return render_orjson_bytes(logger, method_name, event_dict).decode()
 
 
 class AgentServiceLogger:
     """
     Logger configuration with request context injection and structured logging.
 
-    This class configures structlog with processors for request context injection,
-    deduplication, and JSON formatting. It ensures consistent log structure across
+    This class configures structlog with processors for request context injection
+    and JSON formatting. It ensures consistent log structure across
     all application components.
     """
 
@@ -61,14 +97,18 @@ class AgentServiceLogger:
         """
         Configure structlog with comprehensive processors.
 
-        Sets up a processor chain that handles:
+        Installs the processor chain built for this configuration (see
+        _build_processors), which handles:
         - Log level filtering
         - Logger name and level addition
         - Timestamp formatting
         - Exception information
         - Request context injection
-        - Field deduplication
         - JSON output formatting
+
+        With LOG_FAST_PATH=1, structlog writes directly to stdout and filters
+        levels in its own bound logger instead of dispatching every event
+        through stdlib logging (which then only serves third-party loggers).
         """
         # Configure standard library logging with environment-based level
         logging.basicConfig(
@@ -76,40 +116,21 @@ class AgentServiceLogger:
             level=self.config.get_log_level(),
         )
 
-        # Build processor list based on configuration
-        processors = [
-            # Standard processors
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-
-            # Always add request context
-            self.add_request_context,
-        ]
-
-        # Add deduplication processor if enabled
-        if self.config.LOG_DEDUPE:
-            processors.append(self.deduplicate_fields)
-
-        # Add appropriate renderer based on format
-        if self.config.LOG_FORMAT == 'json':
-            processors.append(structlog.processors.JSONRenderer())
-        elif self.config.LOG_FORMAT == 'console':
-            processors.append(structlog.dev.ConsoleRenderer())
+        if self.config.LOG_FAST_PATH:
+            if self.config.LOG_FORMAT == 'console':
+                logger_factory = structlog.WriteLoggerFactory(file=sys.stdout)
+            else:
+                logger_factory = structlog.BytesLoggerFactory(file=sys.stdout.buffer)
+            wrapper_class = structlog.make_filtering_bound_logger(self.config.get_log_level())
         else:
-            # Default to JSON for production
-            processors.append(structlog.processors.JSONRenderer())
+            logger_factory = structlog.stdlib.LoggerFactory()
+            wrapper_class = structlog.stdlib.BoundLogger
 
-        # Configure structlog with dynamic processor list
         structlog.configure(
-            processors=processors,
+            processors=_PROCESSORS,
             context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
+            logger_factory=logger_factory,
+            wrapper_class=wrapper_class,
             cache_logger_on_first_use=True,
         )
 
@@ -118,9 +139,10 @@ class AgentServiceLogger:
         """
         Add request context without duplication.
 
-        This processor injects request-scoped context into log entries,
-        ensuring consistent correlation tracking across all log messages
-        within a request.
+        Fallback for loggers that were not bound with the request context
+        (LoggingMiddleware binds it into its request logger). Fields already
+        on the event are kept; missing ones are filled from the active
+        RequestContext.
 
         Args:
             logger: Logger instance
@@ -130,52 +152,78 @@ class AgentServiceLogger:
         Returns:
             Enhanced event dictionary with request context
         """
-        # Import here to avoid circular imports
-        from .context import request_context
-
         ctx = request_context.get()
-        if ctx:
-            # Only add if not already present to prevent duplication
-            if 'correlation_id' not in event_dict:
-                event_dict['correlation_id'] = ctx.correlation_id
-            if 'session_id' not in event_dict and ctx.session_id:
-                event_dict['session_id'] = ctx.session_id
-            if 'user_id' not in event_dict and ctx.user_id:
-                event_dict['user_id'] = ctx.user_id
-            if 'case_id' not in event_dict and ctx.case_id:
-                event_dict['case_id'] = ctx.case_id
+        if ctx is None:
+            return event_dict
+
+        event_dict.setdefault('correlation_id', ctx.correlation_id)
+        if ctx.session_id:
+            event_dict.setdefault('session_id', ctx.session_id)
+        if ctx.user_id:
+            event_dict.setdefault('user_id', ctx.user_id)
+        if ctx.case_id:
+            event_dict.setdefault('case_id', ctx.case_id)
 
         return event_dict
 
-    @staticmethod
-    def deduplicate_fields(logger, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Remove duplicate fields from log entries.
 
-        This processor ensures that each field appears only once in the log entry,
-        preventing cluttered logs with repeated information.
+def _build_processors(config: Type[LoggingConfig]) -> Tuple[Callable, ...]:
+    """
+    Build the structlog processor chain for a logging configuration.
 
-        Args:
-            logger: Logger instance
-            method_name: Log method name
-            event_dict: Event dictionary to process
+    StackInfoRenderer is only included with LOG_CAPTURE_STACK=true, so
+    ``stack_info=True`` is ignored otherwise. Tracebacks from
+    ``logger.exception()`` always render: format_exc_info handles them for
+    JSON output, and ConsoleRenderer formats exc_info itself.
 
-        Returns:
-            Deduplicated event dictionary
-        """
-        seen = set()
-        deduped = {}
+    Args:
+        config: Logging configuration to build the chain for
+
+    Returns:
+        Processor chain, in order
+    """
+    if config.LOG_FAST_PATH:
+        # Level filtering and %-style positional args are handled by the
+        # filtering bound logger, so the stdlib processors are not needed
+        processors = [structlog.processors.add_log_level]
+    else:
+        processors = [
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+        ]
 
-        for key, value in event_dict.items():
-            if key not in seen:
-                deduped[key] = value
-                seen.add(key)
+    processors.append(structlog.processors.TimeStamper(fmt="iso"))
+    if config.LOG_CAPTURE_STACK:
+        processors.append(structlog.processors.StackInfoRenderer())
+    if config.LOG_FORMAT != 'console':
+        processors.append(structlog.processors.format_exc_info)
+    processors.append(structlog.processors.UnicodeDecoder())
 
-        return deduped
+    # Always add request context
+    processors.append(AgentServiceLogger.add_request_context)
 
+    # Add appropriate renderer based on format
+    if config.LOG_FORMAT == 'console':
+        processors.append(structlog.dev.ConsoleRenderer())
+    elif config.LOG_FAST_PATH:
+        processors.append(render_orjson_bytes)
+    else:
+        # JSON (the production default)
+        processors.append(render_orjson)
 
-# Singleton configuration instance
-_logger_config: Optional[AgentServiceLogger] = None
+    return tuple(processors)
+
+
+# The chain is fixed for the process's environment, so it is built once at import
+_PROCESSORS = _build_processors(LoggingConfig)
+
+
+@cache
+def _get_logger_config() -> AgentServiceLogger:
+    """Return the process-wide logger configuration, configuring structlog on first use."""
+    return AgentServiceLogger()
 
 
 def get_logger(name: str) -> structlog.BoundLogger:
@@ -184,7 +232,7 @@ def get_logger(name: str) -> structlog.BoundLogger:
 
     Factory function that ensures consistent logger configuration across
     the application. Uses singleton pattern to avoid reconfiguring structlog
-    multiple times.
+    multiple times, and returns the same logger instance for repeated names.
 
     Args:
         name: Logger name, typically module or class name
@@ -196,8 +244,60 @@ def get_logger(name: str) -> structlog.BoundLogger:
         >>> logger = get_logger(__name__)
         >>> logger.info("Operation completed", operation="test", duration=0.123)
     """
-    global _logger_config
-    if _logger_config is None:
-        _logger_config = AgentServiceLogger()
+    return _get_named_logger(name)
 
+
+@lru_cache(maxsize=512)
+def _get_named_logger(name: str) -> structlog.BoundLogger:
+    """Create the logger for ``name`` once; later calls reuse the same instance."""
+    config = _get_logger_config()
+
+    if config.config.LOG_FAST_PATH:
+        # Write/Bytes loggers carry no name; keep the field add_logger_name sets
+        return structlog.get_logger(name).bind(logger=name)
     return structlog.get_logger(name)
+
+
+# Background listener that owns the real root handlers while the app runs
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def start_log_listener() -> None:
+    """
+    Move root log handler I/O onto a background thread.
+
+    Replaces the root logger's handlers with a QueueHandler and starts a
+    QueueListener that writes records to the original handlers, so request
+    code only enqueues records instead of writing under the handler lock.
+    Call once at application startup; stop_log_listener() restores the
+    original handlers.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+
+    # Make sure basicConfig has installed the stream handler
+    _get_logger_config()
+
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    if not handlers:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    _queue_listener.start()
+
+
+def stop_log_listener() -> None:
+    """Flush queued records and restore the root logger's original handlers."""
+    global _queue_listener
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    logging.getLogger().handlers = list(_queue_listener.handlers)
+    _queue_listener = None
@@ -5,14 +5,84 @@ Provides request-scoped context tracking using contextvars for async operations.
 Simplified version suitable for microservice architecture.
 """
 
-from contextvars import ContextVar
-from typing import Dict, Any, Optional, Set
+from contextvars import ContextVar, Token
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-import uuid
+import os
+import threading
+import time
 
 
-@dataclass
+class _RandomPool:
+    """
+    Buffered source of random bytes for request IDs.
+
+    Reads os.urandom in 4 KiB blocks and hands out 16-byte slices, so
+    generating an ID is a slice and a hex format instead of a syscall plus a
+    uuid.UUID object per request.
+    """
+
+    _BLOCK_SIZE = 4096
+
+    def __init__(self):
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def next_id(self) -> str:
+        """Return a random ID formatted like a UUID4 string."""
+        with self._lock:
+            if self._pos + 16 > len(self._buf):
+                self._buf = os.urandom(self._BLOCK_SIZE)
+                self._pos = 0
+            raw = bytearray(self._buf[self._pos:self._pos + 16])
+            self._pos += 16
+        # Set the version (4) and variant bits so IDs stay valid UUIDs
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        h = raw.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+    def reset(self) -> None:
+        """Discard buffered bytes (after fork, so workers never share IDs)."""
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+
+_random_pool = _RandomPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_random_pool.reset)
+
+
+def new_correlation_id() -> str:
+    """Generate a new random correlation ID (UUID4 format)."""
+    return _random_pool.next_id()
+
+
+# Process-wide bit positions for operation keys. Keys are built from layer and
+# operation names, so the set is small; keys past _MAX_OP_BITS use a set instead.
+_OP_BITS: Dict[str, int] = {}
+_MAX_OP_BITS = 64
+_op_bits_lock = threading.Lock()
+
+
+def _op_bit(operation_key: str) -> int:
+    """Return the bit assigned to an operation key, or 0 if the registry is full."""
+    bit = _OP_BITS.get(operation_key)
+    if bit is None:
+        with _op_bits_lock:
+            bit = _OP_BITS.get(operation_key)
+            if bit is None:
+                if len(_OP_BITS) >= _MAX_OP_BITS:
+                    return 0
+                bit = _OP_BITS[operation_key] = 1 << len(_OP_BITS)
+    return bit
+
+
+@dataclass(slots=True)
 class RequestContext:
     """
     Request-scoped context for correlation tracking and logging coordination.
@@ -25,17 +95,21 @@ class RequestContext:
         session_id: Optional session identifier for user tracking
         user_id: Optional user identifier
         case_id: Optional troubleshooting case identifier
-        start_time: Request start timestamp for duration tracking
+        start_time: Request start timestamp (wall clock)
+        start_ns: Monotonic start time in nanoseconds for duration tracking
         attributes: Additional request-scoped metadata (extensible)
-        logged_operations: Set of logged operation keys for deduplication
+        logged_ops_mask: Bitmask of logged operation keys for deduplication
+        logged_operations: Logged operation keys that have no bit assigned
         performance_tracker: Performance monitoring with layer-specific thresholds
     """
-    correlation_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    correlation_id: str = field(default_factory=new_correlation_id)
     session_id: Optional[str] = None
     user_id: Optional[str] = None
     case_id: Optional[str] = None
     start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    start_ns: int = field(default_factory=time.monotonic_ns)
     attributes: Dict[str, Any] = field(default_factory=dict)
+    logged_ops_mask: int = 0
     logged_operations: Set[str] = field(default_factory=set)
     performance_tracker: Optional['PerformanceTracker'] = None
 
@@ -49,6 +123,9 @@ class RequestContext:
         Returns:
             True if operation has been logged, False otherwise
         """
+        bit = _op_bit(operation_key)
+        if bit:
+            return bool(self.logged_ops_mask & bit)
         return operation_key in self.logged_operations
 
     def mark_logged(self, operation_key: str) -> None:
@@ -58,7 +135,16 @@ class RequestContext:
         Args:
             operation_key: Unique key identifying the operation
         """
-        self.logged_operations.add(operation_key)
+        bit = _op_bit(operation_key)
+        if bit:
+            self.logged_ops_mask |= bit
+        else:
+            self.logged_operations.add(operation_key)
+
+    @property
+    def operations_logged(self) -> int:
+        """Number of distinct operations logged in this request."""
+        return self.logged_ops_mask.bit_count() + len(self.logged_operations)
 
     def __enter__(self):
         """Enter the context manager - set this context as active."""
@@ -71,6 +157,16 @@ class RequestContext:
         return False
 
 
+# Default performance thresholds (seconds) per layer. Read-only, since every
+# tracker shares this one mapping instead of copying it per request.
+LAYER_THRESHOLDS: Mapping[str, float] = MappingProxyType({
+    'api': 0.1,           # 100ms - API should be fast
+    'service': 0.5,       # 500ms - Service orchestration
+    'core': 0.3,          # 300ms - Core domain logic
+    'infrastructure': 1.0  # 1s - External calls can be slower
+})
+
+
 class PerformanceTracker:
     """
     Track performance metrics across layers with configurable thresholds.
@@ -80,15 +176,13 @@ class PerformanceTracker:
     monitoring and alerting.
     """
 
+    __slots__ = ('layer_timings', 'thresholds', 'violations')
+
     def __init__(self):
         """Initialize with default performance thresholds per layer."""
         self.layer_timings: Dict[str, float] = {}
-        self.thresholds = {
-            'api': 0.1,           # 100ms - API should be fast
-            'service': 0.5,       # 500ms - Service orchestration
-            'core': 0.3,          # 300ms - Core domain logic
-            'infrastructure': 1.0  # 1s - External calls can be slower
-        }
+        self.thresholds = LAYER_THRESHOLDS
+        self.violations = 0
 
     def record_timing(self, layer: str, operation: str, duration: float) -> tuple[bool, float]:
         """
@@ -107,6 +201,8 @@ class PerformanceTracker:
 
         threshold = self.thresholds.get(layer, 1.0)
         exceeds_threshold = duration > threshold
+        if exceeds_threshold:
+            self.violations += 1
 
         return exceeds_threshold, threshold
 
@@ -119,6 +215,15 @@ request_context: ContextVar[Optional[RequestContext]] = ContextVar(
 )
 
 
+# Logger method names for the level spellings callers use, so log_once can
+# skip the per-call level.lower()
+_LEVEL_METHODS: Dict[str, str] = {
+    name: name.lower()
+    for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+}
+_LEVEL_METHODS.update({name.lower(): name.lower() for name in list(_LEVEL_METHODS)})
+
+
 class LoggingCoordinator:
     """
     Coordinates all logging for a request lifecycle.
@@ -128,9 +233,12 @@ class LoggingCoordinator:
     each request has a single point of coordination for all logging activities.
     """
 
+    __slots__ = ('context', '_token')
+
     def __init__(self):
         """Initialize the logging coordinator."""
         self.context: Optional[RequestContext] = None
+        self._token: Optional[Token] = None
 
     def start_request(self, **initial_context) -> RequestContext:
         """
@@ -166,8 +274,9 @@ class LoggingCoordinator:
         # Initialize performance tracker
         self.context.performance_tracker = PerformanceTracker()
 
-        # Set as active context
-        request_context.set(self.context)
+        # Set as active context, keeping the token so end_request can restore
+        # the previous value without a second set()
+        self._token = request_context.set(self.context)
         return self.context
 
     def end_request(self) -> Dict[str, Any]:
@@ -183,31 +292,35 @@ class LoggingCoordinator:
         if not self.context:
             return {}
 
-        duration = (datetime.now(timezone.utc) - self.context.start_time).total_seconds()
+        duration = (time.monotonic_ns() - self.context.start_ns) * 1e-9
 
-        # Calculate performance violations
-        performance_violations = 0
-        if self.context.performance_tracker:
-            for timing_key, timing_value in self.context.performance_tracker.layer_timings.items():
-                layer = timing_key.split('.')[0]
-                threshold = self.context.performance_tracker.thresholds.get(layer, 1.0)
-                if timing_value > threshold:
-                    performance_violations += 1
+        # Performance violations are counted as timings are recorded
+        tracker = self.context.performance_tracker
+        performance_violations = tracker.violations if tracker else 0
 
         summary = {
             'correlation_id': self.context.correlation_id,
             'duration_seconds': duration,
-            'operations_logged': len(self.context.logged_operations),
+            'operations_logged': self.context.operations_logged,
             'performance_violations': performance_violations,
             **self.context.attributes
         }
 
         # Clear context
-        request_context.set(None)
+        self._restore_context()
         self.context = None
 
         return summary
 
+    def _restore_context(self) -> None:
+        """Reset request_context to its value from before start_request."""
+        token, self._token = self._token, None
+        try:
+            request_context.reset(token)
+        except (TypeError, ValueError):
+            # No token, or one created in another context: clear explicitly
+            request_context.set(None)
+
     @staticmethod
     def get_context() -> Optional[RequestContext]:
         """
@@ -235,9 +348,22 @@ class LoggingCoordinator:
             **extra: Additional fields to include in log
         """
         ctx = request_context.get()
-        if ctx and not ctx.has_logged(operation_key):
-            # Get the logging method for the specified level
-            log_method = getattr(logger, level.lower(), logger.info)
-            log_method(message, **extra)
-            # Mark as logged to prevent duplicates
-            ctx.mark_logged(operation_key)
+        if ctx is None:
+            return
+        # Inline has_logged/mark_logged: this runs for every coordinated log call
+        bit = _op_bit(operation_key)
+        if bit:
+            if ctx.logged_ops_mask & bit:
+                return
+        elif operation_key in ctx.logged_operations:
+            return
+
+        # Get the logging method for the specified level
+        log_method = getattr(logger, _LEVEL_METHODS.get(level) or level.lower(), logger.info)
+        log_method(message, **extra)
+
+        # Mark as logged to prevent duplicates
+        if bit:
+            ctx.logged_ops_mask |= bit
+        else:
+            ctx.logged_operations.add(operation_key)
@@ -1,21 +1,28 @@
 """
 Agent Service Logging Middleware
 
-FastAPI middleware for request-scoped logging context initialization.
+ASGI middleware for request-scoped logging context initialization.
 """
 
-import uuid
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Callable, Dict, List, Optional, Tuple
 
-from .context import LoggingCoordinator
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .context import LoggingCoordinator, new_correlation_id
 from .config import get_logger
 
 logger = get_logger(__name__)
 
+# Request headers that seed the logging context (ASGI header names are lowercase bytes)
+CONTEXT_HEADERS = {
+    b"x-correlation-id": "correlation_id",
+    b"x-session-id": "session_id",
+    b"x-user-id": "user_id",
+    b"x-case-id": "case_id",
+}
+
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware to initialize request-scoped logging context.
 
@@ -24,78 +31,119 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     - Initializes RequestContext with user/session information from headers
     - Ensures logging context is available throughout request lifecycle
     - Logs request summary at completion
+
+    Implemented as a plain ASGI middleware rather than BaseHTTPMiddleware, so
+    requests are not routed through an extra task group and memory stream.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and initialize logging context.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Extract context headers in a single pass over the raw header list
+        found = {}
+        for key, value in scope["headers"]:
+            name = CONTEXT_HEADERS.get(key)
+            if name is not None and name not in found:
+                found[name] = value.decode("latin-1")
+
+        await self.handle(scope, receive, send, found)
+
+    async def handle(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        found: Dict[str, str],
+        decorate_headers: Optional[Callable[[List[Tuple[bytes, bytes]]], None]] = None,
+    ) -> None:
+        """
+        Run an HTTP request inside a logging context.
 
-        Returns:
-            HTTP response
+        Split from __call__ so middleware that already scanned the request
+        headers can reuse the logging flow without a second pass.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+            found: Context header values keyed by CONTEXT_HEADERS names
+            decorate_headers: Optional callback that adds further response
+                headers to the raw header list at response start
         """
         # Initialize logging coordinator
         coordinator = LoggingCoordinator()
 
-        # Extract correlation ID from header or generate new one
-        correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
+        # Use correlation ID from header or generate new one
+        correlation_id = found.get("correlation_id") or new_correlation_id()
 
-        # Extract user/session info from headers (if available)
-        session_id = request.headers.get("X-Session-ID")
-        user_id = request.headers.get("X-User-ID")
-        case_id = request.headers.get("X-Case-ID")
+        # User/session info from headers (if available)
+        session_id = found.get("session_id")
+        user_id = found.get("user_id")
+        case_id = found.get("case_id")
 
         # Start request context
-        ctx = coordinator.start_request(
+        client = scope.get("client")
+        coordinator.start_request(
             correlation_id=correlation_id,
             session_id=session_id,
             user_id=user_id,
             case_id=case_id,
-            method=request.method,
-            path=request.url.path,
-            client_host=request.client.host if request.client else None
+            method=scope["method"],
+            path=scope["path"],
+            client_host=client[0] if client else None
         )
 
-        # Log request start
-        logger.info(
-            "Request started",
-            method=request.method,
-            path=request.url.path,
+        # Bind the request context once; events from this logger skip the
+        # per-event context injection processor
+        request_logger = logger.bind(
             correlation_id=correlation_id,
             session_id=session_id,
             user_id=user_id,
             case_id=case_id
         )
+        # Exposed to handlers as request.state.logger
+        scope.setdefault("state", {})["logger"] = request_logger
+
+        status_code = 500
+        correlation_header = (b"x-correlation-id", correlation_id.encode("latin-1"))
+
+        async def send_with_correlation_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add correlation ID to response headers for tracing; the raw
+                # header list is extended directly instead of via MutableHeaders
+                headers = message.setdefault("headers", [])
+                if not isinstance(headers, list):
+                    headers = message["headers"] = list(headers)
+                headers.append(correlation_header)
+                if decorate_headers is not None:
+                    decorate_headers(headers)
+            await send(message)
 
         try:
             # Process request
-            response = await call_next(request)
-
-            # Add correlation ID to response headers for tracing
-            response.headers["X-Correlation-ID"] = correlation_id
-
-            # End request and get summary
-            summary = coordinator.end_request()
-
-            # Log request summary
-            logger.info(
-                "Request completed",
-                status_code=response.status_code,
-                **summary
-            )
-
-            return response
+            await self.app(scope, receive, send_with_correlation_id)
 
         except Exception as e:
             # Log error
-            logger.error(
+            request_logger.error(
                 "Request failed",
                 error_message=str(e),
-                error_type=type(e).__name__,
-                correlation_id=correlation_id
+                error_type=type(e).__name__
             )
 
             # End request even on error
@@ -103,3 +151,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
             # Re-raise exception
             raise
+
+        # End request and get summary
+        summary = coordinator.end_request()
+
+        # Single log event per request: the summary carries method, path
+        # and client_host from the request context attributes
+        request_logger.info(
+            "Request completed",
+            status_code=status_code,
+            **summary
+        )
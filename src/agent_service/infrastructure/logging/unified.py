@@ -7,13 +7,33 @@ across all application layers with performance tracking.
 Simplified version suitable for microservice architecture.
 """
 
+import logging
+import sys
 import time
-from contextlib import asynccontextmanager, contextmanager
-from typing import Any, AsyncIterator, Dict, Iterator, Optional
-from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
-from .context import request_context, LoggingCoordinator
-from .config import get_logger
+from .context import request_context, LoggingCoordinator, _op_bit
+from .config import LoggingConfig, get_logger
+
+# Bound once so the hot paths skip the attribute lookup on the ContextVar
+_ctx_get = request_context.get
+
+# Successful operations faster than this are logged as one record instead of
+# a start/end pair (0 disables batching)
+_BATCH_THRESHOLD_S = LoggingConfig.LOG_BATCH_THRESHOLD_MS / 1000
+
+# Interned dedup keys for one operation: (operation, start, end, error)
+_OperationKeys = Tuple[str, str, str, str]
+
+
+def _iso_timestamp(t: float) -> str:
+    """Format a time.time() value like datetime.isoformat() in UTC, without a datetime."""
+    seconds = int(t)
+    return (
+        f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}"
+        f".{int((t - seconds) * 1e6):06d}+00:00"
+    )
 
 
 class UnifiedLogger:
@@ -43,7 +63,17 @@ class UnifiedLogger:
         """
         self.logger_name = logger_name
         self.layer = layer
-        self.logger = get_logger(logger_name)
+        # Bind the layer once; every event from this logger carries it
+        self.logger = get_logger(logger_name).bind(layer=layer)
+        self._operation_key_prefix = f"{layer}.operation."
+        self._boundary_prefix = f"{layer}.boundary."
+        # Interned dedup keys per operation / boundary crossing; the set of
+        # names a logger sees is small and fixed
+        self._op_key_cache: Dict[str, _OperationKeys] = {}
+        self._boundary_key_cache: Dict[Tuple[str, str], str] = {}
+        # Bound methods for operation events, resolved once
+        self._info = self.logger.info
+        self._warn = self.logger.warning
         self.coordinator = LoggingCoordinator()
 
     def log_boundary(
@@ -66,18 +96,28 @@ class UnifiedLogger:
             data: Optional data payload information (sanitized)
             **extra_fields: Additional fields to include in log
         """
-        # Generate unique operation key for deduplication
-        operation_key = f"{self.layer}.boundary.{operation}.{direction}"
-
-        # Check if already logged in current request context
-        ctx = request_context.get()
-        if ctx and ctx.has_logged(operation_key):
+        # Boundary events are INFO; skip key building and payload inspection
+        # entirely when INFO is filtered out
+        if LoggingConfig.get_log_level() > logging.INFO:
             return
 
+        # Generate unique operation key for deduplication
+        operation_key = self._boundary_key_cache.get((operation, direction))
+        if operation_key is None:
+            operation_key = sys.intern(f"{self._boundary_prefix}{operation}.{direction}")
+            self._boundary_key_cache[(operation, direction)] = operation_key
+
+        # Check if already logged in current request context (inlined
+        # has_logged: bitmask for registered keys, set for the overflow)
+        ctx = _ctx_get()
+        if ctx is not None:
+            bit = _op_bit(operation_key)
+            if (ctx.logged_ops_mask & bit) if bit else operation_key in ctx.logged_operations:
+                return
+
         # Prepare log data
         log_data = {
             "event_type": "service_boundary",
-            "layer": self.layer,
             "operation": operation,
             "direction": direction,
             "boundary_key": operation_key,
@@ -88,31 +128,21 @@ class UnifiedLogger:
         if data:
             log_data["payload_info"] = {
                 "type": type(data).__name__,
-                "size": len(str(data)) if data else 0,
-                "keys": list(data.keys()) if isinstance(data, dict) else None
+                # Shallow object size: str(data) would serialize the whole payload
+                "size": sys.getsizeof(data),
+                "keys": tuple(data) if isinstance(data, dict) else None
             }
 
-        # Log with deduplication
-        message = f"Service boundary {direction}: {operation}"
-        if ctx:
-            # Use coordinator for deduplication
-            LoggingCoordinator.log_once(
-                operation_key=operation_key,
-                logger=self.logger,
-                level="info",
-                message=message,
-                **log_data
-            )
-        else:
-            # Fallback logging without coordination
-            self.logger.info(message, **log_data)
+        self.logger.info(f"Service boundary {direction}: {operation}", **log_data)
 
-    @asynccontextmanager
-    async def operation(
-        self,
-        operation_name: str,
-        **context_fields
-    ) -> AsyncIterator[Dict[str, Any]]:
+        # Mark as logged to prevent duplicates
+        if ctx is not None:
+            if bit:
+                ctx.logged_ops_mask |= bit
+            else:
+                ctx.logged_operations.add(operation_key)
+
+    def operation(self, operation_name: str, **context_fields) -> "_OperationCM":
         """
         Context manager for unified operation logging with timing and error handling.
 
@@ -126,8 +156,9 @@ class UnifiedLogger:
             operation_name: Name of the operation being performed
             **context_fields: Additional context fields for the operation
 
-        Yields:
-            Dictionary containing operation context that can be updated during execution
+        Returns:
+            Context manager yielding a dictionary containing operation context
+            that can be updated during execution
 
         Example:
             >>> async with logger.operation("process_user_query", user_id="123") as ctx:
@@ -135,110 +166,9 @@ class UnifiedLogger:
             ...     result = await some_async_operation()
             ...     ctx["result_count"] = len(result)
         """
-        start_time = time.time()
-        operation_key = f"{self.layer}.operation.{operation_name}"
-
-        # Initialize operation context
-        operation_context = {
-            "operation": operation_name,
-            "layer": self.layer,
-            "start_time": datetime.now(timezone.utc).isoformat(),
-            **context_fields
-        }
-
-        # Get request context for coordination
-        request_ctx = request_context.get()
-
-        try:
-            # Log operation start (with deduplication)
-            start_key = f"{operation_key}.start"
-            if request_ctx and not request_ctx.has_logged(start_key):
-                self.logger.info(
-                    f"Operation started: {operation_name}",
-                    event_type="operation_start",
-                    operation_key=operation_key,
-                    **operation_context
-                )
-                request_ctx.mark_logged(start_key)
-            elif not request_ctx:
-                self.logger.info(
-                    f"Operation started: {operation_name}",
-                    event_type="operation_start",
-                    operation_key=operation_key,
-                    **operation_context
-                )
-
-            # Yield context for caller to modify
-            yield operation_context
-
-        except Exception as error:
-            # Calculate duration for error logging
-            duration = time.time() - start_time
-
-            # Log error
-            self.logger.error(
-                f"Operation failed: {operation_name}",
-                event_type="operation_error",
-                operation_key=operation_key,
-                error_message=str(error),
-                error_type=type(error).__name__,
-                duration_seconds=duration,
-                **operation_context
-            )
-
-            # Re-raise the exception
-            raise
-
-        else:
-            # Calculate final duration
-            duration = time.time() - start_time
-
-            # Record performance timing
-            performance_violation = False
-            threshold = 1.0  # Default threshold
+        return _OperationCM(self, operation_name, context_fields)
 
-            if request_ctx and request_ctx.performance_tracker:
-                violation, threshold = request_ctx.performance_tracker.record_timing(
-                    self.layer, operation_name, duration
-                )
-                performance_violation = violation
-
-            # Update context with final timing
-            operation_context.update({
-                "end_time": datetime.now(timezone.utc).isoformat(),
-                "duration_seconds": duration,
-                "performance_violation": performance_violation,
-                "threshold_seconds": threshold
-            })
-
-            # Log operation completion (with deduplication)
-            end_key = f"{operation_key}.end"
-            log_level = "warning" if performance_violation else "info"
-
-            if request_ctx and not request_ctx.has_logged(end_key):
-                log_method = getattr(self.logger, log_level)
-                log_method(
-                    f"Operation completed: {operation_name}",
-                    event_type="operation_end",
-                    operation_key=operation_key,
-                    **operation_context
-                )
-                request_ctx.mark_logged(end_key)
-            elif not request_ctx:
-                log_method = getattr(self.logger, log_level)
-                log_method(
-                    f"Operation completed: {operation_name}",
-                    event_type="operation_end",
-                    operation_key=operation_key,
-                    **operation_context
-                )
-
-    @contextmanager
-    def operation_sync(
-        self,
-        operation_name: str,
-        **context_fields
-    ) -> Iterator[Dict[str, Any]]:
+    def operation_sync(self, operation_name: str, **context_fields) -> "_OperationCM":
         """
         Synchronous version of operation context manager.
 
@@ -249,122 +179,40 @@ class UnifiedLogger:
             operation_name: Name of the operation being performed
             **context_fields: Additional context fields for the operation
 
-        Yields:
-            Dictionary containing operation context that can be updated during execution
+        Returns:
+            Context manager yielding a dictionary containing operation context
+            that can be updated during execution
         """
-        start_time = time.time()
-        operation_key = f"{self.layer}.operation.{operation_name}"
-
-        # Initialize operation context
-        operation_context = {
-            "operation": operation_name,
-            "layer": self.layer,
-            "start_time": datetime.now(timezone.utc).isoformat(),
-            **context_fields
-        }
-
-        # Get request context for coordination
-        request_ctx = request_context.get()
-
-        try:
-            # Log operation start (with deduplication)
-            start_key = f"{operation_key}.start"
-            if request_ctx and not request_ctx.has_logged(start_key):
-                self.logger.info(
-                    f"Operation started: {operation_name}",
-                    event_type="operation_start",
-                    operation_key=operation_key,
-                    **operation_context
-                )
-                request_ctx.mark_logged(start_key)
-            elif not request_ctx:
-                self.logger.info(
-                    f"Operation started: {operation_name}",
-                    event_type="operation_start",
-                    operation_key=operation_key,
-                    **operation_context
-                )
-
-            # Yield context for caller to modify
-            yield operation_context
-
-        except Exception as error:
-            # Calculate duration for error logging
-            duration = time.time() - start_time
-
-            # Log error
-            self.logger.error(
-                f"Operation failed: {operation_name}",
-                event_type="operation_error",
-                operation_key=operation_key,
-                error_message=str(error),
-                error_type=type(error).__name__,
-                duration_seconds=duration,
-                **operation_context
+        return _OperationCM(self, operation_name, context_fields)
+
+    def _operation_keys(self, operation_name: str) -> _OperationKeys:
+        """Return the interned (operation, start, end, error) dedup keys for an operation."""
+        keys = self._op_key_cache.get(operation_name)
+        if keys is None:
+            operation_key = f"{self._operation_key_prefix}{operation_name}"
+            keys = self._op_key_cache[operation_name] = (
+                sys.intern(operation_key),
+                sys.intern(f"{operation_key}.start"),
+                sys.intern(f"{operation_key}.end"),
+                sys.intern(f"{operation_key}.error"),
             )
-
-            # Re-raise the exception
-            raise
-
-        else:
-            # Calculate final duration
-            duration = time.time() - start_time
-
-            # Record performance timing
-            performance_violation = False
-            threshold = 1.0  # Default threshold
-
-            if request_ctx and request_ctx.performance_tracker:
-                violation, threshold = request_ctx.performance_tracker.record_timing(
-                    self.layer, operation_name, duration
-                )
-                performance_violation = violation
-
-            # Update context with final timing
-            operation_context.update({
-                "end_time": datetime.now(timezone.utc).isoformat(),
-                "duration_seconds": duration,
-                "performance_violation": performance_violation,
-                "threshold_seconds": threshold
-            })
-
-            # Log operation completion (with deduplication)
-            end_key = f"{operation_key}.end"
-            log_level = "warning" if performance_violation else "info"
-
-            if request_ctx and not request_ctx.has_logged(end_key):
-                log_method = getattr(self.logger, log_level)
-                log_method(
-                    f"Operation completed: {operation_name}",
-                    event_type="operation_end",
-                    operation_key=operation_key,
-                    **operation_context
-                )
-                request_ctx.mark_logged(end_key)
-            elif not request_ctx:
-                log_method = getattr(self.logger, log_level)
-                log_method(
-                    f"Operation completed: {operation_name}",
-                    event_type="operation_end",
-                    operation_key=operation_key,
-                    **operation_context
-                )
+        return keys
 
     def debug(self, message: str, **extra_fields) -> None:
         """Log debug message with layer context."""
-        self.logger.debug(message, layer=self.layer, **extra_fields)
+        self.logger.debug(message, **extra_fields)
 
     def info(self, message: str, **extra_fields) -> None:
         """Log info message with layer context."""
-        self.logger.info(message, layer=self.layer, **extra_fields)
+        self.logger.info(message, **extra_fields)
 
     def warning(self, message: str, **extra_fields) -> None:
         """Log warning message with layer context."""
-        self.logger.warning(message, layer=self.layer, **extra_fields)
+        self.logger.warning(message, **extra_fields)
 
     def error(self, message: str, error: Optional[Exception] = None, **extra_fields) -> None:
         """Log error message with optional exception details."""
-        error_data = {"layer": self.layer, **extra_fields}
+        error_data = extra_fields
 
         if error:
             error_data.update({
@@ -376,7 +224,7 @@ class UnifiedLogger:
 
     def critical(self, message: str, error: Optional[Exception] = None, **extra_fields) -> None:
         """Log critical message with optional exception details."""
-        error_data = {"layer": self.layer, **extra_fields}
+        error_data = extra_fields
 
         if error:
             error_data.update({
@@ -387,17 +235,215 @@ class UnifiedLogger:
         self.logger.critical(message, **error_data)
 
 
-# Global logger instances cache to avoid recreating loggers
-_logger_instances: Dict[str, UnifiedLogger] = {}
+def _has_logged(request_ctx, key: str) -> bool:
+    """Check whether ``key`` was already logged in the request, without marking it."""
+    bit = _op_bit(key)
+    if bit:
+        return bool(request_ctx.logged_ops_mask & bit)
+    return key in request_ctx.logged_operations
+
+
+def _first_time(request_ctx, key: str) -> bool:
+    """Check whether ``key`` is unlogged in the request, marking it logged if so."""
+    if request_ctx is None:
+        return True
+    bit = _op_bit(key)
+    if bit:
+        if request_ctx.logged_ops_mask & bit:
+            return False
+        request_ctx.logged_ops_mask |= bit
+    else:
+        if key in request_ctx.logged_operations:
+            return False
+        request_ctx.logged_operations.add(key)
+    return True
+
+
+def _emit_start(unified: UnifiedLogger, request_ctx, keys: _OperationKeys,
+                operation_context: Dict[str, Any], operation_name: str) -> None:
+    """Log operation start (with deduplication)."""
+    operation_key, start_key = keys[0], keys[1]
+    if _first_time(request_ctx, start_key):
+        # Event fields are set on the context itself so the emit expands a
+        # single dict instead of merging keywords with it
+        operation_context["event_type"] = "operation_start"
+        operation_context["operation_key"] = operation_key
+        unified._info(f"Operation started: {operation_name}", **operation_context)
+
+
+def _emit_error(unified: UnifiedLogger, request_ctx, keys: _OperationKeys,
+                operation_context: Dict[str, Any], operation_name: str,
+                error: BaseException, duration: float) -> None:
+    """Log a failed operation (with deduplication, so retry loops log one failure)."""
+    if not _first_time(request_ctx, keys[3]):
+        return
+
+    operation_context["event_type"] = "operation_error"
+    operation_context["operation_key"] = keys[0]
+    operation_context["error_message"] = str(error)
+    operation_context["error_type"] = type(error).__name__
+    operation_context["duration_seconds"] = duration
+    unified.logger.error(f"Operation failed: {operation_name}", **operation_context)
+
+
+def _emit_end(unified: UnifiedLogger, request_ctx, keys: _OperationKeys,
+              operation_context: Dict[str, Any], operation_name: str, layer: str,
+              duration: float, event_type: str = "operation_end") -> None:
+    """Record timing and log operation completion (with deduplication)."""
+    performance_violation = False
+    threshold = 1.0  # Default threshold
+
+    if request_ctx and request_ctx.performance_tracker:
+        performance_violation, threshold = request_ctx.performance_tracker.record_timing(
+            layer, operation_name, duration
+        )
+
+    # Nothing else to do when the completion was already logged in this request
+    if not _first_time(request_ctx, keys[2]):
+        return
+
+    # Update context with final timing. No end_time: the event's own
+    # timestamp already records when the operation completed.
+    operation_context["duration_seconds"] = duration
+    operation_context["performance_violation"] = performance_violation
+    operation_context["threshold_seconds"] = threshold
+    operation_context["event_type"] = event_type
+    operation_context["operation_key"] = keys[0]
+
+    log_method = unified._warn if performance_violation else unified._info
+    log_method(f"Operation completed: {operation_name}", **operation_context)
+
+
+class _OperationCM:
+    """
+    Context manager returned by UnifiedLogger.operation() and operation_sync().
+
+    Written as a plain class rather than with @asynccontextmanager/@contextmanager
+    so entering an operation does not create a generator and its wrapper object.
+    Supports both ``async with`` and ``with``.
+    """
+
+    __slots__ = (
+        "logger", "layer", "operation_name", "context_fields", "start_time",
+        "start_wall", "keys", "operation_context", "request_ctx", "quiet"
+    )
+
+    def __init__(self, logger: UnifiedLogger, operation_name: str, context_fields: Dict[str, Any]):
+        self.logger = logger
+        self.layer = logger.layer
+        self.operation_name = operation_name
+        self.context_fields = context_fields
+        self.start_time = 0
+        self.start_wall = 0.0
+        self.keys: _OperationKeys = ("", "", "", "")
+        self.operation_context: Dict[str, Any] = {}
+        self.request_ctx = None
+        self.quiet = False
+
+    def _enter(self) -> Dict[str, Any]:
+        self.start_time = time.monotonic_ns()
+        operation_name = self.operation_name
+        keys = self.keys = self.logger._operation_keys(operation_name)
+
+        # Get request context for coordination
+        request_ctx = self.request_ctx = _ctx_get()
+
+        # Start and end were both logged earlier in this request: nothing this
+        # operation does will be emitted on success, so skip building the context
+        if (request_ctx is not None
+                and _has_logged(request_ctx, keys[1])
+                and _has_logged(request_ctx, keys[2])):
+            self.quiet = True
+            self.operation_context = {"operation": operation_name, "layer": self.layer}
+            return self.operation_context
 
+        self.start_wall = time.time()
 
+        # Initialize operation context
+        self.operation_context = {
+            "operation": operation_name,
+            "layer": self.layer,
+            "start_time": _iso_timestamp(self.start_wall),
+            **self.context_fields
+        }
+
+        # With batching on, the start event is held until exit so fast
+        # operations can be logged as a single record
+        if _BATCH_THRESHOLD_S <= 0:
+            _emit_start(
+                self.logger, self.request_ctx, self.keys,
+                self.operation_context, operation_name
+            )
+
+        # Context for caller to modify
+        return self.operation_context
+
+    def _exit(self, exc_type, exc) -> bool:
+        duration = (time.monotonic_ns() - self.start_time) * 1e-9
+        if self.quiet:
+            # Errors have their own dedup key, so a first failure is still logged
+            if exc_type is not None and issubclass(exc_type, Exception):
+                self.operation_context.update(self.context_fields)
+                _emit_error(
+                    self.logger, self.request_ctx, self.keys, self.operation_context,
+                    self.operation_name, exc, duration
+                )
+            return False
+
+        if exc_type is None and duration < _BATCH_THRESHOLD_S:
+            # Fast operation: one record carrying both start_time and duration
+            _first_time(self.request_ctx, self.keys[1])
+            _emit_end(
+                self.logger, self.request_ctx, self.keys,
+                self.operation_context, self.operation_name, self.layer, duration,
+                event_type="operation"
+            )
+            return False
+
+        if _BATCH_THRESHOLD_S > 0:
+            # Slow or failed operation: flush the held start event first
+            _emit_start(
+                self.logger, self.request_ctx, self.keys,
+                self.operation_context, self.operation_name
+            )
+        if exc_type is None:
+            _emit_end(
+                self.logger, self.request_ctx, self.keys,
+                self.operation_context, self.operation_name, self.layer, duration
+            )
+        elif issubclass(exc_type, Exception):
+            _emit_error(
+                self.logger, self.request_ctx, self.keys, self.operation_context,
+                self.operation_name, exc, duration
+            )
+        # Never suppress the exception
+        return False
+
+    async def __aenter__(self) -> Dict[str, Any]:
+        return self._enter()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return self._exit(exc_type, exc)
+
+    def __enter__(self) -> Dict[str, Any]:
+        return self._enter()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return self._exit(exc_type, exc)
+
+
+_VALID_LAYERS = frozenset({"api", "service", "core", "infrastructure"})
+
+
+@lru_cache(maxsize=None)
 def get_unified_logger(name: str, layer: str) -> UnifiedLogger:
     """
     Factory function to get or create a unified logger instance.
 
     This function ensures that logger instances are reused for the same
     name and layer combination, preventing resource waste and maintaining
-    consistency.
+    consistency. Instances are cached with lru_cache, so the layer is only
+    validated the first time a (name, layer) pair is requested.
 
     Args:
         name: Logger name (typically module or class name)
@@ -411,19 +457,11 @@ def get_unified_logger(name: str, layer: str) -> UnifiedLogger:
         >>> async with logger.operation("process_data") as ctx:
         ...     ctx["items_processed"] = 10
     """
-    # Validate layer
-    valid_layers = {"api", "service", "core", "infrastructure"}
-    if layer not in valid_layers:
-        raise ValueError(f"Invalid layer '{layer}'. Must be one of: {valid_layers}")
-
-    # Create cache key
-    cache_key = f"{name}:{layer}"
-
-    # Return existing instance or create new one
-    if cache_key not in _logger_instances:
-        _logger_instances[cache_key] = UnifiedLogger(name, layer)
+    # Validate layer (only on cache miss)
+    if layer not in _VALID_LAYERS:
+        raise ValueError(f"Invalid layer '{layer}'. Must be one of: {set(_VALID_LAYERS)}")
 
-    return _logger_instances[cache_key]
+    return UnifiedLogger(name, layer)
 
 
 def clear_logger_cache() -> None:
@@ -433,5 +471,4 @@ def clear_logger_cache() -> None:
     This function is primarily used for testing to ensure clean state
     between test runs.
     """
-    global _logger_instances
-    _logger_instances.clear()
+    get_unified_logger.cache_clear()
@@ -5,24 +5,39 @@ Provides distributed tracing capabilities using Comet Opik with graceful
 fallback when unavailable. Simplified version for microservice architecture.
 """
 
+import importlib.util
 import logging
 import os
 import time
-from contextlib import contextmanager
+from contextlib import nullcontext
+from functools import cache
 from typing import Optional, Dict, Any
 
 from agent_service.infrastructure.logging import request_context, get_logger
 
-# Try to import Opik SDK
-try:
-    import opik
-    OPIK_AVAILABLE = True
-except ImportError:
-    OPIK_AVAILABLE = False
+# Locate the Opik SDK without importing it; the import happens in _init_opik,
+# so processes with tracing disabled never load Opik and its dependencies
+OPIK_AVAILABLE = importlib.util.find_spec("opik") is not None
+if not OPIK_AVAILABLE:
     logging.warning("Comet Opik SDK not available - tracing will be disabled")
 
 logger = get_logger(__name__)
 
+_ctx_get = request_context.get
+
+# Returned by trace() when tracing is off; nullcontext is reusable and yields None
+_NOOP_TRACE = nullcontext()
+
+
+def _parse_target_list(value: str) -> Optional[frozenset]:
+    """
+    Parse a comma-separated targeting list.
+
+    Returns:
+        Frozenset of non-empty entries, or None when no targeting is configured
+    """
+    return frozenset(item.strip() for item in value.split(",") if item.strip()) or None
+
 
 class OpikTracer:
     """
@@ -40,6 +55,7 @@ class OpikTracer:
     def __init__(self):
         """Initialize OpikTracer with environment-based configuration."""
         self.opik_available = OPIK_AVAILABLE
+        self._opik = None  # Opik module, imported on initialization
 
         # Read configuration from environment
         self.opik_url = os.getenv("OPIK_URL", "http://localhost:8080")
@@ -53,6 +69,11 @@ class OpikTracer:
         self.track_sessions = os.getenv("OPIK_TRACK_SESSIONS", "")  # Comma-separated list
         self.track_operations = os.getenv("OPIK_TRACK_OPERATIONS", "")  # Comma-separated list
 
+        # Parsed once; None means no targeting for that dimension
+        self._track_users_set = _parse_target_list(self.track_users)
+        self._track_sessions_set = _parse_target_list(self.track_sessions)
+        self._track_operations_set = _parse_target_list(self.track_operations)
+
         # Initialize Opik if available and not disabled
         if self.opik_available and not self.track_disable:
             try:
@@ -69,22 +90,28 @@ class OpikTracer:
         elif self.track_disable:
             logger.info("Opik tracing disabled by configuration")
 
+        # With no Opik SDK (or tracing disabled) every trace yields None, so
+        # trace() can skip timing, targeting checks and fallback logging
+        self._is_noop = not self.opik_available or self.track_disable
+
     def _init_opik(self):
         """Initialize Opik configuration."""
         if not OPIK_AVAILABLE:
             return
 
         try:
+            import opik
+
             # Configure Opik with environment settings
             opik.configure(
                 api_url=self.opik_url,
                 workspace=self.opik_workspace,
             )
+            self._opik = opik
         except Exception as e:
             logger.error(f"Opik configuration failed: {e}")
             raise
 
-    @contextmanager
     def trace(self, operation: str, **tags):
         """
         Create a trace context for an operation.
@@ -96,8 +123,9 @@ class OpikTracer:
             operation: Name of the operation being traced
             **tags: Additional tags to attach to the trace span
 
-        Yields:
-            Trace span object or None if tracing unavailable
+        Returns:
+            Context manager yielding the trace span object, or None if
+            tracing is unavailable
 
         Example:
             >>> tracer = get_tracer()
@@ -106,56 +134,9 @@ class OpikTracer:
             ...     if span:
             ...         span.log({"result_length": len(result)})
         """
-        start_time = time.time()
-        span = None
-
-        # Check if tracing should be enabled for this operation
-        if not self._should_trace(operation):
-            logger.debug(f"Tracing disabled for operation: {operation}")
-            yield None
-            self._record_fallback_metrics(operation, start_time)
-            return
-
-        if self.opik_available:
-            try:
-                # Get request context for correlation
-                ctx = request_context.get()
-
-                # Build trace tags
-                trace_tags = {
-                    "operation": operation,
-                    "project": self.opik_project,
-                    **tags
-                }
-
-                # Add correlation IDs from request context if available
-                if ctx:
-                    if ctx.correlation_id:
-                        trace_tags["correlation_id"] = ctx.correlation_id
-                    if ctx.session_id:
-                        trace_tags["session_id"] = ctx.session_id
-                    if ctx.user_id:
-                        trace_tags["user_id"] = ctx.user_id
-                    if ctx.case_id:
-                        trace_tags["case_id"] = ctx.case_id
-
-                # Create Opik span
-                span = opik.track(name=operation, tags=trace_tags)
-
-                with span:
-                    logger.debug(f"Opik trace started: {operation}")
-                    yield span
-
-            except Exception as e:
-                # Fallback - log warning but continue without tracing
-                logger.warning(f"Opik tracing failed for operation '{operation}': {e}")
-                self._record_fallback_metrics(operation, start_time, error=str(e))
-                yield None
-        else:
-            # No Opik available - use fallback logging
-            logger.debug(f"Fallback trace: {operation} (Opik unavailable)")
-            self._record_fallback_metrics(operation, start_time)
-            yield None
+        if self._is_noop:
+            return _NOOP_TRACE
+        return _TraceCM(self, operation, tags)
 
     def _should_trace(self, operation: str) -> bool:
         """
@@ -177,46 +158,41 @@ class OpikTracer:
         if self.track_disable:
             return False
 
+        # Check for targeted operation tracing first: it needs no request context
+        ops = self._track_operations_set
+        if ops is not None and operation not in ops:
+            return False  # Operation not in target list
+
+        users = self._track_users_set
+        sessions = self._track_sessions_set
+        if users is None and sessions is None:
+            return True
+
         # Get current request context for targeted tracing
-        ctx = request_context.get()
+        ctx = _ctx_get()
+        if ctx is None:
+            return False  # No request context, but targeting specific users/sessions
 
         # Check for targeted user tracing
-        if self.track_users:
-            target_user_list = [u.strip() for u in self.track_users.split(",") if u.strip()]
-            if target_user_list:
-                if not ctx or not ctx.user_id:
-                    return False  # No user context, but targeting specific users
-                if ctx.user_id not in target_user_list:
-                    return False  # User not in target list
+        if users is not None and ctx.user_id not in users:
+            return False  # No user context, or user not in target list
 
         # Check for targeted session tracing
-        if self.track_sessions:
-            target_session_list = [s.strip() for s in self.track_sessions.split(",") if s.strip()]
-            if target_session_list:
-                if not ctx or not ctx.session_id:
-                    return False  # No session context, but targeting specific sessions
-                if ctx.session_id not in target_session_list:
-                    return False  # Session not in target list
-
-        # Check for targeted operation tracing
-        if self.track_operations:
-            target_op_list = [op.strip() for op in self.track_operations.split(",") if op.strip()]
-            if target_op_list:
-                if operation not in target_op_list:
-                    return False  # Operation not in target list
+        if sessions is not None and ctx.session_id not in sessions:
+            return False  # No session context, or session not in target list
 
         return True  # Default to enabled if no restrictions apply
 
-    def _record_fallback_metrics(self, operation: str, start_time: float, error: Optional[str] = None):
+    def _record_fallback_metrics(self, operation: str, start_ns: int, error: Optional[str] = None):
         """
         Record fallback metrics when Opik is unavailable.
 
         Args:
             operation: Operation name
-            start_time: Operation start time
+            start_ns: Operation start time from time.monotonic_ns()
             error: Optional error message
         """
-        duration = time.time() - start_time
+        duration = (time.monotonic_ns() - start_ns) * 1e-9
 
         log_data = {
             "operation": operation,
@@ -263,10 +239,77 @@ class OpikTracer:
         return health
 
 
-# Singleton tracer instance
-_tracer: Optional[OpikTracer] = None
+class _TraceCM:
+    """
+    Context manager returned by OpikTracer.trace() when tracing is enabled.
+
+    A plain class rather than @contextmanager, so entering a trace does not
+    create a generator and its wrapper object.
+    """
+
+    __slots__ = ("tracer", "operation", "tags", "start_ns", "span", "error")
+
+    def __init__(self, tracer: OpikTracer, operation: str, tags: Dict[str, Any]):
+        self.tracer = tracer
+        self.operation = operation
+        self.tags = tags
+        self.start_ns = 0
+        self.span = None
+        self.error: Optional[str] = None
+
+    def __enter__(self):
+        self.start_ns = time.monotonic_ns()
+        tracer = self.tracer
+        operation = self.operation
+
+        # Check if tracing should be enabled for this operation
+        if not tracer._should_trace(operation):
+            logger.debug(f"Tracing disabled for operation: {operation}")
+            return None
+
+        try:
+            # Get request context for correlation
+            ctx = _ctx_get()
+
+            # Build trace tags
+            trace_tags = {
+                "operation": operation,
+                "project": tracer.opik_project,
+                **self.tags
+            }
+
+            # Add correlation IDs from request context if available
+            if ctx:
+                if ctx.correlation_id:
+                    trace_tags["correlation_id"] = ctx.correlation_id
+                if ctx.session_id:
+                    trace_tags["session_id"] = ctx.session_id
+                if ctx.user_id:
+                    trace_tags["user_id"] = ctx.user_id
+                if ctx.case_id:
+                    trace_tags["case_id"] = ctx.case_id
+
+            # Create Opik span
+            span = tracer._opik.track(name=operation, tags=trace_tags)
+            span.__enter__()
+            self.span = span
+            logger.debug(f"Opik trace started: {operation}")
+            return span
+
+        except Exception as e:
+            # Fallback - log warning but continue without tracing
+            logger.warning(f"Opik tracing failed for operation '{operation}': {e}")
+            self.error = str(e)
+            return None
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.span is not None:
+            return self.span.__exit__(exc_type, exc, tb)
+        self.tracer._record_fallback_metrics(self.operation, self.start_ns, error=self.error)
+        return False
 
 
+@cache
 def get_tracer() -> OpikTracer:
     """
     Get the global OpikTracer instance.
@@ -282,7 +325,4 @@ def get_tracer() -> OpikTracer:
         >>> with tracer.trace("my_operation") as span:
         ...     do_work()
     """
-    global _tracer
-    if _tracer is None:
-        _tracer = OpikTracer()
-    return _tracer
+    return OpikTracer()
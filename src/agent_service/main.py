@@ -4,15 +4,35 @@ FaultMaven Agent Service Microservice
 FaultMaven AI Agent Orchestration Microservice
 """
 
+import asyncio
+
+import orjson
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
+from agent_service.api.middleware import CombinedHttpMiddleware
 from agent_service.api.routes import agent
-from agent_service.infrastructure.logging import LoggingMiddleware, get_logger
+from agent_service.infrastructure.logging import (
+    get_logger,
+    start_log_listener,
+    stop_log_listener,
+)
 
 # Configure structured logging
 logger = get_logger(__name__)
 
+# Static endpoint bodies, serialized once; /health is polled by probes
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Agent Service",
+    "version": "0.1.0"
+})
+_ROOT_BODY = orjson.dumps({
+    "service": "Agent Service Service",
+    "version": "0.1.0",
+    "description": "FaultMaven AI Agent Orchestration Microservice"
+})
+
 # Create FastAPI application
 app = FastAPI(
     title="Agent Service",
@@ -20,24 +40,58 @@ app = FastAPI(
     version="2.0.0"
 )
 
-# Add logging middleware (must be first to capture all requests)
-app.add_middleware(LoggingMiddleware)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Logging context and CORS (any origin, method and header, with credentials)
+# in a single middleware layer. Preflight results are cached for a day so
+# browsers skip the extra OPTIONS round trip before each chat turn.
+app.add_middleware(CombinedHttpMiddleware, max_age=86400)
 
 # Register routers
 app.include_router(agent.router)
 
 
+@app.on_event("startup")
+async def start_logging_queue():
+    """Hand log handler I/O to a background thread so requests never block on it."""
+    start_log_listener()
+
+
+@app.on_event("shutdown")
+async def stop_logging_queue():
+    """Flush queued log records and restore the direct handlers."""
+    stop_log_listener()
+
+
+@app.on_event("startup")
+async def warm_llm_connections():
+    """Pre-open provider connections in the background so the first chat turn skips TLS setup.
+
+    Best effort: if the provider cannot be built (e.g. a strict-mode task
+    provider without an API key) startup continues and /health stays up;
+    the error surfaces on the chat route instead.
+    """
+    app.state.llm_warm_up = None
+    try:
+        llm = agent.get_llm_provider()
+    except Exception as e:
+        logger.warning("LLM connection warm-up skipped: %s: %s", type(e).__name__, e)
+        return
+    app.state.llm_warm_up = asyncio.create_task(llm.warm_up())
+
+
+@app.on_event("shutdown")
+async def close_llm_connections():
+    """Stop any pending warm-up, then close the pooled LLM provider connections."""
+    warm_up = getattr(app.state, "llm_warm_up", None)
+    if warm_up is not None:
+        warm_up.cancel()
+        await asyncio.gather(warm_up, return_exceptions=True)
+    if agent.get_llm_provider.cache_info().currsize:
+        await agent.get_llm_provider().aclose()
+
+
 @app.get(
     "/health",
+    response_class=Response,
     summary="Health Check",
     description="""
 Returns the health status of the Agent Service.
@@ -73,15 +127,12 @@ Returns the health status of the Agent Service.
 )
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "Agent Service",
-        "version": "0.1.0"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get(
     "/",
+    response_class=Response,
     summary="Service Information",
     description="""
 Returns service metadata and API information for the Agent Service.
@@ -117,13 +168,21 @@ Returns service metadata and API information for the Agent Service.
 )
 async def root():
     """Root endpoint."""
-    return {
-        "service": "Agent Service Service",
-        "version": "0.1.0",
-        "description": "FaultMaven AI Agent Orchestration Microservice"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
+    import importlib.util
+
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # uvloop/httptools come with uvicorn[standard]; fall back for bare installs
+    has_uvloop = importlib.util.find_spec("uvloop") is not None
+    has_httptools = importlib.util.find_spec("httptools") is not None
+    uvicorn.run(
+        "agent_service.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if has_uvloop else "asyncio",
+        http="httptools" if has_httptools else "h11",
+    )
@@ -30,7 +30,7 @@ def test_request_context_creation():
     assert ctx.session_id == "test-session"
     assert ctx.user_id == "test-user"
     assert ctx.case_id == "test-case"
-    assert len(ctx.logged_operations) == 0
+    assert ctx.operations_logged == 0
 
 
 def test_request_context_deduplication():
@@ -47,6 +47,7 @@ def test_request_context_deduplication():
 
     # Second check should return True
     assert ctx.has_logged(operation_key)
+    assert ctx.operations_logged == 1
 
 
 def test_request_context_as_context_manager():
@@ -67,6 +68,22 @@ def test_request_context_as_context_manager():
     assert request_context.get() is None
 
 
+def test_add_request_context_keeps_bound_correlation_id():
+    """Test that a bound correlation_id still gets the other context fields."""
+    from agent_service.infrastructure.logging.config import AgentServiceLogger
+
+    ctx = RequestContext(session_id="test-session", user_id="test-user", case_id="test-case")
+    with ctx:
+        event = AgentServiceLogger.add_request_context(
+            None, "info", {"event": "bound", "correlation_id": "bound-id"}
+        )
+
+    assert event["correlation_id"] == "bound-id"
+    assert event["session_id"] == "test-session"
+    assert event["user_id"] == "test-user"
+    assert event["case_id"] == "test-case"
+
+
 def test_logging_coordinator_lifecycle():
     """Test LoggingCoordinator request lifecycle management."""
     coordinator = LoggingCoordinator()
@@ -175,6 +192,18 @@ async def test_logging_middleware_integration():
         assert "X-Correlation-ID" in response.headers
         assert response.headers["X-Correlation-ID"] == "test-correlation-789"
 
+    # Lifespan scopes pass straight through without a request context
+    seen = []
+
+    async def lifespan_app(scope, receive, send):
+        seen.append((scope["type"], request_context.get(), send))
+
+    async def noop_send(message):
+        pass
+
+    await LoggingMiddleware(lifespan_app)({"type": "lifespan"}, None, noop_send)
+    assert seen == [("lifespan", None, noop_send)]
+
 
 def test_performance_tracker():
     """Test PerformanceTracker with layer-specific thresholds."""
@@ -201,3 +230,24 @@ def test_performance_tracker():
     assert "api.fast_op" in tracker.layer_timings
     assert "api.slow_op" in tracker.layer_timings
     assert "infrastructure.external_call" in tracker.layer_timings
+
+    # Violations are counted as they are recorded
+    assert tracker.violations == 1
+
+
+def test_unified_logger_failed_operation_logged_once():
+    """Test a failing operation retried within one request logs start and error once."""
+    logger = get_unified_logger(__name__, "core")
+
+    coordinator = LoggingCoordinator()
+    ctx = coordinator.start_request()
+
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            with logger.operation_sync("flaky_lookup"):
+                raise KeyError("missing")
+
+    # One start and one error key, regardless of retries
+    assert ctx.operations_logged == 2
+
+    coordinator.end_request()
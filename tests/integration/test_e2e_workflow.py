@@ -15,11 +15,35 @@ import os
 import pytest
 from typing import Optional
 
+import aiohttp
+
 # Test configuration
 AUTH_SERVICE_URL = os.getenv("FM_AUTH_SERVICE_URL", "http://localhost:8001")
 CASE_SERVICE_URL = os.getenv("FM_CASE_SERVICE_URL", "http://localhost:8000")
 AGENT_SERVICE_URL = os.getenv("FM_AGENT_SERVICE_URL", "http://localhost:8000")
 
+
+def _new_session() -> aiohttp.ClientSession:
+    """Create a client session with a keep-alive connection pool."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30),
+        timeout=aiohttp.ClientTimeout(total=10)
+    )
+
+
+async def _check_status(response: aiohttp.ClientResponse, expected: int, message: str) -> None:
+    """Fail with the response body, which is only read when the status is wrong."""
+    if response.status != expected:
+        raise AssertionError(f"{message}: HTTP {response.status}: {await response.text()}")
+
+
+@pytest.fixture
+async def http_session():
+    """Shared HTTP session so a test's requests reuse pooled connections."""
+    async with _new_session() as session:
+        yield session
+
+
 # Test user
 TEST_USER = {
     "username": "test_user_qa",
@@ -38,164 +62,146 @@ class TestE2EWorkflow:
         self.user_id: Optional[str] = None
         self.case_id: Optional[str] = None
 
-    async def test_01_user_registration(self):
+    async def test_01_user_registration(self, http_session):
         """Test user registration flow."""
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            response = await session.post(
-                f"{AUTH_SERVICE_URL}/api/v1/auth/dev-register",
-                json=TEST_USER
+        response = await http_session.post(
+            f"{AUTH_SERVICE_URL}/api/v1/auth/dev-register",
+            json=TEST_USER
+        )
+
+        # Accept both 201 (new user) and 409 (user exists) as valid
+        if response.status == 409:
+            # User already exists, login instead
+            response = await http_session.post(
+                f"{AUTH_SERVICE_URL}/api/v1/auth/dev-login",
+                json={"username": TEST_USER["username"]}
             )
+            await _check_status(response, 200, "Login after user exists failed")
+            print(f"⚠️  User already exists, logged in instead")
+        else:
+            await _check_status(response, 201, "Registration failed")
+            print(f"✅ User registered")
 
-            # Accept both 201 (new user) and 409 (user exists) as valid
-            if response.status == 409:
-                # User already exists, login instead
-                response = await session.post(
-                    f"{AUTH_SERVICE_URL}/api/v1/auth/dev-login",
-                    json={"username": TEST_USER["username"]}
-                )
-                assert response.status == 200, f"Login after user exists failed: {await response.text()}"
-                print(f"⚠️  User already exists, logged in instead")
-            else:
-                assert response.status == 201, f"Registration failed: {await response.text()}"
-                print(f"✅ User registered")
-
-            data = await response.json()
-            assert "access_token" in data
-            assert "user" in data
-            assert data["user"]["username"] == TEST_USER["username"]
+        data = await response.json()
+        assert "access_token" in data
+        assert "user" in data
+        assert data["user"]["username"] == TEST_USER["username"]
 
-            self.access_token = data["access_token"]
-            self.user_id = data["user"]["user_id"]
+        self.access_token = data["access_token"]
+        self.user_id = data["user"]["user_id"]
 
-            print(f"✅ User ID: {self.user_id}")
+        print(f"✅ User ID: {self.user_id}")
 
-    async def test_02_user_login(self):
+    async def test_02_user_login(self, http_session):
         """Test user login flow."""
-        import aiohttp
+        response = await http_session.post(
+            f"{AUTH_SERVICE_URL}/api/v1/auth/dev-login",
+            json={"username": TEST_USER["username"]}
+        )
 
-        async with aiohttp.ClientSession() as session:
-            response = await session.post(
-                f"{AUTH_SERVICE_URL}/api/v1/auth/dev-login",
-                json={"username": TEST_USER["username"]}
-            )
+        await _check_status(response, 200, "Login failed")
 
-            assert response.status == 200, f"Login failed: {await response.text()}"
+        data = await response.json()
+        assert "access_token" in data
 
-            data = await response.json()
-            assert "access_token" in data
+        self.access_token = data["access_token"]
+        self.user_id = data["user"]["user_id"]
 
-            self.access_token = data["access_token"]
-            self.user_id = data["user"]["user_id"]
+        print(f"✅ User logged in: {self.user_id}")
 
-            print(f"✅ User logged in: {self.user_id}")
-
-    async def test_03_create_case(self):
+    async def test_03_create_case(self, http_session):
         """Test case creation."""
-        import aiohttp
-
         if not self.access_token:
             pytest.skip("No access token - run login test first")
 
-        async with aiohttp.ClientSession() as session:
-            response = await session.post(
-                f"{CASE_SERVICE_URL}/api/v1/cases",
-                headers={"X-User-ID": self.user_id},
-                json={
-                    "title": "QA Test: Redis Connection Timeouts",
-                    "description": "Testing case creation for QA",
-                    "severity": "high"
-                }
-            )
+        response = await http_session.post(
+            f"{CASE_SERVICE_URL}/api/v1/cases",
+            headers={"X-User-ID": self.user_id},
+            json={
+                "title": "QA Test: Redis Connection Timeouts",
+                "description": "Testing case creation for QA",
+                "severity": "high"
+            }
+        )
 
-            assert response.status == 201, f"Case creation failed: {await response.text()}"
+        await _check_status(response, 201, "Case creation failed")
 
-            data = await response.json()
-            assert "case_id" in data
-            assert data["title"] == "QA Test: Redis Connection Timeouts"
+        data = await response.json()
+        assert "case_id" in data
+        assert data["title"] == "QA Test: Redis Connection Timeouts"
 
-            self.case_id = data["case_id"]
+        self.case_id = data["case_id"]
 
-            print(f"✅ Case created: {self.case_id}")
+        print(f"✅ Case created: {self.case_id}")
 
-    async def test_04_agent_chat(self):
+    async def test_04_agent_chat(self, http_session):
         """Test agent chat endpoint."""
-        import aiohttp
-
         if not self.case_id:
             pytest.skip("No case - run case creation test first")
 
-        async with aiohttp.ClientSession() as session:
-            response = await session.post(
-                f"{AGENT_SERVICE_URL}/api/v1/agent/chat/{self.case_id}",
-                headers={"X-User-ID": self.user_id},
-                json={
-                    "message": "I'm experiencing Redis connection timeouts. Can you help?"
-                }
-            )
+        response = await http_session.post(
+            f"{AGENT_SERVICE_URL}/api/v1/agent/chat/{self.case_id}",
+            headers={"X-User-ID": self.user_id},
+            json={
+                "message": "I'm experiencing Redis connection timeouts. Can you help?"
+            }
+        )
 
-            # May fail if LLM not configured - that's OK for testing structure
-            if response.status == 200:
-                data = await response.json()
-                assert "agent_response" in data
-                assert "turn_number" in data
-                print(f"✅ Agent chat successful: turn {data['turn_number']}")
-            elif response.status == 500:
-                error = await response.text()
-                if "OPENAI_API_KEY" in error or "not available" in error:
-                    print("⚠️  Agent chat skipped: LLM not configured (expected in test environment)")
-                    pytest.skip("LLM not configured")
-                else:
-                    pytest.fail(f"Agent chat failed: {error}")
+        # May fail if LLM not configured - that's OK for testing structure
+        if response.status == 200:
+            data = await response.json()
+            assert "agent_response" in data
+            assert "turn_number" in data
+            print(f"✅ Agent chat successful: turn {data['turn_number']}")
+        elif response.status == 500:
+            error = await response.text()
+            if "OPENAI_API_KEY" in error or "not available" in error:
+                print("⚠️  Agent chat skipped: LLM not configured (expected in test environment)")
+                pytest.skip("LLM not configured")
             else:
-                pytest.fail(f"Unexpected status {response.status}: {await response.text()}")
+                pytest.fail(f"Agent chat failed: {error}")
+        else:
+            pytest.fail(f"Unexpected status {response.status}: {await response.text()}")
 
-    async def test_05_add_evidence(self):
+    async def test_05_add_evidence(self, http_session):
         """Test adding evidence to case."""
-        import aiohttp
-
         if not self.case_id:
             pytest.skip("No case - run case creation test first")
 
-        async with aiohttp.ClientSession() as session:
-            response = await session.post(
-                f"{CASE_SERVICE_URL}/api/v1/cases/{self.case_id}/data",
-                headers={"X-User-ID": self.user_id},
-                json={
-                    "content": "ERROR: Connection timeout to redis://prod:6379",
-                    "source": "application logs",
-                    "category": "error_message"
-                }
-            )
+        response = await http_session.post(
+            f"{CASE_SERVICE_URL}/api/v1/cases/{self.case_id}/data",
+            headers={"X-User-ID": self.user_id},
+            json={
+                "content": "ERROR: Connection timeout to redis://prod:6379",
+                "source": "application logs",
+                "category": "error_message"
+            }
+        )
 
-            assert response.status == 200, f"Add evidence failed: {await response.text()}"
+        await _check_status(response, 200, "Add evidence failed")
 
-            print(f"✅ Evidence added to case {self.case_id}")
+        print(f"✅ Evidence added to case {self.case_id}")
 
-    async def test_06_close_case(self):
+    async def test_06_close_case(self, http_session):
         """Test closing a case."""
-        import aiohttp
-
         if not self.case_id:
             pytest.skip("No case - run case creation test first")
 
-        async with aiohttp.ClientSession() as session:
-            response = await session.post(
-                f"{CASE_SERVICE_URL}/api/v1/cases/{self.case_id}/close",
-                headers={"X-User-ID": self.user_id},
-                json={
-                    "reason": "QA test completed",
-                    "resolution_notes": "Test case closed successfully"
-                }
-            )
+        response = await http_session.post(
+            f"{CASE_SERVICE_URL}/api/v1/cases/{self.case_id}/close",
+            headers={"X-User-ID": self.user_id},
+            json={
+                "reason": "QA test completed",
+                "resolution_notes": "Test case closed successfully"
+            }
+        )
 
-            assert response.status == 200, f"Close case failed: {await response.text()}"
+        await _check_status(response, 200, "Close case failed")
 
-            data = await response.json()
-            assert data["status"] == "closed"
+        data = await response.json()
+        assert data["status"] == "closed"
 
-            print(f"✅ Case closed: {self.case_id}")
+        print(f"✅ Case closed: {self.case_id}")
 
 
 @pytest.mark.asyncio
@@ -205,10 +211,9 @@ async def test_full_e2e_workflow():
     Note: This test requires all FaultMaven services to be running.
     It will skip if services are not available.
     """
-    import aiohttp
-
-    # Check if services are available
-    async with aiohttp.ClientSession() as session:
+    # One session for the whole workflow, so every step reuses pooled connections
+    async with _new_session() as session:
+        # Check if services are available
         try:
             response = await session.get(f"{AUTH_SERVICE_URL}/health", timeout=aiohttp.ClientTimeout(total=2))
             if response.status != 200:
@@ -216,29 +221,42 @@ async def test_full_e2e_workflow():
         except (aiohttp.ClientConnectorError, asyncio.TimeoutError):
             pytest.skip("Auth service not available - services must be running for E2E tests")
 
-    test_instance = TestE2EWorkflow()
-
-    # Initialize instance variables (don't call the fixture)
-    test_instance.access_token = None
-    test_instance.user_id = None
-    test_instance.case_id = None
-
-    try:
-        # Run tests in sequence
-        await test_instance.test_01_user_registration()
-        await test_instance.test_03_create_case()
-        await test_instance.test_04_agent_chat()
-        await test_instance.test_05_add_evidence()
-        await test_instance.test_06_close_case()
-
-        print("\n✅ Full E2E workflow test PASSED")
-
-    except aiohttp.ClientConnectorError as e:
-        # Service not available - skip test
-        pytest.skip(f"Service not available - services must be running for E2E tests: {e}")
-    except Exception as e:
-        print(f"\n❌ E2E workflow test FAILED: {e}")
-        raise
+        test_instance = TestE2EWorkflow()
+
+        # Initialize instance variables (don't call the fixture)
+        test_instance.access_token = None
+        test_instance.user_id = None
+        test_instance.case_id = None
+
+        try:
+            # Run tests in sequence
+            await test_instance.test_01_user_registration(session)
+            await test_instance.test_03_create_case(session)
+            # Chat and evidence upload only need the case, so run them concurrently.
+            # Both run to completion before a skip or failure is acted on, so
+            # neither step is left running against a closing session.
+            outcomes = await asyncio.gather(
+                test_instance.test_04_agent_chat(session),
+                test_instance.test_05_add_evidence(session),
+                return_exceptions=True,
+            )
+            errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+            for error in errors:
+                if not isinstance(error, pytest.skip.Exception):
+                    raise error
+            # A skip (e.g. no LLM configured) still closes the case first
+            await test_instance.test_06_close_case(session)
+            if errors:
+                raise errors[0]
+
+            print("\n✅ Full E2E workflow test PASSED")
+
+        except aiohttp.ClientConnectorError as e:
+            # Service not available - skip test
+            pytest.skip(f"Service not available - services must be running for E2E tests: {e}")
+        except Exception as e:
+            print(f"\n❌ E2E workflow test FAILED: {e}")
+            raise
 
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+"""Unit tests for PermissiveCORSMiddleware
+
+Verifies the hand-written middleware answers like Starlette's CORSMiddleware
+configured to allow everything with credentials.
+"""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from agent_service.api.cors import PermissiveCORSMiddleware
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(PermissiveCORSMiddleware, max_age=86400)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_simple_request_echoes_origin():
+    """Credentialed CORS echoes the request origin instead of '*'"""
+    async with AsyncClient(transport=ASGITransport(app=_make_app()), base_url="http://test") as client:
+        response = await client.get("/ping", headers={"Origin": "http://ui.example"})
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://ui.example"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["vary"] == "Origin"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_preflight_mirrors_requested_headers():
+    """Preflight is answered without reaching the route"""
+    async with AsyncClient(transport=ASGITransport(app=_make_app()), base_url="http://test") as client:
+        response = await client.options(
+            "/ping",
+            headers={
+                "Origin": "http://ui.example",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "X-Session-Id",
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.text == "OK"
+    assert response.headers["access-control-allow-origin"] == "http://ui.example"
+    assert response.headers["access-control-allow-headers"] == "X-Session-Id"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-max-age"] == "86400"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_combined_middleware_adds_correlation_and_cors_headers():
+    """CombinedHttpMiddleware stamps both header sets in one layer"""
+    from agent_service.api.middleware import CombinedHttpMiddleware
+    from agent_service.infrastructure.logging import request_context
+
+    app = FastAPI()
+    app.add_middleware(CombinedHttpMiddleware, max_age=86400)
+
+    @app.get("/ping")
+    async def ping():
+        return {"session_id": request_context.get().session_id}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(
+            "/ping",
+            headers={
+                "Origin": "http://ui.example",
+                "X-Correlation-ID": "corr-123",
+                "X-Session-ID": "sess-1",
+            },
+        )
+        preflight = await client.options(
+            "/ping",
+            headers={"Origin": "http://ui.example", "Access-Control-Request-Method": "POST"},
+        )
+
+    assert response.json() == {"session_id": "sess-1"}
+    assert response.headers["x-correlation-id"] == "corr-123"
+    assert response.headers["access-control-allow-origin"] == "http://ui.example"
+    assert response.headers["vary"] == "Origin"
+
+    assert preflight.status_code == 200
+    assert preflight.headers["access-control-max-age"] == "86400"
+    assert "x-correlation-id" not in preflight.headers
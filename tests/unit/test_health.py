@@ -19,3 +19,26 @@ class TestHealthCheck:
     def test_basic_math(self):
         """Sanity check: basic arithmetic works"""
         assert 2 + 2 == 4
+
+
+@pytest.mark.unit
+def test_health_survives_llm_misconfiguration(monkeypatch):
+    """Startup stays up when the LLM provider cannot be built"""
+    pytest.importorskip("fm_core_lib")
+    from fastapi.testclient import TestClient
+
+    from agent_service.api.routes import agent
+    from agent_service.main import app
+
+    # Strict mode with a task provider that has no API key fails at construction
+    monkeypatch.setenv("STRICT_PROVIDER_MODE", "true")
+    monkeypatch.setenv("CHAT_PROVIDER", "openai")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    agent.get_llm_provider.cache_clear()
+
+    try:
+        with TestClient(app) as client:
+            assert app.state.llm_warm_up is None
+            assert client.get("/health").json()["status"] == "healthy"
+    finally:
+        agent.get_llm_provider.cache_clear()
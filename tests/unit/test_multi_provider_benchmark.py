@@ -0,0 +1,78 @@
+"""Micro-benchmarks for the multi-provider fallback path.
+
+Guards MultiProviderLLM.generate's per-call overhead (routing, breaker
+checks, logging) against regressions. Requires pytest-benchmark; in CI,
+compare against a saved baseline with:
+
+    pytest tests/unit/test_multi_provider_benchmark.py \
+        --benchmark-autosave --benchmark-compare --benchmark-compare-fail=median:25%
+"""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from agent_service.infrastructure.llm.base import LLMResponse
+from agent_service.infrastructure.llm.multi_provider import MultiProviderLLM
+
+# Returned by whichever mocked provider answers
+_RESPONSE = LLMResponse(
+    content="Mock response",
+    confidence=0.9,
+    provider="mock",
+    model="mock-model",
+    tokens_used=100,
+    response_time_ms=500
+)
+
+# Timed calls per benchmark, after WARMUP_ROUNDS untimed ones
+ROUNDS = 2000
+WARMUP_ROUNDS = 100
+
+
+class TestFallbackBenchmark:
+    """Benchmark generate() with mocked providers."""
+
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        """Two-provider chain whose circuit breakers never open during a run."""
+        for name in list(os.environ):
+            if name.endswith("_API_KEY"):
+                monkeypatch.delenv(name)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setenv("LLM_BREAKER_FAILURES", "1000000000")
+        return MultiProviderLLM()
+
+    @pytest.fixture
+    def run(self, benchmark, provider):
+        """Time generate() rounds on one event loop, so loop setup stays out of the numbers."""
+        loop = asyncio.new_event_loop()
+
+        def _run():
+            return benchmark.pedantic(
+                loop.run_until_complete,
+                setup=lambda: ((provider.generate("Test prompt"),), {}),
+                rounds=ROUNDS,
+                warmup_rounds=WARMUP_ROUNDS,
+            )
+
+        yield _run
+        loop.close()
+
+    def test_bench_first_provider_success(self, run, provider):
+        """First provider answers: the no-fallback fast path."""
+        provider.providers[0].generate = AsyncMock(return_value=_RESPONSE)
+
+        assert run() == "Mock response"
+
+    def test_bench_fallback_to_second_provider(self, run, provider):
+        """First provider fails on every call, second answers."""
+        provider.providers[0].generate = AsyncMock(side_effect=RuntimeError("API error"))
+        provider.providers[1].generate = AsyncMock(return_value=_RESPONSE)
+
+        assert run() == "Mock response"
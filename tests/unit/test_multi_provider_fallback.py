@@ -8,138 +8,354 @@ Tests that the fallback chain works correctly:
 
 import asyncio
 import os
+import re
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from contextlib import ExitStack, contextmanager
+from unittest.mock import AsyncMock, Mock
 
-from agent_service.infrastructure.llm.multi_provider import MultiProviderLLM
+from agent_service.infrastructure.llm import multi_provider
+from agent_service.infrastructure.llm.multi_provider import CircuitBreaker, MultiProviderLLM
 from agent_service.infrastructure.llm.base import LLMResponse
 
+# Canned successful responses, shared by every test (LLMResponse is frozen)
+MOCK_OPENAI = LLMResponse(
+    content="OpenAI response",
+    confidence=0.9,
+    provider="openai",
+    model="gpt-4o-mini",
+    tokens_used=100,
+    response_time_ms=500
+)
+MOCK_ANTHROPIC = LLMResponse(
+    content="Anthropic response",
+    confidence=0.95,
+    provider="anthropic",
+    model="claude-3-5-sonnet-20241022",
+    tokens_used=120,
+    response_time_ms=600
+)
+MOCK_FIREWORKS = LLMResponse(
+    content="Fireworks response",
+    confidence=0.85,
+    provider="fireworks",
+    model="llama-v3p1-70b-instruct",
+    tokens_used=150,
+    response_time_ms=400
+)
+_RESPONSES = {"openai": MOCK_OPENAI, "anthropic": MOCK_ANTHROPIC, "fireworks": MOCK_FIREWORKS}
+
+# Provider failure raised by mocked generate() calls
+_API_ERROR = RuntimeError("API error")
+
+# Expected MultiProviderLLM error messages, compiled once for pytest.raises
+_ALL_FAILED_RE = re.compile("All LLM providers failed")
+_CIRCUITS_OPEN_RE = re.compile("circuit breakers open")
+
+
+@contextmanager
+def _swap(obj, name, new):
+    """Temporarily set obj.name to new.
+
+    A lighter stand-in for patch.object: the tests only replace methods on
+    providers they just built, so no spec checks or patch registry are needed.
+    """
+    shadowed = name in vars(obj)
+    original = getattr(obj, name)
+    setattr(obj, name, new)
+    try:
+        yield new
+    finally:
+        if shadowed:
+            setattr(obj, name, original)
+        else:
+            # Drop the instance attribute so lookups reach the class again
+            delattr(obj, name)
+
+
+# Environment variable holding each provider's API key
+_API_KEY_ENV = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "fireworks": "FIREWORKS_API_KEY",
+}
+
 
 class TestMultiProviderFallback:
     """Test multi-provider fallback chain."""
 
-    @pytest.fixture
-    def mock_openai_success(self):
-        """Mock successful OpenAI response."""
-        mock_response = LLMResponse(
-            content="OpenAI response",
-            confidence=0.9,
-            provider="openai",
-            model="gpt-4o-mini",
-            tokens_used=100,
-            response_time_ms=500
-        )
-        return mock_response
+    @pytest.fixture(autouse=True)
+    def provider_env(self, request, monkeypatch):
+        """Expose only the API keys named by the test's env_keys marker."""
+        marker = request.node.get_closest_marker("env_keys")
+        if marker is None:
+            return
+        for name in list(os.environ):
+            if name.endswith("_API_KEY"):
+                monkeypatch.delenv(name)
+        for key in marker.args[0]:
+            monkeypatch.setenv(_API_KEY_ENV[key], "test-key")
 
     @pytest.fixture
-    def mock_anthropic_success(self):
-        """Mock successful Anthropic response."""
-        mock_response = LLMResponse(
-            content="Anthropic response",
-            confidence=0.95,
-            provider="anthropic",
-            model="claude-3-5-sonnet-20241022",
-            tokens_used=120,
-            response_time_ms=600
-        )
-        return mock_response
+    def provider(self, provider_env):
+        """MultiProviderLLM built from the test's environment."""
+        return MultiProviderLLM()
 
-    @pytest.fixture
-    def mock_fireworks_success(self):
-        """Mock successful Fireworks response."""
-        mock_response = LLMResponse(
-            content="Fireworks response",
-            confidence=0.85,
-            provider="fireworks",
-            model="llama-v3p1-70b-instruct",
-            tokens_used=150,
-            response_time_ms=400
-        )
-        return mock_response
-
-    @pytest.mark.asyncio
-    async def test_openai_success_no_fallback(self, mock_openai_success):
-        """Test that OpenAI success doesn't trigger fallback."""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
-            provider = MultiProviderLLM()
-
-            # Mock OpenAI provider to succeed
-            with patch.object(
-                provider.providers[0], 'generate',
-                return_value=mock_openai_success
-            ):
-                result = await provider.generate("Test prompt")
-
-                assert result == "OpenAI response"
-                print("✅ OpenAI success - no fallback triggered")
-
-    @pytest.mark.asyncio
-    async def test_openai_failure_anthropic_fallback(
-        self, mock_anthropic_success
-    ):
-        """Test fallback to Anthropic when OpenAI fails."""
-        with patch.dict(os.environ, {
-            "OPENAI_API_KEY": "test-key",
-            "ANTHROPIC_API_KEY": "test-key"
-        }):
-            provider = MultiProviderLLM()
-
-            # Mock OpenAI to fail, Anthropic to succeed
-            with patch.object(
-                provider.providers[0], 'generate',
-                side_effect=Exception("OpenAI API error")
-            ):
-                with patch.object(
-                    provider.providers[1], 'generate',
-                    return_value=mock_anthropic_success
-                ):
-                    result = await provider.generate("Test prompt")
-
-                    assert result == "Anthropic response"
-                    print("✅ OpenAI failed → Anthropic fallback successful")
-
-    @pytest.mark.asyncio
-    async def test_all_providers_fail(self):
-        """Test that error is raised when all providers fail."""
-        with patch.dict(os.environ, {
-            "OPENAI_API_KEY": "test-key",
-            "ANTHROPIC_API_KEY": "test-key",
-            "FIREWORKS_API_KEY": "test-key"
-        }):
-            provider = MultiProviderLLM()
-
-            # Mock all providers to fail
-            for p in provider.providers:
-                with patch.object(p, 'generate', side_effect=Exception("API error")):
-                    pass
-
-            with pytest.raises(RuntimeError, match="All LLM providers failed"):
+    @pytest.mark.env_keys({"openai", "anthropic", "fireworks"})
+    @pytest.mark.parametrize("fail_mask, expected", [
+        ((False, False, False), "OpenAI response"),
+        ((True, False, False), "Anthropic response"),
+        ((True, True, True), RuntimeError),
+    ], ids=["openai_success", "anthropic_fallback", "all_fail"])
+    async def test_fallback_chain(self, provider, fail_mask, expected):
+        """Test that providers are tried in order until one succeeds."""
+        with ExitStack() as stack:
+            mocks = []
+            for p, name, fails in zip(provider.providers, provider.provider_names, fail_mask):
+                outcome = (
+                    {"side_effect": _API_ERROR} if fails
+                    else {"return_value": _RESPONSES[name]}
+                )
+                mocks.append(stack.enter_context(_swap(p, 'generate', AsyncMock(**outcome))))
+
+            if expected is RuntimeError:
+                with pytest.raises(RuntimeError, match=_ALL_FAILED_RE):
+                    await provider.generate("Test prompt")
+            else:
+                assert await provider.generate("Test prompt") == expected
+
+        # Every provider up to the first success is tried once, none after it
+        tried = fail_mask.index(False) + 1 if False in fail_mask else len(fail_mask)
+        assert [mock.await_count for mock in mocks] == [1] * tried + [0] * (len(mocks) - tried)
+
+    @pytest.mark.env_keys({"openai"})
+    async def test_deterministic_response_cached(self, provider):
+        """Test that temperature=0 requests are served from cache on repeat."""
+        mock_generate = AsyncMock(return_value=MOCK_OPENAI)
+        with _swap(provider.providers[0], 'generate', mock_generate):
+            first = await provider.generate("Test prompt", temperature=0)
+            second = await provider.generate("Test prompt", temperature=0)
+
+            assert first == second == "OpenAI response"
+            assert mock_generate.call_count == 1
+            assert provider.get_status()["cache"]["hits"] == 1
+
+    @pytest.mark.env_keys({"openai"})
+    async def test_sampled_response_not_cached(self, provider):
+        """Test that requests above temperature 0 always reach the provider."""
+        mock_generate = AsyncMock(return_value=MOCK_OPENAI)
+        with _swap(provider.providers[0], 'generate', mock_generate):
+            await provider.generate("Test prompt", temperature=0.2)
+            await provider.generate("Test prompt", temperature=0.2)
+
+            assert mock_generate.call_count == 2
+
+    @pytest.mark.env_keys({"openai"})
+    async def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test that the in-process cache drops its oldest entry at LLM_CACHE_SIZE."""
+        monkeypatch.setenv("LLM_CACHE_SIZE", "1")
+        provider = MultiProviderLLM()
+
+        mock_generate = AsyncMock(return_value=MOCK_OPENAI)
+        with _swap(provider.providers[0], 'generate', mock_generate):
+            for prompt in ("first", "second", "first"):
+                await provider.generate(prompt, temperature=0)
+
+            assert mock_generate.call_count == 3
+            assert provider.get_status()["cache"]["size"] == 1
+
+    @pytest.mark.env_keys({"openai"})
+    async def test_cache_disabled_with_zero_size(self, monkeypatch):
+        """Test that LLM_CACHE_SIZE=0 turns deterministic response caching off."""
+        monkeypatch.setenv("LLM_CACHE_SIZE", "0")
+        provider = MultiProviderLLM()
+
+        mock_generate = AsyncMock(return_value=MOCK_OPENAI)
+        with _swap(provider.providers[0], 'generate', mock_generate):
+            await provider.generate("Test prompt", temperature=0)
+            await provider.generate("Test prompt", temperature=0)
+
+            assert mock_generate.call_count == 2
+            assert provider.get_status()["cache"]["misses"] == 0
+
+    @pytest.mark.env_keys({"openai"})
+    async def test_circuit_breaker_skips_failing_provider(self, provider):
+        """Test that a provider is skipped once its circuit opens."""
+        mock_generate = AsyncMock(side_effect=_API_ERROR)
+        with _swap(provider.providers[0], 'generate', mock_generate):
+            for _ in range(3):
+                with pytest.raises(RuntimeError, match=_ALL_FAILED_RE):
+                    await provider.generate("Test prompt")
+
+            with pytest.raises(RuntimeError, match=_CIRCUITS_OPEN_RE):
                 await provider.generate("Test prompt")
 
-            print("✅ All providers fail → Exception raised correctly")
+            assert mock_generate.call_count == 3
+            assert provider.get_status()["providers"][0]["circuit"] == "open"
 
-    def test_no_providers_configured(self):
-        """Test that error is raised when no providers configured."""
-        with patch.dict(os.environ, {}, clear=True):
-            provider = MultiProviderLLM()
+    @pytest.mark.env_keys({"openai"})
+    async def test_circuit_breaker_threshold_from_env(self, monkeypatch):
+        """Test that an open circuit is skipped without awaiting the provider."""
+        monkeypatch.setenv("LLM_BREAKER_FAILURES", "1")
+        provider = MultiProviderLLM()
 
-            assert len(provider.providers) == 0
-            print("✅ No providers configured → warning logged")
+        mock_generate = AsyncMock(side_effect=_API_ERROR)
+        with _swap(provider.providers[0], 'generate', mock_generate):
+            with pytest.raises(RuntimeError, match=_ALL_FAILED_RE):
+                await provider.generate("Test prompt")
 
-    @pytest.mark.asyncio
-    async def test_provider_status(self):
-        """Test get_status() method."""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
-            provider = MultiProviderLLM()
+            with pytest.raises(RuntimeError, match=_CIRCUITS_OPEN_RE):
+                await provider.generate("Test prompt")
+
+            assert mock_generate.await_count == 1
+
+    @pytest.mark.env_keys({"openai", "anthropic"})
+    async def test_hedged_generate_returns_fastest(self, provider):
+        """Test that hedging returns the first provider to answer."""
+        async def slow_generate(**kwargs):
+            await asyncio.sleep(10)
 
-            status = provider.get_status()
+        with _swap(provider.providers[0], 'generate', AsyncMock(side_effect=slow_generate)):
+            with _swap(provider.providers[1], 'generate', AsyncMock(return_value=MOCK_ANTHROPIC)):
+                result = await asyncio.wait_for(
+                    provider.generate("Test prompt", hedge=2), timeout=2
+                )
+
+                assert result == "Anthropic response"
+
+    @pytest.mark.env_keys({"openai", "anthropic"})
+    async def test_configured_hedge_applies_by_default(self, monkeypatch):
+        """Test that LLM_HEDGE races providers without a per-call hedge argument."""
+        monkeypatch.setenv("LLM_HEDGE", "2")
+        provider = MultiProviderLLM()
+
+        async def slow_generate(**kwargs):
+            await asyncio.sleep(10)
+
+        with _swap(provider.providers[0], 'generate', AsyncMock(side_effect=slow_generate)):
+            with _swap(provider.providers[1], 'generate', AsyncMock(return_value=MOCK_ANTHROPIC)):
+                result = await asyncio.wait_for(provider.generate("Test prompt"), timeout=2)
+
+                assert result == "Anthropic response"
+
+    @pytest.mark.env_keys({"openai", "anthropic", "fireworks"})
+    async def test_failed_hedge_continues_chain(self, provider, monkeypatch):
+        """Test that the chain continues after the hedge and counts the hedged providers."""
+        log = Mock()
+        monkeypatch.setattr(multi_provider, "logger", log)
+
+        with ExitStack() as stack:
+            for p in provider.providers[:2]:
+                stack.enter_context(_swap(p, 'generate', AsyncMock(side_effect=_API_ERROR)))
+            last = stack.enter_context(
+                _swap(provider.providers[2], 'generate', AsyncMock(return_value=MOCK_FIREWORKS))
+            )
+
+            assert await provider.generate("Test prompt", hedge=2) == "Fireworks response"
+            log.info.assert_any_call("🔄 Trying provider %d/%d: %s", 3, 3, "fireworks")
+
+            last.side_effect = _API_ERROR
+            with pytest.raises(RuntimeError, match=_ALL_FAILED_RE):
+                await provider.generate("Test prompt", hedge=2)
+            log.error.assert_called_once_with("💥 All %d provider(s) failed", 3)
+
+    @pytest.mark.env_keys({"openai", "anthropic"})
+    async def test_adaptive_routing_demotes_failing_provider(self, monkeypatch):
+        """Test that adaptive routing moves a failing provider behind a healthy one."""
+        monkeypatch.setenv("LLM_ROUTING_STRATEGY", "adaptive")
+        provider = MultiProviderLLM()
+
+        failing = AsyncMock(side_effect=_API_ERROR)
+        with _swap(provider.providers[0], 'generate', failing):
+            with _swap(provider.providers[1], 'generate', AsyncMock(return_value=MOCK_ANTHROPIC)):
+                assert await provider.generate("first") == "Anthropic response"
+                assert [name for name, _ in provider._fallback_order()] == ["anthropic", "openai"]
+
+                assert await provider.generate("second") == "Anthropic response"
+                assert failing.await_count == 1
+
+    @pytest.mark.env_keys({"openai"})
+    async def test_routing_latency_measured_per_call(self, provider):
+        """Test that routing uses the call's own timing, not the provider-reported one."""
+        # MOCK_OPENAI claims 500ms; the mocked call returns immediately
+        with _swap(provider.providers[0], 'generate', AsyncMock(return_value=MOCK_OPENAI)):
+            await provider.generate("Test prompt")
+
+        assert provider._latency_ewma["openai"] < MOCK_OPENAI.response_time_ms
+
+    @pytest.mark.env_keys({"openai"})
+    async def test_rate_limit_waits_instead_of_failing(self, monkeypatch):
+        """Test that a provider's RPM bucket delays calls beyond its burst."""
+        monkeypatch.setenv("OPENAI_RPM", "600")
+        provider = MultiProviderLLM()
+        provider._rpm_buckets["openai"].tokens = 1
+
+        with _swap(provider.providers[0], 'generate', AsyncMock(return_value=MOCK_OPENAI)):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await provider.generate("first")
+            await provider.generate("second")
+            elapsed = loop.time() - start
+
+            # 600 RPM refills one request every 0.1s
+            assert elapsed >= 0.09
+
+    @pytest.mark.env_keys({"openai", "anthropic"})
+    async def test_stream_falls_back_before_first_chunk(self, provider):
+        """Test that a stream failing before any output falls back to the next provider."""
+        async def failing_stream(**kwargs):
+            raise Exception("Connection refused")
+            yield
+
+        async def working_stream(**kwargs):
+            for chunk in ("Anthropic", " response"):
+                yield chunk
+
+        with _swap(provider.providers[0], 'generate_stream', failing_stream):
+            with _swap(provider.providers[1], 'generate_stream', working_stream):
+                chunks = [chunk async for chunk in provider.generate_stream("Test prompt")]
+
+                assert chunks == ["Anthropic", " response"]
+
+    @pytest.mark.env_keys({"openai"})
+    async def test_stream_applies_input_budget(self, monkeypatch):
+        """Test that streamed prompts are trimmed to <PREFIX>_MAX_INPUT_TOKENS."""
+        monkeypatch.setenv("OPENAI_MAX_INPUT_TOKENS", "5")
+        provider = MultiProviderLLM()
+        sent = []
+
+        async def recording_stream(prompt, **kwargs):
+            sent.append(prompt)
+            yield "ok"
+
+        with _swap(provider.providers[0], 'generate_stream', recording_stream):
+            chunks = [
+                chunk async for chunk in provider.generate_stream("old context\n\n" + "y" * 30)
+            ]
+
+        assert chunks == ["ok"]
+        assert sent == ["y" * 20]
+
+    @pytest.mark.env_keys(set())
+    def test_no_providers_configured(self, provider):
+        """Test that error is raised when no providers configured."""
+        assert len(provider.providers) == 0
+
+    @pytest.mark.env_keys({"openai"})
+    async def test_provider_status(self, provider):
+        """Test get_status() method."""
+        status = provider.get_status()
 
-            assert "providers_configured" in status
-            assert status["providers_configured"] >= 0
-            assert "fallback_chain" in status
-            assert "providers" in status
+        assert "providers_configured" in status
+        assert status["providers_configured"] >= 0
+        assert "fallback_chain" in status
+        assert "providers" in status
 
-            print(f"✅ Provider status: {status}")
+        # Configuration is built once; circuit state is still read per call
+        provider._breakers["openai"].state = CircuitBreaker.OPEN
+        warm = provider.get_status()
+        assert warm["providers"][0]["models"] is status["providers"][0]["models"]
+        assert warm["providers"][0]["circuit"] == CircuitBreaker.OPEN
+        assert status["providers"][0]["circuit"] == CircuitBreaker.CLOSED
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+"""Unit tests for input token budget trimming
+
+Prompts over a provider's max_input_tokens lose their oldest blank-line
+separated sections first; a single section that is still too long keeps
+only its tail.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from agent_service.infrastructure.llm.base import BaseLLMProvider, LLMResponse, ProviderConfig
+from agent_service.infrastructure.llm.multi_provider import MultiProviderLLM
+from agent_service.infrastructure.llm.openai_provider import OpenAIProvider
+
+_RESPONSE = LLMResponse(
+    content="ok",
+    confidence=0.9,
+    provider="openai",
+    model="gpt-4o-mini",
+    tokens_used=1,
+    response_time_ms=1
+)
+
+
+@pytest.mark.unit
+def test_prompt_within_budget_unchanged():
+    """A prompt that fits is returned as-is"""
+    prompt = "first\n\nsecond"
+    assert BaseLLMProvider._trim_prompt(prompt, 100) is prompt
+
+
+@pytest.mark.unit
+def test_oldest_sections_dropped_whole():
+    """Leading sections are dropped until the most recent ones fit"""
+    prompt = "\n\n".join(("a" * 10, "b" * 10, "c" * 10))
+
+    # 6 tokens ~ 24 chars: room for the last two sections and their separator
+    assert BaseLLMProvider._trim_prompt(prompt, 6) == "b" * 10 + "\n\n" + "c" * 10
+
+
+@pytest.mark.unit
+def test_oversized_section_cut_to_tail():
+    """A single section larger than the budget keeps its most recent text"""
+    prompt = "x" * 10 + "y" * 30
+
+    assert BaseLLMProvider._trim_prompt(prompt, 5) == "y" * 20
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_trimmed_applies_budget():
+    """generate_trimmed() sends the trimmed prompt to generate()"""
+    provider = OpenAIProvider(ProviderConfig(
+        name="openai",
+        api_key="test-key",
+        base_url="https://api.openai.com/v1",
+        models=["gpt-4o-mini"],
+        max_input_tokens=5,
+    ))
+    provider.generate = AsyncMock(return_value=_RESPONSE)
+
+    await provider.generate_trimmed(prompt="old context\n\n" + "y" * 30, max_tokens=10)
+
+    provider.generate.assert_awaited_once_with(prompt="y" * 20, max_tokens=10)
+
+
+@pytest.mark.unit
+def test_max_input_tokens_read_from_env(monkeypatch):
+    """<PREFIX>_MAX_INPUT_TOKENS sets the provider's input token budget"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_MAX_INPUT_TOKENS", "2048")
+
+    llm = MultiProviderLLM()
+
+    assert llm.provider_map["openai"].config.max_input_tokens == 2048
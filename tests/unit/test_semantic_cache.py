@@ -0,0 +1,122 @@
+"""Unit tests for SemanticCache
+
+The embedding model and faiss index are replaced with small in-memory stubs
+so hit/miss, scoping and eviction run without the optional dependencies.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from agent_service.infrastructure.llm import semantic_cache
+from agent_service.infrastructure.llm.semantic_cache import SemanticCache
+
+# Unit vectors: the rephrasing scores 0.96 against the original, the
+# unrelated prompt 0.0
+_VECTORS = {
+    "capital of France": (1.0, 0.0),
+    "France's capital": (0.96, 0.28),
+    "unrelated": (0.0, 1.0),
+}
+
+
+class _FakeIndex:
+    """Inner-product index over a dict, standing in for faiss.IndexIDMap"""
+
+    def __init__(self):
+        self.vectors = {}
+
+    def add_with_ids(self, embedding, ids):
+        for vector, entry_id in zip(embedding, ids):
+            self.vectors[entry_id] = vector
+
+    def search(self, embedding, k):
+        query = embedding[0]
+        ranked = sorted(
+            ((sum(a * b for a, b in zip(query, vector)), entry_id)
+             for entry_id, vector in self.vectors.items()),
+            reverse=True,
+        )[:k]
+        return [[score for score, _ in ranked]], [[entry_id for _, entry_id in ranked]]
+
+    def remove_ids(self, ids):
+        for entry_id in ids:
+            self.vectors.pop(entry_id, None)
+
+
+@pytest.fixture
+def make_cache(monkeypatch):
+    """Build a SemanticCache backed by the stub index and embeddings."""
+    monkeypatch.setattr(
+        semantic_cache, "np", SimpleNamespace(array=lambda values, dtype=None: list(values)),
+        raising=False,
+    )
+
+    def _make(**kwargs):
+        cache = SemanticCache(**kwargs)
+        cache.available = True
+        cache._index = _FakeIndex()
+
+        async def embed(prompt):
+            return [_VECTORS[prompt]]
+
+        cache._embed = embed
+        return cache
+
+    return _make
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rephrased_prompt_hits(make_cache):
+    """A prompt above the similarity threshold returns the stored response"""
+    cache = make_cache(threshold=0.92)
+    await cache.put("capital of France", "ctx", "Paris")
+
+    assert await cache.get("France's capital", "ctx") == "Paris"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_below_threshold_misses(make_cache):
+    """Dissimilar prompts, or a stricter threshold, miss"""
+    cache = make_cache(threshold=0.99)
+    await cache.put("capital of France", "ctx", "Paris")
+
+    assert await cache.get("France's capital", "ctx") is None
+    assert await cache.get("unrelated", "ctx") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_context_mismatch_misses(make_cache):
+    """A hit is only returned for the same request scope"""
+    cache = make_cache()
+    await cache.put("capital of France", "gpt-4o|chat", "Paris")
+
+    assert await cache.get("capital of France", "gpt-4o|synthesis") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_expired_entry_evicted(make_cache):
+    """Entries past their TTL are dropped on the next lookup"""
+    cache = make_cache(ttl_seconds=0)
+    await cache.put("capital of France", "ctx", "Paris")
+
+    assert await cache.get("capital of France", "ctx") is None
+    assert not cache._entries
+    assert not cache._index.vectors
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_capacity_evicts_oldest(make_cache):
+    """At max_entries the entry closest to expiry makes room for the new one"""
+    cache = make_cache(max_entries=1)
+    await cache.put("capital of France", "ctx", "Paris")
+    await cache.put("unrelated", "ctx", "Something else")
+
+    assert len(cache._entries) == 1
+    assert await cache.get("capital of France", "ctx") is None
+    assert await cache.get("unrelated", "ctx") == "Something else"